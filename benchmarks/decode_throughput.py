@@ -0,0 +1,117 @@
+# Python SCALE Codec Library
+#
+# Copyright 2018-2020 Stichting Polkascan (Polkascan Foundation).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+#  decode_throughput.py
+#
+#  Measures decoded payloads per second for several storage types and decode methods
+#
+#  Usage: PYTHONPATH=. python benchmarks/decode_throughput.py [--count 5000]
+#
+
+import argparse
+import time
+
+from scalecodec.base import RuntimeConfigurationObject, ScaleBytes
+from scalecodec.type_registry import load_type_registry_preset
+
+ACCOUNT_ID = '0x' + 'd4' * 32
+
+BENCHMARK_CASES = (
+    ('Balance', 123456789 * 10 ** 12),
+    ('AccountInfo', {
+        'nonce': 5, 'consumers': 1, 'providers': 1, 'sufficients': 0,
+        'data': {'free': 10 ** 15, 'reserved': 0, 'misc_frozen': 10 ** 12, 'fee_frozen': 10 ** 12}
+    }),
+    ('Exposure', {
+        'total': 10 ** 16, 'own': 10 ** 15,
+        'others': [{'who': ACCOUNT_ID, 'value': 10 ** 14}] * 16
+    }),
+    ('Vec<u32>', list(range(100))),
+)
+
+
+def create_runtime_config() -> RuntimeConfigurationObject:
+    runtime_config = RuntimeConfigurationObject()
+    runtime_config.update_type_registry(load_type_registry_preset("legacy"))
+    return runtime_config
+
+
+def decode_create_scale_object(runtime_config, type_string, payloads):
+    return [runtime_config.create_scale_object(type_string, ScaleBytes(payload)).decode() for payload in payloads]
+
+
+def decode_values_only(runtime_config, type_string, payloads):
+    return [
+        runtime_config.create_scale_object(type_string, ScaleBytes(payload)).decode(values_only=True)
+        for payload in payloads
+    ]
+
+
+def decode_many_objects(runtime_config, type_string, payloads):
+    runtime_config.use_decode_plans = False
+    try:
+        return runtime_config.decode_many(type_string, payloads)
+    finally:
+        runtime_config.use_decode_plans = True
+
+
+def decode_many(runtime_config, type_string, payloads):
+    return runtime_config.decode_many(type_string, payloads)
+
+
+def decode_value(runtime_config, type_string, payloads):
+    return [runtime_config.decode_value(type_string, ScaleBytes(payload)) for payload in payloads]
+
+
+DECODE_METHODS = {
+    'create_scale_object': decode_create_scale_object,
+    'decode(values_only)': decode_values_only,
+    'decode_many (objects)': decode_many_objects,
+    'decode_many': decode_many,
+    'decode_value': decode_value,
+}
+
+
+def run(count: int):
+    runtime_config = create_runtime_config()
+
+    print(f"{'type':<14} {'method':<22} {'payloads/s':>12}")
+
+    for type_string, value in BENCHMARK_CASES:
+        payload = runtime_config.create_scale_object(type_string).encode(value).to_hex()
+        payloads = [payload] * count
+
+        expected = None
+
+        for method_name, decode_method in DECODE_METHODS.items():
+            start = time.perf_counter()
+            values = decode_method(runtime_config, type_string, payloads)
+            duration = time.perf_counter() - start
+
+            # All methods must produce identical output
+            if expected is None:
+                expected = values
+            elif values != expected:
+                raise ValueError(f'Decode method "{method_name}" returned different values for "{type_string}"')
+
+            print(f"{type_string:<14} {method_name:<22} {count / duration:>12.0f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='SCALE decode throughput benchmark')
+    parser.add_argument('--count', type=int, default=5000, help='amount of payloads decoded per type and method')
+    args = parser.parse_args()
+    run(args.count)
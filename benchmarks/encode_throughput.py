@@ -0,0 +1,94 @@
+# Python SCALE Codec Library
+#
+# Copyright 2018-2020 Stichting Polkascan (Polkascan Foundation).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+#  encode_throughput.py
+#
+#  Measures encoded values per second for several types and encode methods
+#
+#  Usage: PYTHONPATH=. python benchmarks/encode_throughput.py [--count 5000]
+#
+
+import argparse
+import time
+
+from scalecodec.base import RuntimeConfigurationObject
+from scalecodec.type_registry import load_type_registry_preset
+
+ACCOUNT_ID = '0x' + 'd4' * 32
+
+BENCHMARK_CASES = (
+    ('Balance', 123456789 * 10 ** 12),
+    ('AccountInfo', {
+        'nonce': 5, 'consumers': 1, 'providers': 1, 'sufficients': 0,
+        'data': {'free': 10 ** 15, 'reserved': 0, 'misc_frozen': 10 ** 12, 'fee_frozen': 10 ** 12}
+    }),
+    ('Exposure', {
+        'total': 10 ** 16, 'own': 10 ** 15,
+        'others': [{'who': ACCOUNT_ID, 'value': 10 ** 14}] * 16
+    }),
+    ('Vec<u32>', list(range(100))),
+)
+
+
+def create_runtime_config() -> RuntimeConfigurationObject:
+    runtime_config = RuntimeConfigurationObject()
+    runtime_config.update_type_registry(load_type_registry_preset("legacy"))
+    return runtime_config
+
+
+def encode_create_scale_object(runtime_config, type_string, values):
+    return [runtime_config.create_scale_object(type_string).encode(value) for value in values]
+
+
+def encode_value(runtime_config, type_string, values):
+    return [runtime_config.encode_value(type_string, value) for value in values]
+
+
+ENCODE_METHODS = {
+    'create_scale_object': encode_create_scale_object,
+    'encode_value': encode_value,
+}
+
+
+def run(count: int):
+    runtime_config = create_runtime_config()
+
+    print(f"{'type':<14} {'method':<22} {'values/s':>12}")
+
+    for type_string, value in BENCHMARK_CASES:
+        values = [value] * count
+
+        expected = None
+
+        for method_name, encode_method in ENCODE_METHODS.items():
+            start = time.perf_counter()
+            encoded = encode_method(runtime_config, type_string, values)
+            duration = time.perf_counter() - start
+
+            # All methods must produce identical output
+            if expected is None:
+                expected = encoded
+            elif encoded != expected:
+                raise ValueError(f'Encode method "{method_name}" returned different data for "{type_string}"')
+
+            print(f"{type_string:<14} {method_name:<22} {count / duration:>12.0f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='SCALE encode throughput benchmark')
+    parser.add_argument('--count', type=int, default=5000, help='amount of values encoded per type and method')
+    args = parser.parse_args()
+    run(args.count)
@@ -0,0 +1,105 @@
+# Python SCALE Codec Library
+#
+# Copyright 2018-2020 Stichting Polkascan (Polkascan Foundation).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+#  memory_footprint.py
+#
+#  Measures the memory retained per decoded ScaleType object for several storage types, compared with the figures of
+#  the same measurement before ScaleType instances stored their attributes in slots
+#
+#  Usage: PYTHONPATH=. python benchmarks/memory_footprint.py [--count 2000]
+#
+
+import argparse
+import gc
+import tracemalloc
+
+from scalecodec.base import RuntimeConfigurationObject, ScaleBytes, ScaleDecoder
+from scalecodec.type_registry import load_type_registry_preset
+
+ACCOUNT_ID = '0x' + 'd4' * 32
+
+BENCHMARK_CASES = (
+    ('Balance', 123456789 * 10 ** 12),
+    ('AccountInfo', {
+        'nonce': 5, 'consumers': 1, 'providers': 1, 'sufficients': 0,
+        'data': {'free': 10 ** 15, 'reserved': 0, 'misc_frozen': 10 ** 12, 'fee_frozen': 10 ** 12}
+    }),
+    ('Exposure', {
+        'total': 10 ** 16, 'own': 10 ** 15,
+        'others': [{'who': ACCOUNT_ID, 'value': 10 ** 14}] * 16
+    }),
+    ('Vec<u32>', list(range(100))),
+)
+
+# Bytes per object of this benchmark with the default count on the release without instance attribute slots, where
+# every ScaleType object had an instance dict (CPython 3.11)
+BASELINE_BYTES_PER_OBJECT = {
+    'Balance': 423,
+    'AccountInfo': 316,
+    'Exposure': 1459,
+    'Vec<u32>': 272,
+}
+
+
+def create_runtime_config() -> RuntimeConfigurationObject:
+    runtime_config = RuntimeConfigurationObject()
+    runtime_config.update_type_registry(load_type_registry_preset("legacy"))
+    return runtime_config
+
+
+def count_scale_objects() -> int:
+    return len([obj for obj in gc.get_objects() if isinstance(obj, ScaleDecoder)])
+
+
+def run(count: int):
+    runtime_config = create_runtime_config()
+
+    print(f"{'type':<14} {'objects':>9} {'bytes/object before':>20} {'bytes/object after':>19} {'ratio':>6}")
+
+    for type_string, value in BENCHMARK_CASES:
+        payload = runtime_config.create_scale_object(type_string).encode(value).to_hex()
+
+        # Compile plans and build decoder classes before measuring
+        runtime_config.create_scale_object(type_string, ScaleBytes(payload)).decode()
+
+        gc.collect()
+        object_count = count_scale_objects()
+
+        tracemalloc.start()
+        objects = [runtime_config.create_scale_object(type_string, ScaleBytes(payload)) for _ in range(count)]
+        for obj in objects:
+            obj.decode()
+        retained_size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        object_count = count_scale_objects() - object_count
+
+        bytes_per_object = retained_size / object_count
+        baseline_bytes_per_object = BASELINE_BYTES_PER_OBJECT[type_string]
+
+        print(
+            f"{type_string:<14} {object_count:>9} {baseline_bytes_per_object:>20} {bytes_per_object:>19.0f} "
+            f"{bytes_per_object / baseline_bytes_per_object:>6.2f}"
+        )
+
+        del objects
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='SCALE decoded object memory benchmark')
+    parser.add_argument('--count', type=int, default=2000, help='amount of payloads decoded per type')
+    args = parser.parse_args()
+    run(args.count)
@@ -0,0 +1,101 @@
+# Python SCALE Codec Library
+#
+# Copyright 2018-2020 Stichting Polkascan (Polkascan Foundation).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+#  metadata_snapshot.py
+#
+#  Measures the time to build a runtime configuration from the V14 metadata fixture, by decoding the metadata versus
+#  applying the portable registry snapshot in a metadata snapshot cache. Types of a snapshot are only decoded on first
+#  lookup, so the time to look up all portable types afterwards is measured as well.
+#
+#  Usage: PYTHONPATH=. python benchmarks/metadata_snapshot.py [--rounds 10]
+#
+
+import argparse
+import gc
+import os
+import tempfile
+import time
+
+from scalecodec.base import RuntimeConfigurationObject, ScaleBytes
+from scalecodec.snapshot import MetadataSnapshotCache
+from scalecodec.type_registry import load_type_registry_file
+
+METADATA_FIXTURE_PATH = os.path.join(os.path.dirname(__file__), '..', 'test', 'fixtures', 'metadata_hex.json')
+
+
+def build_decoded(metadata_hex: str, cache: MetadataSnapshotCache):
+    runtime_config = RuntimeConfigurationObject(shared_presets=('core',))
+    metadata_obj = runtime_config.create_scale_object('MetadataVersioned', data=ScaleBytes(metadata_hex))
+    metadata_obj.decode()
+    runtime_config.add_portable_registry(metadata_obj)
+    return runtime_config
+
+
+def build_snapshot(metadata_hex: str, cache: MetadataSnapshotCache):
+    runtime_config = RuntimeConfigurationObject(shared_presets=('core',))
+    cache.add_portable_registry(runtime_config, metadata_hex, 1)
+    return runtime_config
+
+
+BUILD_METHODS = {
+    'decode metadata': build_decoded,
+    'load snapshot': build_snapshot,
+}
+
+
+def run(rounds: int):
+    metadata_hex = load_type_registry_file(METADATA_FIXTURE_PATH)['V14']
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = MetadataSnapshotCache(cache_dir)
+
+        # Write the snapshot and build the shared type registry layer before measuring
+        build_snapshot(metadata_hex, cache)
+        type_strings = [
+            type_string for type_string in build_snapshot(metadata_hex, cache).lazy_scale_info_types
+            if type_string.startswith('scale_info::')
+        ]
+
+        print(f"{'method':<18} {'ms/build':>10} {'ms/lookup all':>14}")
+
+        for method_name, build_method in BUILD_METHODS.items():
+            build_duration = 0
+            lookup_duration = 0
+
+            for _ in range(rounds):
+                # Configurations of previous rounds are cyclic garbage, collect it outside of the measurement like on
+                # a process start
+                gc.collect()
+
+                start = time.perf_counter()
+                runtime_config = build_method(metadata_hex, cache)
+                build_duration += time.perf_counter() - start
+
+                start = time.perf_counter()
+                for type_string in type_strings:
+                    runtime_config.get_decoder_class(type_string)
+                lookup_duration += time.perf_counter() - start
+
+            print(
+                f"{method_name:<18} {build_duration / rounds * 1000:>10.1f} {lookup_duration / rounds * 1000:>14.1f}"
+            )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Metadata snapshot benchmark')
+    parser.add_argument('--rounds', type=int, default=10, help='amount of runtime configurations built per method')
+    args = parser.parse_args()
+    run(args.rounds)
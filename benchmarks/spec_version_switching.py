@@ -0,0 +1,88 @@
+# Python SCALE Codec Library
+#
+# Copyright 2018-2020 Stichting Polkascan (Polkascan Foundation).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+#  spec_version_switching.py
+#
+#  Replays the runtime upgrades of the Kusama type registry preset in random order, like a historical indexer that
+#  switches between spec versions, and measures switches per second including a decode after each switch
+#
+#  Usage: PYTHONPATH=. python benchmarks/spec_version_switching.py [--rounds 20]
+#
+
+import argparse
+import random
+import time
+
+from scalecodec.base import RuntimeConfigurationObject, ScaleBytes
+from scalecodec.type_registry import load_type_registry_preset
+
+DECODED_TYPES = ('AccountInfo', 'StakingLedger', 'DispatchInfo', 'ValidatorPrefs')
+
+PAYLOAD = '0x' + '00' * 256
+
+
+def create_runtime_config(preset: dict) -> RuntimeConfigurationObject:
+    runtime_config = RuntimeConfigurationObject()
+    runtime_config.update_type_registry(load_type_registry_preset("legacy"))
+    runtime_config.update_type_registry(preset)
+    return runtime_config
+
+
+def switch_cached(runtime_config, spec_version_id):
+    runtime_config.set_active_spec_version_id(spec_version_id)
+
+
+def switch_reapply(runtime_config, spec_version_id):
+    # Previous behaviour: apply the type definitions of all versioning items in range on every switch
+    runtime_config.active_spec_version_id = spec_version_id
+
+    for versioning_item in runtime_config.type_registry['versioning']:
+        if versioning_item['runtime_range'][0] <= spec_version_id and \
+                (not versioning_item['runtime_range'][1] or versioning_item['runtime_range'][1] >= spec_version_id):
+            runtime_config.update_type_registry_types(versioning_item['types'])
+
+
+SWITCH_METHODS = {
+    'reapply versioning': switch_reapply,
+    'set_active_spec_version_id': switch_cached,
+}
+
+
+def run(rounds: int):
+    preset = load_type_registry_preset("kusama")
+    spec_version_ids = [runtime_id for block_number, runtime_id in preset['runtime_upgrades']] * rounds
+    random.Random(0).shuffle(spec_version_ids)
+
+    print(f"{'method':<28} {'switches/s':>12}")
+
+    for method_name, switch_method in SWITCH_METHODS.items():
+        runtime_config = create_runtime_config(preset)
+
+        start = time.perf_counter()
+        for spec_version_id in spec_version_ids:
+            switch_method(runtime_config, spec_version_id)
+            for type_string in DECODED_TYPES:
+                runtime_config.decode_value(type_string, ScaleBytes(PAYLOAD), check_remaining=False)
+        duration = time.perf_counter() - start
+
+        print(f"{method_name:<28} {len(spec_version_ids) / duration:>12.0f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Spec version switching benchmark')
+    parser.add_argument('--rounds', type=int, default=20, help='amount of times all runtime upgrades are replayed')
+    args = parser.parse_args()
+    run(args.rounds)
@@ -14,17 +14,33 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import bisect
+import io
+import mmap
+import os
 import re
+import sys
 import warnings
-from abc import ABC, abstractmethod
+import weakref
+from abc import ABC, ABCMeta, abstractmethod
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
 from functools import lru_cache
-from typing import Optional, TYPE_CHECKING, Union
+from typing import Optional, TYPE_CHECKING, Union, Iterable, Callable
 
-from scalecodec.constants import TYPE_DECOMP_MAX_RECURSIVE
-from scalecodec.exceptions import RemainingScaleBytesNotEmptyException, InvalidScaleTypeValueException
+from scalecodec.constants import TYPE_DECOMP_MAX_RECURSIVE, TYPE_STRING_CACHE_SIZE, RUNTIME_CONFIGURATION_POOL_SIZE
+from scalecodec.exceptions import RemainingScaleBytesNotEmptyException, InvalidScaleTypeValueException, \
+    SelectorFieldNotFound
+from scalecodec.utils.type_parser import canonical_type_string, parse_type_string
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 if TYPE_CHECKING:
     from scalecodec.types import GenericMetadataVersioned, GenericRegistryType
+    from scalecodec.snapshot import MetadataSnapshotCache
 
 
 class Singleton(type):
@@ -42,19 +58,151 @@ class Singleton(type):
         return cls._instances[instance_key]
 
 
+class TypeRegistryLayer(dict):
+    """
+    Immutable layer of type definitions that can be shared between `RuntimeConfigurationObject` instances
+    """
+
+    def __readonly(self, *args, **kwargs):
+        raise TypeError('TypeRegistryLayer is immutable')
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = __readonly
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+
+class LazyScaleInfoType:
+    """
+    Placeholder for a `PortableType` of which the decoder class is only built on first lookup, see
+    `RuntimeConfigurationObject(lazy_portable_registry=True)`. Placeholders are kept apart from the type registry,
+    which only receives the decoder class once it is built.
+    """
+    __slots__ = (
+        'type_string', 'scale_info_type', 'prefix', 'path_string', 'shadowed', 'decoder_class', 'data', 'offset'
+    )
+
+    def __init__(self, type_string: str, scale_info_type: Optional['GenericRegistryType'], prefix: str,
+                 path_string: str = None, shadowed=None, data: bytearray = None, offset: int = None):
+        """
+        Parameters
+        ----------
+        type_string: e.g. 'scale_info::12'
+        scale_info_type: definition of the type in the portable registry, or None to decode the `PortableType` at
+            `offset` of `data` on first lookup
+        prefix: prefix of the portable registry, e.g. 'scale_info'
+        path_string: lowercase path of the type, e.g. 'sp_core::crypto::accountid32'
+        shadowed: previous type registry entry of the path of the type, e.g. the builtin `Option` for 'option'
+        data: SCALE encoded metadata that contains the `PortableType`
+        offset: offset of the `PortableType` in `data`
+        """
+        self.type_string = type_string
+        self.scale_info_type = scale_info_type
+        self.prefix = prefix
+        self.path_string = path_string
+        self.shadowed = shadowed
+        self.decoder_class = None
+        self.data = data
+        self.offset = offset
+
+
 class RuntimeConfigurationObject:
     """
     Container for runtime configuration, for example type definitions and runtime upgrade information
     """
 
+    # Parts of legacy type names that are removed or replaced, matched in a single pass
+    type_string_re = re.compile(
+        r'T::|\n|(?i:<T>|<T as (?:Trait|Config)(?:<I>)?>::)|(?i:(VecDeque)<(?!T>))'
+    )
+
+    type_string_module_prefixes = ('grandpa::', 'session::', 'slashing::', 'limits::', 'beefy_primitives::',
+                                   'xcm::opaque::')
+
+    special_type_strings = {
+        '()': 'Null',
+        'vec<u8>': 'Bytes',
+        '&[u8]': 'Bytes',
+        "& 'static[u8]": 'Bytes',
+        '<lookup as staticlookup>::source': 'LookupSource',
+        '<balance as hascompact>::type': 'Compact<Balance>',
+        '<blocknumber as hascompact>::type': 'Compact<BlockNumber>',
+        '<moment as hascompact>::type': 'Compact<Moment>',
+        '<inherentofflinereport as inherentofflinereport>::inherent': 'InherentOfflineReport'
+    }
+
+    # Generation of ScaleDecoder subclasses and layer of builtin types, see `get_builtin_type_registry_layer()`
+    builtin_type_registry_layer = (None, None)
+
+    # Shared type registry layers per tuple of preset names, see `get_shared_type_registry_layer()`
+    shared_type_registry_layers = {}
+
+    # Decoder classes created for shared type registry layers, see `get_decoder_class()`
+    shared_decoder_classes = set()
+
+    # Decoder classes created for type registry definitions by lowercase type string, which remain resolvable after
+    # `clear_type_registry()` like the builtin types
+    type_registry_classes = weakref.WeakValueDictionary()
+
     @classmethod
     def all_subclasses(cls, class_):
-        return set(class_.__subclasses__()).union(
-            [s for c in class_.__subclasses__() for s in cls.all_subclasses(c)])
+        subclasses = set()
+        unvisited = class_.__subclasses__()
+
+        while unvisited:
+            subclass = unvisited.pop()
+            if subclass not in subclasses:
+                subclasses.add(subclass)
+                unvisited.extend(subclass.__subclasses__())
 
-    def __init__(self, config_id=None, ss58_format=None, only_primitives_on_init=False, implements_scale_info=False):
+        return subclasses
+
+    def __init__(self, config_id=None, ss58_format=None, only_primitives_on_init=False, implements_scale_info=False,
+                 use_decode_plans=True, numpy_arrays=False, iterative_decoding=False, shared_presets=None,
+                 lazy_portable_registry=False):
+        """
+        Parameters
+        ----------
+        config_id: optional identifier of this configuration
+        ss58_format: SS58 format used to encode decoded account IDs
+        only_primitives_on_init: kept for backwards compatibility
+        implements_scale_info: if enabled, types are resolved with the SCALE-info portable registry
+        use_decode_plans: if enabled, values are decoded with compiled plans instead of ScaleType objects
+        numpy_arrays: if enabled, sequences of fixed-width elements (see `get_numpy_dtype()`) are decoded to a
+            `numpy.ndarray` instead of a list. Integers wider than 64 bits (u128, i128, u256, i256) have no NumPy
+            dtype, so e.g. `Vec<u128>` is still decoded to a list of ints while `Vec<u64>` becomes an ndarray.
+        iterative_decoding: if enabled, recursively nested types are decoded without Python recursion
+        shared_presets: names of type registry presets that are loaded once and shared between configurations
+        lazy_portable_registry: if enabled, SCALE-info types are only built when they are first used
+        """
         self.config_id = config_id
         self.type_registry = {'types': {}, 'runtime_api': {}}
+        self.decode_plans = {}
+        self.skip_plans = {}
+        self.projection_plans = {}
+        self.encode_plans = {}
+        self.iterative_plans = {}
+        self.decoder_classes = {}
+        self.decoder_class_cache_hits = 0
+        self.decoder_class_cache_misses = 0
+        self.versioned_type_names = set()
+        self.unversioned_types = None
+        self.versioned_types = {}
+        self.versioned_plans = {}
+        self.active_versioning_key = None
+        self.runtime_upgrades_index = None
+        self.use_decode_plans = use_decode_plans
+        self.iterative_decoding = iterative_decoding
+        self.numpy_arrays = numpy_arrays
+        self.lazy_portable_registry = lazy_portable_registry
+        self.lazy_scale_info_types = {}
+        self.building_scale_info_type = False
         self.__initial_state = False
         self.clear_type_registry()
         self.active_spec_version_id = None
@@ -63,45 +211,70 @@ class RuntimeConfigurationObject:
         self.only_primitives_on_init = only_primitives_on_init
         self.ss58_format = ss58_format
         self.implements_scale_info = implements_scale_info
-        self.arrow_match_re = re.compile(r'^([^<]*)<(.+)>$')
-        self.bracket_match_re = re.compile(r'^\[([A-Za-z0-9]+); ([0-9]+)\]$')
+
+        if shared_presets:
+            self.add_shared_type_registry_layer(shared_presets)
 
     @classmethod
-    @lru_cache(maxsize=128)
-    def convert_type_string(cls, name):
+    def normalize_type_string(cls, name: str) -> str:
+        """
+        Converts a legacy type name to the name used in the type registry, e.g. '<T as Trait>::Balance' to 'Balance'
+        and 'Vec<u8>' to 'Bytes'. Use `convert_type_string()` for the cached version.
+
+        Parameters
+        ----------
+        name
+
+        Returns
+        -------
+        str
+        """
+        name = cls.type_string_re.sub(lambda match: 'Vec<' if match.group(1) else '', name)
+
+        if name[:3].lower() == 't::':
+            name = name[3:]
+
+        if name.startswith(cls.type_string_module_prefixes):
+            name = name[len(next(prefix for prefix in cls.type_string_module_prefixes if name.startswith(prefix))):]
+
+        if len(name) > 5 and name[:4].lower() == 'box<' and name[-1] == '>':
+            name = name[4:-1]
+
+        return cls.special_type_strings.get(name.lower(), name)
 
-        name = re.sub(r'T::', "", name)
-        name = re.sub(r'^T::', "", name, flags=re.IGNORECASE)
-        name = re.sub(r'<T>', "", name, flags=re.IGNORECASE)
-        name = re.sub(r'<T as Trait>::', "", name, flags=re.IGNORECASE)
-        name = re.sub(r'<T as Trait<I>>::', "", name, flags=re.IGNORECASE)
-        name = re.sub(r'<T as Config>::', "", name, flags=re.IGNORECASE)
-        name = re.sub(r'<T as Config<I>>::', "", name, flags=re.IGNORECASE)
-        name = re.sub(r'\n', "", name)
-        name = re.sub(r'^(grandpa|session|slashing|limits|beefy_primitives|xcm::opaque)::', "", name)
-        name = re.sub(r'VecDeque<', "Vec<", name, flags=re.IGNORECASE)
-        name = re.sub(r'^Box<(.+)>$', r'\1', name, flags=re.IGNORECASE)
-
-        if name == '()':
-            return "Null"
-        if name.lower() in ['vec<u8>', '&[u8]', "& 'static[u8]"]:
-            return "Bytes"
-        if name.lower() == '<lookup as staticlookup>::source':
-            return 'LookupSource'
-        if name.lower() == '<balance as hascompact>::type':
-            return 'Compact<Balance>'
-        if name.lower() == '<blocknumber as hascompact>::type':
-            return 'Compact<BlockNumber>'
-        if name.lower() == '<moment as hascompact>::type':
-            return 'Compact<Moment>'
-        if name.lower() == '<inherentofflinereport as inherentofflinereport>::inherent':
-            return 'InherentOfflineReport'
-
-        return name
+    @classmethod
+    def set_type_string_cache_size(cls, maxsize: Optional[int]):
+        """
+        Sets the maximum amount of cached results of `convert_type_string()`, the cache is cleared in the process.
+
+        Parameters
+        ----------
+        maxsize: maximum amount of cached type strings, or None for an unbounded cache
+        """
+        RuntimeConfigurationObject.type_string_cache = staticmethod(
+            lru_cache(maxsize=maxsize)(RuntimeConfigurationObject.normalize_type_string)
+        )
+
+    @classmethod
+    def get_type_string_cache_info(cls):
+        """
+        Returns the statistics of the `convert_type_string()` cache
+
+        Returns
+        -------
+        named tuple with the amount of 'hits', 'misses', 'maxsize' and 'currsize' of the cache
+        """
+        return cls.type_string_cache.cache_info()
+
+    @classmethod
+    def convert_type_string(cls, name):
+        return cls.type_string_cache(name)
 
     def get_decoder_class(self, type_string: Union[str, dict]):
         """
-        Lookup and return a ScaleDecoder class for given `type_string`
+        Lookup and return a ScaleDecoder class for given `type_string`. Results are cached per normalised type
+        string, so dynamic classes like `Vec<u32>` are only created once until the type registry changes; the cache is
+        cleared together with the compiled plans.
 
         Parameters
         ----------
@@ -120,33 +293,72 @@ class RuntimeConfigurationObject:
             decoder_class.runtime_config = self
             return decoder_class
 
+        if type_string not in self.decoder_classes:
+            # Cache on the normalised type string, so e.g. 'Vec<u8>', 'Vec< u8 >' and 'Vec<T::u8>' share one entry
+            type_string = canonical_type_string(type_string)
+
+            if self.implements_scale_info is False:
+                type_string = self.convert_type_string(type_string)
+
+        if type_string in self.decoder_classes:
+            self.decoder_class_cache_hits += 1
+            decoder_class = self.decoder_classes[type_string]
+        else:
+            self.decoder_class_cache_misses += 1
+            decoder_class = self.lookup_decoder_class(type_string)
+
+            if decoder_class in self.shared_decoder_classes:
+                # Classes of a shared type registry layer are used by all configurations, a subclass resolves the
+                # types it refers to (also in class methods like `skip()`) through this configuration instead
+                decoder_class = type(decoder_class.__name__, (decoder_class,), {'__slots__': ()})
+
+            self.decoder_classes[type_string] = decoder_class
+
+        if decoder_class:
+            # Attach RuntimeConfigurationObject to class
+            decoder_class.runtime_config = self
+
+        return decoder_class
+
+    def lookup_decoder_class(self, type_string: str):
+        """
+        Lookup a ScaleDecoder class for given `type_string` in the type registry without using the decoder class
+        cache. Dynamic classes are created for e.g. `Vec<u32>`, `(u32, u64)` and `[u8; 4]`.
+
+        Parameters
+        ----------
+        type_string
+
+        Returns
+        -------
+        ScaleDecoder
+        """
         if type_string.strip() == '':
             return None
 
         if self.implements_scale_info is False:
             type_string = self.convert_type_string(type_string)
 
-        decoder_class = self.type_registry.get('types', {}).get(type_string.lower(), None)
+        decoder_class = self.get_type_registry_entry(type_string.lower())
 
         if not decoder_class:
 
-            # Type string containg subtype
-            if type_string[-1:] == '>':
-
-                # Extract sub types
-                type_parts = self.arrow_match_re.match(type_string)
+            try:
+                type_expression = parse_type_string(type_string)
+            except ValueError:
+                return None
 
-                if type_parts:
-                    type_parts = type_parts.groups()
-
-                if type_parts:
-                    # Create dynamic class for Part1<Part2> based on Part1 and set class variable Part2 as sub_type
-                    base_class = self.type_registry.get('types', {}).get(type_parts[0].lower(), None)
-                    if base_class:
-                        decoder_class = type(type_string, (base_class,), {'sub_type': type_parts[1]})
+            # Type string containg subtype
+            if type_expression.kind == 'generic':
+                # Create dynamic class for Part1<Part2> based on Part1 and set class variable Part2 as sub_type
+                base_class = self.get_type_registry_entry(type_expression.name.lower())
+                if base_class:
+                    decoder_class = type(type_string, (base_class,), {
+                        'sub_type': type_expression.params_string, '__slots__': ()
+                    })
 
             # Custom tuples
-            elif type_string != '()' and type_string[0] == '(' and type_string[-1] == ')':
+            elif type_expression.kind == 'tuple' and type_expression.params:
 
                 decoder_class = type(type_string, (self.get_decoder_class('tuple'),), {
                     'type_string': type_string
@@ -154,24 +366,89 @@ class RuntimeConfigurationObject:
 
                 decoder_class.build_type_mapping()
 
-            elif type_string[0] == '[' and type_string[-1] == ']':
-                type_parts = self.bracket_match_re.match(type_string)
+            elif type_expression.kind == 'array':
+                # Create dynamic class for e.g. [u8; 4] resulting in array of u8 with 4 elements
+                decoder_class = type(type_string, (self.get_decoder_class('FixedLengthArray'),), {
+                    'sub_type': type_expression.params[0].type_string,
+                    'element_count': type_expression.length
+                })
 
-                if type_parts:
-                    type_parts = type_parts.groups()
+        return decoder_class
 
-                if type_parts:
-                    # Create dynamic class for e.g. [u8; 4] resulting in array of u8 with 4 elements
-                    decoder_class = type(type_string, (self.get_decoder_class('FixedLengthArray'),), {
-                        'sub_type': type_parts[0],
-                        'element_count': int(type_parts[1])
-                    })
+    def get_type_registry_entry(self, key: str):
+        """
+        Returns the decoder class in the type registry for lowercase `key`, building it first when `key` refers to a
+        `LazyScaleInfoType` that is not built yet
 
-        if decoder_class:
-            # Attach RuntimeConfigurationObject to new class
-            decoder_class.runtime_config = self
+        Parameters
+        ----------
+        key
 
-        return decoder_class
+        Returns
+        -------
+        ScaleDecoder
+        """
+        lazy_type = self.lazy_scale_info_types.get(key)
+
+        if lazy_type is not None:
+            if self.building_scale_info_type and key != lazy_type.type_string:
+                # Base classes of a portable type are resolved in the type registry as it was before the portable
+                # registry was added, not in the path aliases of other portable types
+                return lazy_type.shadowed
+
+            return self.build_lazy_scale_info_type(lazy_type)
+
+        return self.type_registry.get('types', {}).get(key)
+
+    def build_lazy_scale_info_type(self, lazy_type: LazyScaleInfoType):
+        """
+        Builds the decoder class of given `LazyScaleInfoType` when not built yet and adds it to the type registry
+
+        Parameters
+        ----------
+        lazy_type
+
+        Returns
+        -------
+        ScaleDecoder
+        """
+        if lazy_type.decoder_class is None:
+            building_scale_info_type = self.building_scale_info_type
+            decoder_classes = self.decoder_classes
+
+            # Lookups while building resolve path aliases differently, so keep them out of the decoder class cache
+            self.building_scale_info_type = True
+            self.decoder_classes = {}
+
+            try:
+                if lazy_type.scale_info_type is None:
+                    data = ScaleBytes(lazy_type.data)
+                    data.offset = lazy_type.offset
+
+                    portable_type = self.create_scale_object('PortableType', data=data)
+                    portable_type.decode(check_remaining=False)
+
+                    lazy_type.scale_info_type = portable_type.value_object['type']
+                    lazy_type.data = None
+
+                decoder_class = self.get_decoder_class_for_scale_info_definition(
+                    lazy_type.type_string, lazy_type.scale_info_type, lazy_type.prefix
+                )
+            finally:
+                self.building_scale_info_type = building_scale_info_type
+                self.decoder_classes = decoder_classes
+
+            if decoder_class is None:
+                raise NotImplementedError(f"No decoding class found for scale type {lazy_type.type_string}")
+
+            lazy_type.decoder_class = decoder_class
+
+            self.type_registry['types'][lazy_type.type_string] = decoder_class
+
+            if lazy_type.path_string and self.lazy_scale_info_types.get(lazy_type.path_string) is lazy_type:
+                self.type_registry['types'][lazy_type.path_string] = decoder_class
+
+        return lazy_type.decoder_class
 
     def create_scale_object(self, type_string: str, data: Optional['ScaleBytes'] = None, **kwargs) -> 'ScaleType':
         """
@@ -191,521 +468,2189 @@ class RuntimeConfigurationObject:
         decoder_class = self.get_decoder_class(type_string)
 
         if decoder_class:
+            # Classes can be shared between configurations, so explicitly attach this configuration to the object
+            kwargs.setdefault('runtime_config', self)
             return decoder_class(data=data, **kwargs)
 
         raise NotImplementedError('Decoder class for "{}" not found'.format(type_string))
 
-    def clear_type_registry(self):
-
-        if not self.__initial_state:
-            self.type_registry = {'types': {}, 'runtime_api': {}}
-
-            # Class names that contains '<' are excluded because of a side effect that is introduced in
-            # get_decoder_class: "Create dynamic class for Part1<Part2> based on Part1 and set class variable Part2 as
-            # sub_type" which won't get reset because class definitions always remain globally
+    def decode_many(
+            self, type_string: str, payloads: Iterable[Union[str, bytes, bytearray, 'ScaleBytes']],
+            check_remaining: bool = True, selectors: list = None, **kwargs
+    ) -> list:
+        """
+        Decodes multiple SCALE encoded payloads of the same `type_string`, for example the results of a
+        `state_queryStorageAt` RPC call. The decoder class is resolved once for all payloads.
 
-            self.type_registry['types'].update(
-                {
-                    cls.__name__.lower(): cls for cls in self.all_subclasses(ScaleDecoder)
-                    if '<' not in cls.__name__ and '::' not in cls.__name__
-                }
-            )
+        Parameters
+        ----------
+        type_string: string representation of a `ScaleType`
+        payloads: iterable of hex-strings, bytes or ScaleBytes
+        check_remaining: If enabled, an exception will be raised when data is remaining after decoding a payload
+        selectors: list of dotted paths of the fields to decode, see `decode_value()`
+        kwargs: passed to each created `ScaleType`, e.g. `metadata`
 
-        self.__initial_state = True
+        Returns
+        -------
+        list of decoded values, in the order of `payloads`
+        """
+        values = []
 
-    def update_type_registry_types(self, types_dict):
-        from scalecodec.types import Enum, Struct, Set, Tuple
+        if self.use_decode_plans and set(kwargs.keys()) <= {'metadata'}:
+            decode_plan = self.get_projection_plan(type_string, selectors)
+            metadata = kwargs.get('metadata')
 
-        self.__initial_state = False
+            for payload in payloads:
+                if not isinstance(payload, ScaleBytes):
+                    payload = ScaleBytes(payload)
 
-        for type_string, decoder_class_data in types_dict.items():
+                values.append(decode_plan(payload, metadata))
+                self.check_decoded_data(type_string, payload, check_remaining)
 
-            if type(decoder_class_data) == dict:
+            return values
 
-                # Create dynamic decoder class
-                base_cls = None
+        decoder_class = self.get_decoder_class(type_string)
 
-                if decoder_class_data.get('base_class'):
-                    base_cls = self.get_decoder_class(decoder_class_data['base_class'])
-                    if base_cls is None:
-                        raise ValueError(f"Specified base_class '{decoder_class_data['base_class']}' for type " +
-                                         f"'{type_string}' not found")
+        if decoder_class is None:
+            raise NotImplementedError('Decoder class for "{}" not found'.format(type_string))
 
-                if decoder_class_data['type'] == 'struct':
+        for payload in payloads:
+            if not isinstance(payload, ScaleBytes):
+                payload = ScaleBytes(payload)
 
-                    if base_cls is None:
-                        base_cls = Struct
+            values.append(decoder_class(data=payload, **kwargs).decode(check_remaining=check_remaining))
 
-                    decoder_class = type(type_string, (base_cls,), {
-                        'type_mapping': decoder_class_data.get('type_mapping')
-                    })
+        if selectors is not None:
+            selector_tree = self.build_selector_tree(selectors)
+            values = [ScaleType.project_value(value, selector_tree) for value in values]
 
-                elif decoder_class_data['type'] == 'tuple':
+        return values
 
-                    if base_cls is None:
-                        base_cls = Tuple
+    def decode_value(
+            self, type_string: str, data: 'ScaleBytes', metadata=None, check_remaining: bool = True,
+            selectors: list = None
+    ):
+        """
+        Decodes `data` as `type_string` and returns the same value as `ScaleType.decode()` would.
 
-                    decoder_class = type(type_string, (base_cls,), {
-                        'type_mapping': decoder_class_data.get('type_mapping')
-                    })
+        Unless `use_decode_plans` is disabled, the compiled decode plan of `type_string` is used, so no ScaleType
+        objects are created for the decoded value and its nested fields.
 
-                elif decoder_class_data['type'] == 'enum':
+        When `selectors` are provided, only the selected fields are returned, e.g. `['phase', 'event.module_id']`
+        for `Vec<EventRecord>`. Fields that are not selected are skipped without being decoded, see
+        `get_projection_plan()`.
 
-                    if base_cls is None:
-                        base_cls = Enum
+        Parameters
+        ----------
+        type_string: string representation of a `ScaleType`
+        data: ScaleBytes data to decode
+        metadata: VersionedMetadata, required for e.g. decoding calls and events
+        check_remaining: If enabled, an exception will be raised when data is remaining after decoding
+        selectors: list of dotted paths of the fields to decode
 
-                    value_list = decoder_class_data.get('value_list')
+        Returns
+        -------
+        Decoded value
+        """
+        if not self.use_decode_plans:
+            if metadata is not None:
+                scale_obj = self.create_scale_object(type_string, data, metadata=metadata)
+            else:
+                scale_obj = self.create_scale_object(type_string, data)
+            value = scale_obj.decode(check_remaining=check_remaining)
 
-                    if type(value_list) is dict:
-                        # Transform value_list with explicitly specified index numbers
-                        value_list = {i: v for v, i in value_list.items()}
+            if selectors is not None:
+                value = ScaleType.project_value(value, self.build_selector_tree(selectors))
 
-                    decoder_class = type(type_string, (base_cls,), {
-                        'value_list': value_list,
-                        'type_mapping': decoder_class_data.get('type_mapping')
-                    })
+            return value
 
-                elif decoder_class_data['type'] == 'set':
+        if selectors is not None:
+            value = self.get_projection_plan(type_string, selectors)(data, metadata)
+        else:
+            value = self.get_value_decode_plan(type_string)(data, metadata)
 
-                    if base_cls is None:
-                        base_cls = Set
+        self.check_decoded_data(type_string, data, check_remaining)
+        return value
 
-                    decoder_class = type(type_string, (base_cls,), {
-                        'value_list': decoder_class_data.get('value_list'),
-                        'value_type': decoder_class_data.get('value_type', 'u64')
-                    })
+    @staticmethod
+    def check_decoded_data(type_string: str, data: 'ScaleBytes', check_remaining: bool = True):
+        """
+        Performs the same checks on `data` after decoding `type_string` as `ScaleDecoder.decode()` does
 
-                else:
-                    raise NotImplementedError("Dynamic decoding type '{}' not supported".format(
-                        decoder_class_data['type'])
-                    )
-            else:
-                decoder_class = self.get_decoder_class(decoder_class_data)
+        Parameters
+        ----------
+        type_string
+        data
+        check_remaining: If enabled, an exception will be raised when data is remaining after decoding
+        """
+        if check_remaining and data.check_remaining and data.get_remaining_length() != 0:
+            raise RemainingScaleBytesNotEmptyException(
+                f'Decoding <{type_string}> - Current offset: {data.offset} / length: {data.length}'
+            )
 
-            self.type_registry['types'][type_string.lower()] = decoder_class
+        if data.offset > data.length:
+            raise RemainingScaleBytesNotEmptyException(
+                f'Decoding <{type_string}> - No more bytes available (needed: {data.offset} / total: {data.length})'
+            )
 
-    def update_type_registry(self, type_registry):
+    def clear_compiled_plans(self):
+        """
+        Clears all cached decode, skip, projection, encode and iterative plans and the decoder class cache, required
+        when the type registry changes. Cached versioned types and plans of other spec versions are cleared as well.
+        """
+        self.set_compiled_plans(None)
+        self.versioned_types = {}
+        self.versioned_plans = {}
+        self.active_versioning_key = None
 
-        # Set runtime ID if set
-        self.active_spec_version_id = type_registry.get('runtime_id')
+    def get_compiled_plans(self) -> tuple:
+        """
+        Returns the decoder class cache and all cached plans, e.g. to restore them later with `set_compiled_plans()`
 
-        # Set chain ID if set
-        self.chain_id = type_registry.get('chain_id')
+        Returns
+        -------
+        tuple of the decoder class cache and the decode, skip, projection, encode and iterative plans
+        """
+        return (
+            self.decoder_classes, self.decode_plans, self.skip_plans, self.projection_plans, self.encode_plans,
+            self.iterative_plans
+        )
 
-        self.type_registry['versioning'] = type_registry.get('versioning')
-        self.type_registry['runtime_api'].update(type_registry.get('runtime_api', {}))
-        self.type_registry['runtime_upgrades'] = type_registry.get('runtime_upgrades')
+    def set_compiled_plans(self, compiled_plans: Optional[tuple]):
+        """
+        Replaces the decoder class cache and all cached plans
 
-        # Update types
-        if 'types' in type_registry:
-            self.update_type_registry_types(type_registry.get('types'))
+        Parameters
+        ----------
+        compiled_plans: tuple as returned by `get_compiled_plans()`, or None for empty caches
+        """
+        if compiled_plans is None:
+            compiled_plans = ({}, {}, {}, {}, {}, {})
 
-    def set_active_spec_version_id(self, spec_version_id):
+        (
+            self.decoder_classes, self.decode_plans, self.skip_plans, self.projection_plans, self.encode_plans,
+            self.iterative_plans
+        ) = compiled_plans
 
-        if spec_version_id != self.active_spec_version_id:
+    def clear_decoder_class_cache(self):
+        """
+        Clears the cache of resolved decoder classes used by `get_decoder_class()`; hit and miss counters are kept
+        """
+        self.decoder_classes = {}
 
-            self.active_spec_version_id = spec_version_id
+    def get_decoder_class_cache_info(self) -> dict:
+        """
+        Returns statistics of the decoder class cache used by `get_decoder_class()`
 
-            # Updated type registry with versioned types
-            for versioning_item in self.type_registry.get('versioning') or []:
-                # Check if versioning item is in current version range
-                if versioning_item['runtime_range'][0] <= spec_version_id and \
-                        (not versioning_item['runtime_range'][1] or versioning_item['runtime_range'][1] >= spec_version_id):
-                    # Update types in type registry
-                    self.update_type_registry_types(versioning_item['types'])
+        Returns
+        -------
+        dict with the amount of cache 'hits', 'misses' and the current 'size' of the cache
+        """
+        return {
+            'hits': self.decoder_class_cache_hits,
+            'misses': self.decoder_class_cache_misses,
+            'size': len(self.decoder_classes)
+        }
 
-    def get_runtime_id_from_upgrades(self, block_number: int) -> Optional[int]:
+    def get_cached_plan(self, plans: dict, type_string: Union[str, dict, type], compile_plan: Callable):
         """
-        Retrieve runtime_id for given block_number if runtime_upgrades are specified in the type registry
+        Returns the plan for `type_string` from the `plans` cache, compiling it with `compile_plan` when not present
 
         Parameters
         ----------
-        block_number
+        plans: cache of plans per type string
+        type_string: type string, inner struct definition or decoder class
+        compile_plan: function that compiles the plan for a type string
 
         Returns
         -------
-        Runtime id
+        Compiled plan
         """
-        if self.type_registry.get('runtime_upgrades'):
+        if type(type_string) is dict:
+            # Inner struct definitions are not cached
+            return compile_plan(type_string)
 
-            if block_number > self.type_registry['runtime_upgrades'][-1][0]:
-                return
+        plan = plans.get(type_string)
 
-            for max_block_number, runtime_id in reversed(self.type_registry['runtime_upgrades']):
-                if block_number >= max_block_number and runtime_id != -1:
-                    return runtime_id
+        if plan is None:
+            # Register a forwarding plan first, so recursive types refer to the plan that is being compiled
+            compiled_plans = []
 
-    def set_runtime_upgrades_head(self, block_number: int):
-        """
-        Sets head for given block_number to last runtime_id in runtime_upgrades cache
+            def recursive_plan(*args):
+                return compiled_plans[0](*args)
 
-        Parameters
+            plans[type_string] = recursive_plan
+
+            try:
+                plan = compile_plan(type_string)
+            except Exception:
+                del plans[type_string]
+                raise
+
+            compiled_plans.append(plan)
+            plans[type_string] = plan
+
+        return plan
+
+    def resolve_plan_decoder_class(
+            self, type_string: Union[str, dict, type], plan_method: str, process_method: str = 'process'
+    ):
+        """
+        Resolves the decoder class of `type_string` and determines if its `plan_method` (e.g. `compile_decode_plan`)
+        can be used. A specialised plan only applies if it is implemented by the same class (or a subclass) as the
+        decoding process; e.g. a subclass with a custom `process()` falls back to the default plan.
+
+        Parameters
+        ----------
+        type_string: type string, inner struct definition or decoder class
+        plan_method: name of the classmethod that compiles the plan
+        process_method: name of the method the plan replaces, e.g. `process_encode` for encode plans
+
+        Returns
+        -------
+        tuple of the decoder class (None if not found) and a bool if the specialised plan can be used
+        """
+
+        def defining_class(cls, attribute):
+            for base_class in cls.__mro__:
+                if attribute in base_class.__dict__:
+                    return base_class
+
+        if isinstance(type_string, type):
+            decoder_class = type_string
+        else:
+            decoder_class = self.get_decoder_class(type_string)
+
+        if decoder_class is None:
+            return None, False
+
+        if decoder_class.type_mapping is None and decoder_class.type_string:
+            try:
+                decoder_class.build_type_mapping()
+            except Exception:
+                # Decoding via a ScaleType object raises the appropriate error when this type is actually decoded
+                return decoder_class, False
+
+        if not decoder_class.has_type_definition():
+            return decoder_class, False
+
+        plan_class = defining_class(decoder_class, plan_method)
+
+        return decoder_class, all(
+            [defining_class(decoder_class, attr) in plan_class.__mro__ for attr in ('__init__', process_method)]
+        )
+
+    def get_decode_plan(self, type_string: Union[str, dict, type]) -> Callable:
+        """
+        Returns the compiled decode plan for `type_string`: a function `decode_plan(data: ScaleBytes, metadata)` that
+        decodes a value directly from `data`. Plans are cached per type string until the type registry changes.
+
+        Parameters
+        ----------
+        type_string: type string, inner struct definition or decoder class
+
+        Returns
+        -------
+        Callable
+        """
+        return self.get_cached_plan(self.decode_plans, type_string, self.compile_decode_plan)
+
+    def compile_decode_plan(self, type_string: Union[str, dict, type]) -> Callable:
+        """
+        Compiles a decode plan for `type_string` using `ScaleType.compile_decode_plan()` of its decoder class. Types
+        that cannot be compiled are decoded via a ScaleType object.
+
+        Parameters
+        ----------
+        type_string: type string, inner struct definition or decoder class
+
+        Returns
+        -------
+        Callable
+        """
+        decoder_class, use_class_plan = self.resolve_plan_decoder_class(type_string, 'compile_decode_plan')
+
+        if decoder_class is None:
+            def decode_plan(data, metadata):
+                raise NotImplementedError('Decoder class for "{}" not found'.format(type_string))
+
+            return decode_plan
+
+        if use_class_plan:
+            try:
+                return decoder_class.compile_decode_plan(self)
+            except (NotImplementedError, ValueError):
+                # Decoding via a ScaleType object raises the appropriate error when this type is actually decoded
+                pass
+
+        return ScaleType.compile_decode_plan.__func__(decoder_class, self)
+
+    def get_value_decode_plan(self, type_string: Union[str, dict, type]) -> Callable:
+        """
+        Returns the plan used to decode a complete value of `type_string`: the decode plan, or when
+        `iterative_decoding` is enabled and the type can contain itself (e.g. nested calls), a plan that runs its
+        iterative plan with `decode_iterative()`, so decoding doesn't recurse per nesting level.
+
+        Parameters
+        ----------
+        type_string: type string, inner struct definition or decoder class
+
+        Returns
+        -------
+        Callable
+        """
+        if self.iterative_decoding:
+            iterative_plan = self.get_iterative_plan(type_string)
+
+            if iterative_plan is not None:
+                decode_iterative = self.decode_iterative
+
+                def decode_plan(data, metadata):
+                    return decode_iterative(iterative_plan, data, metadata)
+
+                return decode_plan
+
+        return self.get_decode_plan(type_string)
+
+    def get_iterative_plan(self, type_string: Union[str, dict, type]) -> Optional[Callable]:
+        """
+        Returns the compiled iterative plan for `type_string`: a generator function `iterative_plan(data: ScaleBytes,
+        metadata)` that yields the iterative plans of nested values instead of calling them, receives their decoded
+        values and returns the same value as the decode plan, see `decode_iterative()`.
+
+        Only types that (indirectly) contain a type without a fixed nesting depth, like calls, have an iterative plan;
+        all other types are decoded with their decode plan. Plans are cached per type string until the type registry
+        changes.
+
+        Parameters
+        ----------
+        type_string: type string, inner struct definition or decoder class
+
+        Returns
+        -------
+        Callable or None if the type is decoded with its decode plan
+        """
+        # Types without an iterative plan are cached as False
+        return self.get_cached_plan(self.iterative_plans, type_string, self.compile_iterative_plan) or None
+
+    def compile_iterative_plan(self, type_string: Union[str, dict, type]) -> Union[Callable, bool]:
+        """
+        Compiles an iterative plan for `type_string` using `ScaleType.compile_iterative_plan()` of its decoder class
+
+        Parameters
+        ----------
+        type_string: type string, inner struct definition or decoder class
+
+        Returns
+        -------
+        Callable, or False if the type is decoded with its decode plan
+        """
+        decoder_class, use_class_plan = self.resolve_plan_decoder_class(type_string, 'compile_iterative_plan')
+
+        if use_class_plan:
+            # The iterative plan must return the same value as the decode plan implemented along with it
+            _, use_class_plan = self.resolve_plan_decoder_class(
+                decoder_class, 'compile_iterative_plan', 'compile_decode_plan'
+            )
+
+        if not use_class_plan:
+            return False
+
+        try:
+            return decoder_class.compile_iterative_plan(self) or False
+        except (NotImplementedError, ValueError):
+            # Decoding with the decode plan raises the appropriate error when this type is actually decoded
+            return False
+
+    @staticmethod
+    def decode_iterative(iterative_plan: Callable, data: 'ScaleBytes', metadata=None):
+        """
+        Decodes a value by running `iterative_plan` and the plans of its nested values on an explicit stack instead
+        of Python recursion, so the nesting depth of the decoded value is not limited by the recursion limit
+
+        Parameters
+        ----------
+        iterative_plan: see `get_iterative_plan()`
+        data: ScaleBytes data to decode
+        metadata: VersionedMetadata, required for e.g. decoding calls and events
+
+        Returns
+        -------
+        Decoded value
+        """
+        stack = []
+        plan_generator = iterative_plan(data, metadata)
+        value = None
+
+        while True:
+            try:
+                nested_plan = plan_generator.send(value)
+            except StopIteration as stop:
+                if len(stack) == 0:
+                    return stop.value
+
+                # Resume the parent with the decoded value
+                value = stop.value
+                plan_generator = stack.pop()
+            else:
+                stack.append(plan_generator)
+                plan_generator = nested_plan(data, metadata)
+                value = None
+
+    def get_skip_plan(self, type_string: Union[str, dict, type]) -> Union[int, Callable]:
+        """
+        Returns the compiled skip plan for `type_string`: the encoded length if it is fixed, otherwise a function
+        `skip_plan(data: ScaleBytes, metadata)` that advances the offset of `data` past an encoded value without
+        decoding it. Plans are cached per type string until the type registry changes.
+
+        Parameters
+        ----------
+        type_string: type string, inner struct definition or decoder class
+
+        Returns
+        -------
+        int or Callable
+        """
+        return self.get_cached_plan(self.skip_plans, type_string, self.compile_skip_plan)
+
+    def compile_skip_plan(self, type_string: Union[str, dict, type]) -> Union[int, Callable]:
+        """
+        Compiles a skip plan for `type_string` using `ScaleType.compile_skip_plan()` of its decoder class. Types
+        that cannot be compiled are skipped by decoding them.
+
+        Parameters
+        ----------
+        type_string: type string, inner struct definition or decoder class
+
+        Returns
+        -------
+        int or Callable
+        """
+        decoder_class, use_class_plan = self.resolve_plan_decoder_class(type_string, 'compile_skip_plan')
+
+        if decoder_class is None:
+            def skip_plan(data, metadata):
+                raise NotImplementedError('Decoder class for "{}" not found'.format(type_string))
+
+            return skip_plan
+
+        if use_class_plan:
+            try:
+                return decoder_class.compile_skip_plan(self)
+            except (NotImplementedError, ValueError):
+                pass
+
+        return ScaleType.compile_skip_plan.__func__(decoder_class, self)
+
+    def skip(self, type_string: Union[str, type], data: 'ScaleBytes', metadata=None) -> int:
+        """
+        Advances the offset of `data` past a SCALE encoded `type_string` value without materialising it, e.g. only
+        the Compact length of a `Vec<u8>` is read and primitives are skipped by their fixed length
+
+        Parameters
+        ----------
+        type_string: string representation of a `ScaleType` or decoder class
+        data: ScaleBytes positioned at the start of the value
+        metadata: VersionedMetadata, required for e.g. skipping calls
+
+        Returns
+        -------
+        int: the encoded length of the skipped value
+        """
+        start_offset = data.offset
+
+        skip_plan = self.get_skip_plan(type_string)
+
+        if type(skip_plan) is int:
+            data.skip_bytes(skip_plan)
+        else:
+            skip_plan(data, metadata)
+
+        if data.offset > data.length:
+            raise RemainingScaleBytesNotEmptyException(
+                f'Skipping <{type_string}> - No more bytes available (needed: {data.offset} / total: {data.length})'
+            )
+
+        return data.offset - start_offset
+
+    @staticmethod
+    def build_selector_tree(selectors: Union[list, dict, None]) -> Optional[dict]:
+        """
+        Converts a list of dotted field paths to a nested dict, e.g. `['phase', 'event.module_id']` becomes
+        `{'phase': None, 'event': {'module_id': None}}`. A value of None selects the complete field.
+
+        Parameters
+        ----------
+        selectors: list of dotted paths, an already built selector tree or None to select everything
+
+        Returns
+        -------
+        dict or None
+        """
+        if selectors is None or type(selectors) is dict:
+            return selectors
+
+        if type(selectors) is str:
+            raise TypeError('Selectors must be a list of paths')
+
+        selector_tree = {}
+
+        for selector in selectors:
+            *path, field_name = selector.split('.')
+
+            branch = selector_tree
+            for path_name in path:
+                if path_name in branch and branch[path_name] is None:
+                    # Complete field is already selected
+                    break
+                branch = branch.setdefault(path_name, {})
+            else:
+                branch[field_name] = None
+
+        return selector_tree
+
+    @staticmethod
+    def merge_selector_trees(selector_tree: Optional[dict], other_selector_tree: Optional[dict]) -> Optional[dict]:
+        """
+        Combines two selector trees into a selector tree that selects the fields of both
+
+        Parameters
+        ----------
+        selector_tree
+        other_selector_tree
+
+        Returns
+        -------
+        dict or None
+        """
+        if selector_tree is None or other_selector_tree is None:
+            return None
+
+        merged_tree = dict(selector_tree)
+
+        for field_name, field_selectors in other_selector_tree.items():
+            if field_name in merged_tree:
+                merged_tree[field_name] = RuntimeConfigurationObject.merge_selector_trees(
+                    merged_tree[field_name], field_selectors
+                )
+            else:
+                merged_tree[field_name] = field_selectors
+
+        return merged_tree
+
+    def get_projection_plan(self, type_string: Union[str, dict, type], selectors: Union[list, dict, None]) -> Callable:
+        """
+        Returns the compiled projection plan for `type_string`: a function `projection_plan(data: ScaleBytes,
+        metadata)` that decodes only the fields matched by `selectors` (e.g. `['phase', 'event.module_id']`) and
+        skips all other fields at byte level using their skip plans. Selectors apply to the keys of the decoded
+        value; for a Vec or Option they apply to its elements. Keys that are not present in a value are omitted.
+
+        Plans are cached per type string and selectors until the type registry changes.
+
+        Parameters
+        ----------
+        type_string: type string, inner struct definition or decoder class
+        selectors: list of dotted paths, a selector tree (see `build_selector_tree()`) or None to select everything
+
+        Returns
+        -------
+        Callable
+        """
+        selector_tree = self.build_selector_tree(selectors)
+
+        if selector_tree is None:
+            return self.get_value_decode_plan(type_string)
+
+        def compile_plan(_):
+            return self.compile_projection_plan(type_string, selector_tree)
+
+        if type(type_string) is dict:
+            return compile_plan(type_string)
+
+        def selector_tree_key(tree):
+            if tree is None:
+                return None
+            return tuple(sorted((name, selector_tree_key(branch)) for name, branch in tree.items()))
+
+        return self.get_cached_plan(
+            self.projection_plans, (type_string, selector_tree_key(selector_tree)), compile_plan
+        )
+
+    def compile_projection_plan(self, type_string: Union[str, dict, type], selector_tree: dict) -> Callable:
+        """
+        Compiles a projection plan for `type_string` using `ScaleType.compile_projection_plan()` of its decoder
+        class. Types that cannot be compiled are fully decoded and then projected. Raises `SelectorFieldNotFound`
+        when a selected field does not exist in the type.
+
+        Parameters
+        ----------
+        type_string: type string, inner struct definition or decoder class
+        selector_tree: see `build_selector_tree()`
+
+        Returns
+        -------
+        Callable
+        """
+        decoder_class, use_class_plan = self.resolve_plan_decoder_class(type_string, 'compile_projection_plan')
+
+        if decoder_class is None:
+            def projection_plan(data, metadata):
+                raise NotImplementedError('Decoder class for "{}" not found'.format(type_string))
+
+            return projection_plan
+
+        if use_class_plan:
+            try:
+                return decoder_class.compile_projection_plan(self, selector_tree)
+            except SelectorFieldNotFound:
+                raise
+            except (NotImplementedError, ValueError):
+                pass
+
+        return ScaleType.compile_projection_plan.__func__(decoder_class, self, selector_tree)
+
+    def get_encode_plan(self, type_string: Union[str, dict, type]) -> Callable:
+        """
+        Returns the compiled encode plan for `type_string`: a function `encode_plan(value, buffer: bytearray,
+        metadata)` that appends the SCALE encoding of `value` to `buffer`, identical to `ScaleType.encode()`. Plans
+        are cached per type string until the type registry changes.
+
+        Parameters
+        ----------
+        type_string: type string, inner struct definition or decoder class
+
+        Returns
+        -------
+        Callable
+        """
+        return self.get_cached_plan(self.encode_plans, type_string, self.compile_encode_plan)
+
+    def compile_encode_plan(self, type_string: Union[str, dict, type]) -> Callable:
+        """
+        Compiles an encode plan for `type_string` using `ScaleType.compile_encode_plan()` of its decoder class. Types
+        that cannot be compiled, and values that are `ScaleType` objects, are encoded via a ScaleType object.
+
+        Parameters
+        ----------
+        type_string: type string, inner struct definition or decoder class
+
+        Returns
+        -------
+        Callable
+        """
+        decoder_class, use_class_plan = self.resolve_plan_decoder_class(
+            type_string, 'compile_encode_plan', 'process_encode'
+        )
+
+        if decoder_class is None:
+            def encode_plan(value, buffer, metadata):
+                raise NotImplementedError('Decoder class for "{}" not found'.format(type_string))
+
+            return encode_plan
+
+        object_plan = ScaleType.compile_encode_plan.__func__(decoder_class, self)
+
+        if use_class_plan:
+            try:
+                class_plan = decoder_class.compile_encode_plan(self)
+            except (NotImplementedError, ValueError):
+                return object_plan
+
+            def encode_plan(value, buffer, metadata):
+                if isinstance(value, ScaleDecoder):
+                    # Accept ScaleType objects like `ScaleType.encode()` does
+                    return object_plan(value, buffer, metadata)
+                return class_plan(value, buffer, metadata)
+
+            return encode_plan
+
+        return object_plan
+
+    def get_numpy_dtype(self, type_string: Union[str, dict, type]) -> Union[str, list, None]:
+        """
+        Returns the NumPy dtype specification of `type_string` (e.g. '<u4', or a list of `(field, dtype)` for a
+        struct) if its encoding can be read with `numpy.frombuffer()`, see `ScaleType.compile_numpy_dtype()`.
+
+        Parameters
+        ----------
+        type_string: type string, inner struct definition or decoder class
+
+        Returns
+        -------
+        str, list or None if NumPy is not installed or the type has no fixed-width NumPy equivalent
+        """
+        if numpy is None:
+            return None
+
+        decoder_class, use_class_plan = self.resolve_plan_decoder_class(type_string, 'compile_numpy_dtype')
+
+        if not use_class_plan:
+            return None
+
+        return decoder_class.compile_numpy_dtype(self)
+
+    def get_unpack_format(self, type_string: Union[str, dict, type]) -> Optional[tuple]:
+        """
+        Returns the `struct` module format of `type_string` (e.g. 'I' for u32) and a function that converts the
+        unpacked item to the decoded value (None if no conversion is needed), see `ScaleType.compile_unpack_format()`
+
+        Parameters
+        ----------
+        type_string: type string, inner struct definition or decoder class
+
+        Returns
+        -------
+        tuple of format and Callable or None, or None if the type has no fixed-width format
+        """
+        decoder_class, use_class_plan = self.resolve_plan_decoder_class(type_string, 'compile_unpack_format')
+
+        if not use_class_plan:
+            return None
+
+        return decoder_class.compile_unpack_format(self)
+
+    def encode_value(self, type_string: str, value, metadata=None) -> 'ScaleBytes':
+        """
+        Encodes `value` as `type_string` and returns the same data as `ScaleType.encode()` would.
+
+        Unless `use_decode_plans` is disabled, the compiled encode plan of `type_string` is used, so no ScaleType
+        objects are created for the value and its nested fields.
+
+        Parameters
+        ----------
+        type_string: string representation of a `ScaleType`
+        value: serialized value to encode
+        metadata: VersionedMetadata, required for e.g. encoding calls and extrinsics
+
+        Returns
+        -------
+        ScaleBytes
+        """
+        if not self.use_decode_plans:
+            return self.create_scale_object(type_string, metadata=metadata).encode(value)
+
+        buffer = bytearray()
+        self.get_encode_plan(type_string)(value, buffer, metadata)
+        return ScaleBytes(buffer)
+
+    def clear_type_registry(self):
+
+        self.clear_compiled_plans()
+        self.clear_versioned_types()
+        self.lazy_scale_info_types = {}
+
+        if not self.__initial_state:
+            types = dict(self.get_builtin_type_registry_layer())
+
+            for type_string, decoder_class in self.type_registry_classes.items():
+                types.setdefault(type_string, decoder_class)
+
+            self.type_registry = {'types': types, 'runtime_api': {}}
+
+        self.__initial_state = True
+
+    @classmethod
+    def get_builtin_type_registry_layer(cls) -> TypeRegistryLayer:
+        """
+        Returns the immutable layer of all module level ScaleDecoder classes by lowercase class name, shared by all
+        configurations and only rebuilt when new subclasses are defined
+
+        Returns
+        -------
+        TypeRegistryLayer
+        """
+        if cls.builtin_type_registry_layer[0] != ScaleDecoderMeta.class_generation:
+            # Decoder classes created at runtime (e.g. for 'Vec<u32>' or the types of a type registry) are excluded,
+            # class definitions always remain globally after the configuration that created them is cleared
+            RuntimeConfigurationObject.builtin_type_registry_layer = (
+                ScaleDecoderMeta.class_generation,
+                TypeRegistryLayer({
+                    decoder_class.__name__.lower(): decoder_class for decoder_class in cls.all_subclasses(ScaleDecoder)
+                    if '<' not in decoder_class.__name__ and '::' not in decoder_class.__name__
+                    and getattr(sys.modules.get(decoder_class.__module__), decoder_class.__qualname__, None)
+                    is decoder_class
+                })
+            )
+
+        return cls.builtin_type_registry_layer[1]
+
+    @classmethod
+    def get_shared_type_registry_layer(cls, preset_names: Sequence) -> tuple:
+        """
+        Returns the immutable layer of types defined by given type registry presets, applied in order on top of the
+        builtin types. The layer is built once per process and shared by all configurations that use it; its decoder
+        classes stay attached to the configuration they were built with, `get_decoder_class()` returns a subclass
+        attached to the configuration of the lookup.
+
+        Parameters
+        ----------
+        preset_names: names of type registry presets, e.g. ('core', 'legacy')
+
+        Returns
+        -------
+        tuple of the TypeRegistryLayer and the merged 'runtime_api' definitions of the presets
+        """
+        from scalecodec.type_registry import load_type_registry_preset
+
+        preset_names = tuple(preset_names)
+
+        if preset_names not in cls.shared_type_registry_layers:
+            runtime_config = RuntimeConfigurationObject()
+
+            for preset_name in preset_names:
+                type_registry = load_type_registry_preset(preset_name)
+                runtime_config.type_registry['runtime_api'].update(type_registry.get('runtime_api', {}))
+                runtime_config.update_type_registry_types(type_registry.get('types', {}))
+
+            builtin_layer = cls.get_builtin_type_registry_layer()
+            types = runtime_config.type_registry['types']
+            layer = TypeRegistryLayer({
+                type_string: decoder_class for type_string, decoder_class in types.items()
+                if type_string not in builtin_layer or builtin_layer[type_string] is not decoder_class
+            })
+
+            builtin_classes = set(builtin_layer.values())
+
+            for decoder_class in layer.values():
+                if decoder_class is not None and decoder_class not in builtin_classes:
+                    # Used on its own, e.g. from the type registry, the class resolves types through the presets
+                    decoder_class.runtime_config = runtime_config
+                    cls.shared_decoder_classes.add(decoder_class)
+
+            cls.shared_type_registry_layers[preset_names] = (layer, runtime_config.type_registry['runtime_api'])
+
+        return cls.shared_type_registry_layers[preset_names]
+
+    def add_shared_type_registry_layer(self, preset_names: Sequence):
+        """
+        Applies the shared layer of given type registry presets (see `get_shared_type_registry_layer()`) to the types
+        of this configuration, like `update_type_registry()` with these presets but without creating their decoder
+        classes again. Only chain and runtime specific types then have to be applied on top of it, e.g.
+        `add_shared_type_registry_layer(('core', 'legacy'))` followed by `update_type_registry(kusama_preset)`
+
+        Parameters
+        ----------
+        preset_names: names of type registry presets, e.g. ('core', 'legacy')
+        """
+        layer, runtime_api = self.get_shared_type_registry_layer(preset_names)
+
+        self.__initial_state = False
+        self.clear_compiled_plans()
+
+        self.type_registry['types'].update(layer)
+
+        for api_name, api_definition in runtime_api.items():
+            self.type_registry['runtime_api'].setdefault(api_name, api_definition)
+
+    def update_type_registry_types(self, types_dict):
+
+        self.__initial_state = False
+        self.clear_compiled_plans()
+
+        applied_types = self.apply_type_registry_types(types_dict)
+
+        if self.unversioned_types is not None:
+            # Types that are replaced by versioning items keep this definition for spec versions without one
+            for type_string, decoder_class in applied_types.items():
+                if type_string in self.versioned_type_names:
+                    self.unversioned_types[type_string] = decoder_class
+
+        # Classes resolved during the update can refer to types that were replaced afterwards
+        self.clear_compiled_plans()
+
+    def apply_type_registry_types(self, types_dict: dict) -> dict:
+        """
+        Creates the decoder classes for given type definitions and adds them to the type registry, without clearing
+        any cached plans
+
+        Parameters
+        ----------
+        types_dict: dict of type definitions, e.g. the 'types' of a type registry preset
+
+        Returns
+        -------
+        dict of the added decoder classes by lowercase type string
+        """
+        from scalecodec.types import Enum, Struct, Set, Tuple
+
+        applied_types = {}
+
+        for type_string, decoder_class_data in types_dict.items():
+
+            if type(decoder_class_data) == dict:
+
+                # Create dynamic decoder class
+                base_cls = None
+
+                if decoder_class_data.get('base_class'):
+                    base_cls = self.get_decoder_class(decoder_class_data['base_class'])
+                    if base_cls is None:
+                        raise ValueError(f"Specified base_class '{decoder_class_data['base_class']}' for type " +
+                                         f"'{type_string}' not found")
+
+                if decoder_class_data['type'] == 'struct':
+
+                    if base_cls is None:
+                        base_cls = Struct
+
+                    decoder_class = type(type_string, (base_cls,), {
+                        'type_mapping': decoder_class_data.get('type_mapping')
+                    })
+
+                elif decoder_class_data['type'] == 'tuple':
+
+                    if base_cls is None:
+                        base_cls = Tuple
+
+                    decoder_class = type(type_string, (base_cls,), {
+                        'type_mapping': decoder_class_data.get('type_mapping')
+                    })
+
+                elif decoder_class_data['type'] == 'enum':
+
+                    if base_cls is None:
+                        base_cls = Enum
+
+                    value_list = decoder_class_data.get('value_list')
+
+                    if type(value_list) is dict:
+                        # Transform value_list with explicitly specified index numbers
+                        value_list = {i: v for v, i in value_list.items()}
+
+                    decoder_class = type(type_string, (base_cls,), {
+                        'value_list': value_list,
+                        'type_mapping': decoder_class_data.get('type_mapping')
+                    })
+
+                elif decoder_class_data['type'] == 'set':
+
+                    if base_cls is None:
+                        base_cls = Set
+
+                    decoder_class = type(type_string, (base_cls,), {
+                        'value_list': decoder_class_data.get('value_list'),
+                        'value_type': decoder_class_data.get('value_type', 'u64')
+                    })
+
+                else:
+                    raise NotImplementedError("Dynamic decoding type '{}' not supported".format(
+                        decoder_class_data['type'])
+                    )
+                if '<' not in type_string and '::' not in type_string:
+                    self.type_registry_classes[type_string.lower()] = decoder_class
+            else:
+                decoder_class = self.get_decoder_class(decoder_class_data)
+
+            self.type_registry['types'][type_string.lower()] = decoder_class
+            self.lazy_scale_info_types.pop(type_string.lower(), None)
+            applied_types[type_string.lower()] = decoder_class
+
+        return applied_types
+
+    def update_type_registry(self, type_registry):
+
+        # Set runtime ID if set
+        self.active_spec_version_id = type_registry.get('runtime_id')
+
+        # Set chain ID if set
+        self.chain_id = type_registry.get('chain_id')
+
+        self.type_registry['versioning'] = type_registry.get('versioning')
+        self.clear_versioned_types()
+        self.type_registry['runtime_api'].update(type_registry.get('runtime_api', {}))
+        self.type_registry['runtime_upgrades'] = type_registry.get('runtime_upgrades')
+
+        # Update types
+        if 'types' in type_registry:
+            self.update_type_registry_types(type_registry.get('types'))
+
+    def set_active_spec_version_id(self, spec_version_id):
+
+        if spec_version_id != self.active_spec_version_id:
+
+            self.active_spec_version_id = spec_version_id
+
+            if self.type_registry.get('versioning'):
+                # Versioning items that are in current version range
+                versioning_key = tuple(
+                    index for index, versioning_item in enumerate(self.type_registry['versioning'])
+                    if versioning_item['runtime_range'][0] <= spec_version_id and (
+                        not versioning_item['runtime_range'][1] or
+                        versioning_item['runtime_range'][1] >= spec_version_id
+                    )
+                )
+
+                self.activate_versioned_types(versioning_key)
+
+    def activate_versioned_types(self, versioning_key: tuple):
+        """
+        Applies the types of given versioning items on top of the unversioned types. The resulting types and compiled
+        plans are cached per distinct set of versioning items, so switching back to a previous spec version only
+        swaps them in again.
+
+        Parameters
+        ----------
+        versioning_key: tuple of the indices of the versioning items in current version range
+        """
+        if versioning_key == self.active_versioning_key:
+            return
+
+        types = self.type_registry['types']
+        versioning = self.type_registry['versioning']
+
+        if self.unversioned_types is None:
+            # Store the types that are replaced by versioning items before any versioning item is applied
+            self.versioned_type_names = {
+                type_string.lower() for versioning_item in versioning for type_string in versioning_item['types']
+            }
+            self.unversioned_types = {
+                type_string: types[type_string] for type_string in self.versioned_type_names if type_string in types
+            }
+
+        if self.active_versioning_key is not None:
+            self.versioned_plans[self.active_versioning_key] = self.get_compiled_plans()
+
+        for type_string in self.versioned_type_names:
+            if type_string in self.unversioned_types:
+                types[type_string] = self.unversioned_types[type_string]
+            else:
+                types.pop(type_string, None)
+
+        if versioning_key in self.versioned_types:
+            types.update(self.versioned_types[versioning_key])
+        else:
+            self.clear_decoder_class_cache()
+
+            versioned_types = {}
+            for index in versioning_key:
+                versioned_types.update(self.apply_type_registry_types(versioning[index]['types']))
+
+            self.versioned_types[versioning_key] = versioned_types
+
+        self.set_compiled_plans(self.versioned_plans.get(versioning_key))
+        self.active_versioning_key = versioning_key
+
+    def clear_versioned_types(self):
+        """
+        Clears the cached types and plans per set of versioning items, the currently applied types remain unchanged
+        """
+        self.versioned_type_names = set()
+        self.unversioned_types = None
+        self.versioned_types = {}
+        self.versioned_plans = {}
+        self.active_versioning_key = None
+
+    def get_runtime_upgrades_index(self) -> tuple:
+        """
+        Returns the sorted index of the runtime_upgrades in the type registry, built once and rebuilt when the
+        runtime_upgrades are replaced or the head is changed with `set_runtime_upgrades_head()`
+
+        Returns
+        -------
+        tuple of the list of first block numbers and the list of runtime ids valid from that block number (an upgrade
+        without runtime id, like the head set by `set_runtime_upgrades_head()`, inherits the previous runtime id)
+        """
+        runtime_upgrades = self.type_registry.get('runtime_upgrades') or []
+
+        if self.runtime_upgrades_index is None or self.runtime_upgrades_index[0] is not runtime_upgrades or \
+                len(self.runtime_upgrades_index[1]) != len(runtime_upgrades):
+
+            block_numbers = []
+            runtime_ids = []
+
+            for block_number, runtime_id in runtime_upgrades:
+                if runtime_id == -1:
+                    runtime_id = runtime_ids[-1] if runtime_ids else None
+                block_numbers.append(block_number)
+                runtime_ids.append(runtime_id)
+
+            self.runtime_upgrades_index = (runtime_upgrades, block_numbers, runtime_ids)
+
+        return self.runtime_upgrades_index[1:]
+
+    def get_runtime_id_from_upgrades(self, block_number: int) -> Optional[int]:
+        """
+        Retrieve runtime_id for given block_number if runtime_upgrades are specified in the type registry
+
+        Parameters
+        ----------
+        block_number
+
+        Returns
+        -------
+        Runtime id
+        """
+        block_numbers, runtime_ids = self.get_runtime_upgrades_index()
+
+        if block_numbers and block_number <= block_numbers[-1]:
+            index = bisect.bisect_right(block_numbers, block_number) - 1
+            if index >= 0:
+                return runtime_ids[index]
+
+    def get_runtime_ids_for_blocks(self, block_numbers: Iterable[int]) -> list:
+        """
+        Retrieve the runtime_id for each of given block_numbers, e.g. to partition a range of blocks by runtime.
+        Ranges are mapped per runtime upgrade instead of per block number.
+
+        Parameters
+        ----------
+        block_numbers: iterable of block numbers, e.g. `range(1000000, 2000000)`
+
+        Returns
+        -------
+        list of runtime ids (None for block numbers outside of the runtime_upgrades), in the order of `block_numbers`
+        """
+        upgrade_block_numbers, runtime_ids = self.get_runtime_upgrades_index()
+
+        if not upgrade_block_numbers:
+            return [None for _ in block_numbers]
+
+        last_block_number = upgrade_block_numbers[-1]
+
+        if type(block_numbers) is range and block_numbers.step == 1:
+            result = []
+            block_number = block_numbers.start
+
+            while block_number < block_numbers.stop:
+                if block_number > last_block_number:
+                    result.extend([None] * (block_numbers.stop - block_number))
+                    break
+
+                index = bisect.bisect_right(upgrade_block_numbers, block_number) - 1
+
+                if index + 1 < len(upgrade_block_numbers):
+                    # Block numbers up to the next runtime upgrade share the same runtime id
+                    segment_stop = min(upgrade_block_numbers[index + 1], block_numbers.stop)
+                else:
+                    segment_stop = min(last_block_number + 1, block_numbers.stop)
+
+                result.extend([runtime_ids[index] if index >= 0 else None] * (segment_stop - block_number))
+                block_number = segment_stop
+
+            return result
+
+        if numpy is not None and isinstance(block_numbers, numpy.ndarray):
+            block_numbers = block_numbers.tolist()
+
+        bisect_right = bisect.bisect_right
+        runtime_ids = [None] + runtime_ids
+
+        return [
+            None if block_number > last_block_number else runtime_ids[bisect_right(upgrade_block_numbers, block_number)]
+            for block_number in block_numbers
+        ]
+
+    def set_runtime_upgrades_head(self, block_number: int):
+        """
+        Sets head for given block_number to last runtime_id in runtime_upgrades cache
+
+        Parameters
+        ----------
+        block_number
+
+        Returns
+        -------
+
+        """
+        if self.type_registry.get('runtime_upgrades'):
+            if self.type_registry['runtime_upgrades'][-1][1] == -1:
+                self.type_registry['runtime_upgrades'][-1][0] = block_number
+            elif block_number > self.type_registry['runtime_upgrades'][-1][0]:
+                self.type_registry['runtime_upgrades'].append([block_number, -1])
+
+            self.runtime_upgrades_index = None
+
+    def get_decoder_class_for_scale_info_definition(
+            self, type_string: str, scale_info_type: 'GenericRegistryType', prefix: str
+    ):
+
+        decoder_class = None
+        base_decoder_class = None
+
+        # Check if base decoder class is defined for path
+        if 'path' in scale_info_type.value and len(scale_info_type.value['path']) > 0:
+            path_string = '::'.join(scale_info_type.value["path"])
+            base_decoder_class = self.get_decoder_class(path_string)
+
+            if base_decoder_class is None:
+
+                # Try wildcard type
+                catch_all_path = '*::' + '::'.join(scale_info_type.value["path"][1:])
+                base_decoder_class = self.get_decoder_class(catch_all_path)
+
+                if base_decoder_class is None:
+                    # Try catch-all type
+                    catch_all_path = '*::' * (len(scale_info_type.value['path']) - 1) + scale_info_type.value["path"][-1]
+                    base_decoder_class = self.get_decoder_class(catch_all_path)
+
+            if base_decoder_class and hasattr(base_decoder_class, 'process_scale_info_definition'):
+                # if process_scale_info_definition is implemented result is final
+                decoder_class = type(type_string, (base_decoder_class,), {})
+                decoder_class.process_scale_info_definition(scale_info_type, prefix)
+
+                # Link ScaleInfo RegistryType to decoder class
+                decoder_class.scale_info_type = scale_info_type
+
+                return decoder_class
+
+        if "primitive" in scale_info_type.value["def"]:
+            decoder_class = self.get_decoder_class(scale_info_type.value["def"]["primitive"])
+
+        elif 'array' in scale_info_type.value['def']:
+
+            if base_decoder_class is None:
+                base_decoder_class = self.get_decoder_class('FixedLengthArray')
+
+            decoder_class = type(type_string, (base_decoder_class,), {
+                'sub_type': f"{prefix}::{scale_info_type.value['def']['array']['type']}",
+                'element_count': scale_info_type.value['def']['array']['len']
+            })
+
+        elif 'composite' in scale_info_type.value['def']:
+
+            type_mapping = []
+
+            base_type_string = 'Tuple'
+
+            if 'fields' in scale_info_type.value['def']['composite']:
+
+                fields = scale_info_type.value['def']['composite']['fields']
+
+                if all([f.get('name') for f in fields]):
+                    base_type_string = 'Struct'
+                    type_mapping = [[field['name'], f"{prefix}::{field['type']}"] for field in fields]
+
+                else:
+                    base_type_string = 'Tuple'
+                    type_mapping = [f"{prefix}::{field['type']}" for field in fields]
+
+            if base_decoder_class is None:
+                base_decoder_class = self.get_decoder_class(base_type_string)
+
+            decoder_class = type(type_string, (base_decoder_class,), {
+                'type_mapping': type_mapping
+            })
+
+        elif 'sequence' in scale_info_type.value['def']:
+            # Vec
+            decoder_class = type(type_string, (self.get_decoder_class('Vec'),), {
+                'sub_type': f"{prefix}::{scale_info_type.value['def']['sequence']['type']}"
+            })
+
+        elif 'variant' in scale_info_type.value['def']:
+            # Enum
+            type_mapping = []
+
+            variants = scale_info_type.value['def']['variant']['variants']
+
+            if len(variants) > 0:
+                # Create placeholder list
+                variant_length = max([v['index'] for v in variants]) + 1
+                type_mapping = [(None, 'Null')] * variant_length
+
+                for variant in variants:
+
+                    if 'fields' in variant:
+                        if len(variant['fields']) == 0:
+                            enum_value = 'Null'
+                        elif all([f.get('name') for f in variant['fields']]):
+                            # Enum with named fields
+                            enum_value = {f.get('name'): f"{prefix}::{f['type']}" for f in variant['fields']}
+                        else:
+                            if len(variant['fields']) == 1:
+                                enum_value = f"{prefix}::{variant['fields'][0]['type']}"
+                            else:
+                                field_str = ', '.join([f"{prefix}::{f['type']}" for f in variant['fields']])
+                                enum_value = f"({field_str})"
+                    else:
+                        enum_value = 'Null'
+
+                    # Put mapping in right order in list
+                    type_mapping[variant['index']] = (variant['name'], enum_value)
+
+            if base_decoder_class is None:
+                base_decoder_class = self.get_decoder_class("Enum")
+
+            decoder_class = type(type_string, (base_decoder_class,), {
+                'type_mapping': type_mapping
+            })
+
+        elif 'tuple' in scale_info_type.value['def']:
+
+            type_mapping = [f"{prefix}::{f}" for f in scale_info_type.value['def']['tuple']]
+
+            decoder_class = type(type_string, (self.get_decoder_class('Tuple'),), {
+                'type_mapping': type_mapping
+            })
+
+        elif 'compact' in scale_info_type.value['def']:
+            # Compact
+            decoder_class = type(type_string, (self.get_decoder_class('Compact'),), {
+                'sub_type': f"{prefix}::{scale_info_type.value['def']['compact']['type']}", '__slots__': ()
+            })
+
+        elif 'phantom' in scale_info_type.value['def']:
+            decoder_class = type(type_string, (self.get_decoder_class('Null'),), {})
+
+        elif 'bitsequence' in scale_info_type.value['def']:
+            decoder_class = type(type_string, (self.get_decoder_class('BitVec'),), {})
+
+        else:
+            raise NotImplementedError(f"RegistryTypeDef {scale_info_type.value['def']} not implemented")
+
+        # if 'path' in scale_info_type.value:
+        #     decoder_class.type_string = '::'.join(scale_info_type.value['path'])
+
+        # Link ScaleInfo RegistryType to decoder class
+
+        decoder_class.scale_info_type = scale_info_type
+
+        return decoder_class
+
+    def add_lazy_scale_info_type(self, lazy_type: LazyScaleInfoType):
+        """
+        Indexes given `LazyScaleInfoType` by its type string and path, replacing earlier entries of the type registry
+        once its decoder class is built
+
+        Parameters
+        ----------
+        lazy_type
+        """
+        self.lazy_scale_info_types[lazy_type.type_string] = lazy_type
+
+        if lazy_type.path_string:
+            shadowed_type = self.lazy_scale_info_types.get(lazy_type.path_string)
+
+            if shadowed_type is not None:
+                lazy_type.shadowed = shadowed_type.shadowed
+            else:
+                lazy_type.shadowed = self.type_registry['types'].get(lazy_type.path_string)
+
+            self.lazy_scale_info_types[lazy_type.path_string] = lazy_type
+
+    def update_from_scale_info_types(self, scale_info_types: list, prefix: str = None):
+
+        if prefix is None:
+            prefix = 'scale_info'
+
+        self.clear_compiled_plans()
+
+        for scale_info_type in scale_info_types:
+
+            idx = scale_info_type['id'].value
+
+            type_string = f"{prefix}::{idx}"
+
+            if self.lazy_portable_registry:
+                # Only index the type, the decoder class is built by `get_type_registry_entry()` on first lookup
+                path_string = None
+
+                if len(scale_info_type['type'].value.get('path', [])) > 0:
+                    path_string = '::'.join(scale_info_type['type'].value['path']).lower()
+
+                self.add_lazy_scale_info_type(
+                    LazyScaleInfoType(type_string, scale_info_type['type'], prefix, path_string)
+                )
+                continue
+
+            decoder_class = self.get_decoder_class_for_scale_info_definition(
+                type_string, scale_info_type['type'], prefix
+            )
+
+            if decoder_class is None:
+                raise NotImplementedError(f"No decoding class found for scale type {idx}")
+
+            if decoder_class:
+                self.type_registry['types'][type_string] = decoder_class
+
+                if len(scale_info_type['type'].value.get('path', [])) > 0:
+                    path_string = '::'.join(scale_info_type['type'].value['path']).lower()
+                    self.type_registry['types'][path_string] = decoder_class
+
+        # Classes resolved during the update can refer to types that were added afterwards
+        self.clear_compiled_plans()
+
+    def add_portable_registry(self, metadata: 'GenericMetadataVersioned', prefix=None):
+
+        if prefix is None:
+            prefix = 'scale_info'
+
+        scale_info_types = metadata.portable_registry.value_object['types'].value_object
+
+        self.update_from_scale_info_types(scale_info_types, prefix=prefix)
+        self.update_from_extrinsic_type(metadata[1][1]['extrinsic']['ty'].value, prefix=prefix)
+
+    def update_from_extrinsic_type(self, extrinsic_type_id: int, prefix: str = None):
+        """
+        Registers the Address, AccountId, LookupSource and ExtrinsicSignature types of the extrinsic type of the
+        portable registry
+
+        Parameters
+        ----------
+        extrinsic_type_id: id of the extrinsic type in the portable registry of the metadata
+        prefix: prefix of the portable registry, e.g. 'scale_info'
+        """
+        if prefix is None:
+            prefix = 'scale_info'
+
+        # Process extrinsic type in metadata to register correct Address and ExtrinsicSignature types
+        try:
+            # Retrieve Extrinsic using common namespace
+            extrinsic_type = self.get_decoder_class("sp_runtime::generic::unchecked_extrinsic::UncheckedExtrinsic")
+
+            # Try to fall back on extrinsic type in metadata
+            if extrinsic_type is None:
+                extrinsic_type = self.get_decoder_class(f"{prefix}::{extrinsic_type_id}")
+
+            if extrinsic_type is not None:
+                # Extract Address and Signature type and set in type registry
+
+                types_dict = {}
+
+                for param in extrinsic_type.scale_info_type.value['params']:
+                    if param['name'] == 'Address':
+
+                        type_string = f'{prefix}::{param["type"]}'
+
+                        types_dict['Address'] = type_string
+                        types_dict['AccountId'] = type_string
+                        types_dict['LookupSource'] = type_string
+
+                        # Check if Address is MultiAddress
+                        addres_type = self.get_decoder_class(type_string)
+
+                        if addres_type is self.get_decoder_class('sp_runtime::multiaddress::MultiAddress'):
+                            for address_param in addres_type.scale_info_type.value['params']:
+                                if address_param['name'] == 'AccountId':
+                                    # Set AccountId
+                                    types_dict['AccountId'] = f'{prefix}::{address_param["type"]}'
+
+                    elif param['name'] == 'Signature':
+                        types_dict['ExtrinsicSignature'] = f'{prefix}::{param["type"]}'
+
+                # Update type registry
+                self.update_type_registry_types(types_dict)
+        except NotImplementedError:
+            pass
+
+    def add_contract_metadata_dict_to_type_registry(self, metadata_dict):
+        # TODO
+        prefix = f"ink::{metadata_dict['source']['hash']}"
+        return self.update_from_scale_info_types(metadata_dict['types'], prefix=prefix)
+
+
+class ScaleBytes:
+    """
+    Representation of SCALE encoded Bytes.
+    """
+
+    # Whether decoding checks that no bytes remain after the decoded value, when requested with `check_remaining`
+    check_remaining = True
+
+    def __init__(self, data: Union[str, bytes, bytearray, memoryview], zero_copy: bool = False):
+        """
+        Constructs a SCALE bytes-stream with provided `data`
+
+        When `zero_copy` is enabled, `get_next_bytes()` and `get_remaining_bytes()` return `memoryview` slices of the
+        underlying data instead of copies. The returned views keep the underlying data alive as long as they are
+        referenced.
+
+        Parameters
         ----------
-        block_number
+        data
+        zero_copy: If enabled, retrieved bytes are `memoryview` slices of `data` instead of copies
+        """
+        self.offset = 0
+        self.zero_copy = zero_copy
+
+        if type(data) is bytearray:
+            self.data = data
+        elif type(data) is bytes:
+            # Immutable bytes can be viewed directly, no need to copy in zero-copy mode
+            self.data = data if zero_copy else bytearray(data)
+        elif type(data) is memoryview:
+            self.data = data if zero_copy else bytearray(data)
+        elif type(data) is str and data[0:2] == '0x':
+            self.data = bytearray.fromhex(data[2:])
+        else:
+            raise ValueError("Provided data is not in supported format: provided '{}'".format(type(data)))
+
+        self.length = len(self.data)
+
+        if zero_copy:
+            self.view = memoryview(self.data)
+
+    @classmethod
+    def from_mmap(cls, path: str, offset: int = 0, length: int = None) -> 'ScaleBytes':
+        """
+        Constructs a zero-copy SCALE bytes-stream of (a part of) the file at `path`, backed by a read-only memory map.
+        The file is not read into memory; pages are loaded on access and shared between processes through the
+        OS page cache.
+
+        Parameters
+        ----------
+        path: path of the file
+        offset: position in the file where the SCALE bytes start
+        length: amount of bytes, defaults to the remainder of the file
 
         Returns
         -------
+        ScaleBytes
+        """
+        with open(path, 'rb') as fp:
+            file_size = os.fstat(fp.fileno()).st_size
+
+            if length is None:
+                length = file_size - offset
+
+            if offset < 0 or length < 0 or offset + length > file_size:
+                raise ValueError(f'Range {offset}:{offset + length} is outside file of {file_size} bytes')
+
+            if length == 0:
+                return cls(b'', zero_copy=True)
+
+            # Memory map offset must be a multiple of the allocation granularity
+            map_offset = offset - offset % mmap.ALLOCATIONGRANULARITY
 
+            mapped_file = mmap.mmap(
+                fp.fileno(), offset + length - map_offset, access=mmap.ACCESS_READ, offset=map_offset
+            )
+
+        return cls(memoryview(mapped_file)[offset - map_offset:], zero_copy=True)
+
+    def get_next_bytes(self, length: int) -> Union[bytearray, memoryview]:
         """
-        if self.type_registry.get('runtime_upgrades'):
-            if self.type_registry['runtime_upgrades'][-1][1] == -1:
-                self.type_registry['runtime_upgrades'][-1][0] = block_number
-            elif block_number > self.type_registry['runtime_upgrades'][-1][0]:
-                self.type_registry['runtime_upgrades'].append([block_number, -1])
+        Retrieve `length` amount of bytes of the stream
 
-    def get_decoder_class_for_scale_info_definition(
-            self, type_string: str, scale_info_type: 'GenericRegistryType', prefix: str
-    ):
+        Parameters
+        ----------
+        length: amount of requested bytes
 
-        decoder_class = None
-        base_decoder_class = None
+        Returns
+        -------
+        bytearray or memoryview when `zero_copy` is enabled
+        """
+        if self.zero_copy:
+            data = self.view[self.offset:self.offset + length]
+        else:
+            data = self.data[self.offset:self.offset + length]
+        self.offset += length
+        return data
 
-        # Check if base decoder class is defined for path
-        if 'path' in scale_info_type.value and len(scale_info_type.value['path']) > 0:
-            path_string = '::'.join(scale_info_type.value["path"])
-            base_decoder_class = self.get_decoder_class(path_string)
+    def skip_bytes(self, length: int):
+        """
+        Advances the offset `length` amount of bytes without retrieving them
 
-            if base_decoder_class is None:
+        Parameters
+        ----------
+        length: amount of skipped bytes
+        """
+        self.offset += length
 
-                # Try wildcard type
-                catch_all_path = '*::' + '::'.join(scale_info_type.value["path"][1:])
-                base_decoder_class = self.get_decoder_class(catch_all_path)
+    def skip_remaining_bytes(self):
+        """
+        Advances the offset to the end of the stream without retrieving the remaining bytes
+        """
+        self.offset = self.length
 
-                if base_decoder_class is None:
-                    # Try catch-all type
-                    catch_all_path = '*::' * (len(scale_info_type.value['path']) - 1) + scale_info_type.value["path"][-1]
-                    base_decoder_class = self.get_decoder_class(catch_all_path)
+    def get_remaining_bytes(self) -> Union[bytearray, memoryview]:
+        """
+        Retrieves all remaining bytes from the stream
 
-            if base_decoder_class and hasattr(base_decoder_class, 'process_scale_info_definition'):
-                # if process_scale_info_definition is implemented result is final
-                decoder_class = type(type_string, (base_decoder_class,), {})
-                decoder_class.process_scale_info_definition(scale_info_type, prefix)
+        Returns
+        -------
+        bytearray or memoryview when `zero_copy` is enabled
+        """
 
-                # Link ScaleInfo RegistryType to decoder class
-                decoder_class.scale_info_type = scale_info_type
+        if self.zero_copy:
+            data = self.view[self.offset:]
+        else:
+            data = self.data[self.offset:]
+        self.offset = self.length
+        return data
 
-                return decoder_class
+    def get_data_range(self, start: int, end: int) -> bytearray:
+        """
+        Returns the bytes between offsets `start` and `end` of the stream, without moving the pointer
 
-        if "primitive" in scale_info_type.value["def"]:
-            decoder_class = self.get_decoder_class(scale_info_type.value["def"]["primitive"])
+        Parameters
+        ----------
+        start: offset of first byte
+        end: offset after last byte
 
-        elif 'array' in scale_info_type.value['def']:
+        Returns
+        -------
+        bytearray
+        """
+        return self.data[start:end]
 
-            if base_decoder_class is None:
-                base_decoder_class = self.get_decoder_class('FixedLengthArray')
+    def get_remaining_length(self) -> int:
+        """
+        Returns how many bytes are left in the stream
 
-            decoder_class = type(type_string, (base_decoder_class,), {
-                'sub_type': f"{prefix}::{scale_info_type.value['def']['array']['type']}",
-                'element_count': scale_info_type.value['def']['array']['len']
-            })
+        Returns
+        -------
+        int
+        """
+        return self.length - self.offset
 
-        elif 'composite' in scale_info_type.value['def']:
+    def reset(self):
+        """
+        Resets the pointer of the stream to the beginning
 
-            type_mapping = []
+        Returns
+        -------
 
-            base_type_string = 'Tuple'
+        """
+        self.offset = 0
 
-            if 'fields' in scale_info_type.value['def']['composite']:
+    def __str__(self):
+        return "0x{}".format(self.data.hex())
 
-                fields = scale_info_type.value['def']['composite']['fields']
+    def __eq__(self, other):
+        if not hasattr(other, 'data'):
+            return False
+        return self.data == other.data
 
-                if all([f.get('name') for f in fields]):
-                    base_type_string = 'Struct'
-                    type_mapping = [[field['name'], f"{prefix}::{field['type']}"] for field in fields]
+    def __len__(self):
+        return len(self.data)
 
-                else:
-                    base_type_string = 'Tuple'
-                    type_mapping = [f"{prefix}::{field['type']}" for field in fields]
+    def __repr__(self):
+        return "<{}(data=0x{})>".format(self.__class__.__name__, self.data.hex())
 
-            if base_decoder_class is None:
-                base_decoder_class = self.get_decoder_class(base_type_string)
+    def __add__(self, data):
 
-            decoder_class = type(type_string, (base_decoder_class,), {
-                'type_mapping': type_mapping
-            })
+        if type(data) == ScaleBytes:
+            data = data.data
+        elif type(data) == str and data[0:2] == '0x':
+            data = bytearray.fromhex(data[2:])
 
-        elif 'sequence' in scale_info_type.value['def']:
-            # Vec
-            decoder_class = type(type_string, (self.get_decoder_class('Vec'),), {
-                'sub_type': f"{prefix}::{scale_info_type.value['def']['sequence']['type']}"
-            })
+        if type(data) in (bytes, bytearray, memoryview):
+            # Copy into a new bytearray, as memoryview data (zero-copy or memory-mapped) cannot be concatenated
+            result = bytearray(self.data)
+            result += data
+            return ScaleBytes(result)
 
-        elif 'variant' in scale_info_type.value['def']:
-            # Enum
-            type_mapping = []
+    def to_hex(self) -> str:
+        """
+        Return a hex-string (e.g. "0x00") representation of the byte-stream
 
-            variants = scale_info_type.value['def']['variant']['variants']
+        Returns
+        -------
+        str
+        """
+        return f'0x{self.data.hex()}'
 
-            if len(variants) > 0:
-                # Create placeholder list
-                variant_length = max([v['index'] for v in variants]) + 1
-                type_mapping = [(None, 'Null')] * variant_length
 
-                for variant in variants:
+class ScaleBytesStream(ScaleBytes):
+    """
+    Representation of SCALE encoded Bytes that are read incrementally from a binary file object or socket.
 
-                    if 'fields' in variant:
-                        if len(variant['fields']) == 0:
-                            enum_value = 'Null'
-                        elif all([f.get('name') for f in variant['fields']]):
-                            # Enum with named fields
-                            enum_value = {f.get('name'): f"{prefix}::{f['type']}" for f in variant['fields']}
-                        else:
-                            if len(variant['fields']) == 1:
-                                enum_value = f"{prefix}::{variant['fields'][0]['type']}"
-                            else:
-                                field_str = ', '.join([f"{prefix}::{f['type']}" for f in variant['fields']])
-                                enum_value = f"({field_str})"
-                    else:
-                        enum_value = 'Null'
+    Bytes are read from the stream in chunks of `buffer_size` when requested by `get_next_bytes()`. Offsets are
+    absolute positions in the stream, so `offset` and `get_remaining_length()` behave the same as for `ScaleBytes`.
 
-                    # Put mapping in right order in list
-                    type_mapping[variant['index']] = (variant['name'], enum_value)
+    Consumed bytes remain buffered (they are needed for e.g. `ScaleDecoder.get_used_bytes()`) until
+    `discard_consumed_bytes()` is called, which is typically done after each decoded top-level object:
 
-            if base_decoder_class is None:
-                base_decoder_class = self.get_decoder_class("Enum")
+    ```
+    scale_bytes = ScaleBytesStream(open('events.scale', 'rb'))
+    while scale_bytes.get_remaining_length() > 0:
+        obj = runtime_config.create_scale_object('EventRecord', data=scale_bytes)
+        obj.decode()
+        scale_bytes.discard_consumed_bytes()
+    ```
 
-            decoder_class = type(type_string, (base_decoder_class,), {
-                'type_mapping': type_mapping
-            })
+    Decoding only reads the bytes of the decoded value: unless enabled with `check_remaining`, it is not checked that
+    the stream ends after the value, as that would block on a stream that is not closed yet (e.g. a socket).
+    """
 
-        elif 'tuple' in scale_info_type.value['def']:
+    def __init__(self, stream, length: int = None, buffer_size: int = 65536, check_remaining: bool = False):
+        """
+        Constructs a SCALE bytes-stream that reads from provided `stream`
 
-            type_mapping = [f"{prefix}::{f}" for f in scale_info_type.value['def']['tuple']]
+        If `length` is not provided it is determined for seekable streams. For non-seekable streams (e.g. sockets)
+        the total length is unknown until the end of the stream is reached; until then `length` is the amount of
+        bytes read so far.
 
-            decoder_class = type(type_string, (self.get_decoder_class('Tuple'),), {
-                'type_mapping': type_mapping
-            })
+        Parameters
+        ----------
+        stream: binary file object (implementing `read()`) or socket (implementing `recv()`)
+        length: total amount of bytes that can be read from the stream, if known
+        buffer_size: minimum amount of bytes read from the stream at once
+        check_remaining: If enabled, decoding with `check_remaining` reads the stream to check it ends after the
+            decoded value
+        """
+        if hasattr(stream, 'read'):
+            self.read_stream = stream.read
+        elif hasattr(stream, 'recv'):
+            self.read_stream = stream.recv
+        else:
+            raise ValueError("Provided stream is not in supported format: provided '{}'".format(type(stream)))
 
-        elif 'compact' in scale_info_type.value['def']:
-            # Compact
-            decoder_class = type(type_string, (self.get_decoder_class('Compact'),), {
-                'sub_type': f"{prefix}::{scale_info_type.value['def']['compact']['type']}"
-            })
+        self.stream = stream
+        self.buffer_size = buffer_size
+        self.offset = 0
+        self.zero_copy = False
+        self.check_remaining = check_remaining
+
+        # Buffered bytes; first byte of `data` is located at absolute offset `buffer_offset`
+        self.data = bytearray()
+        self.buffer_offset = 0
+
+        self.stream_start = None
+        if hasattr(stream, 'seekable') and stream.seekable():
+            self.stream_start = stream.tell()
+
+            if length is None:
+                length = stream.seek(0, io.SEEK_END) - self.stream_start
+                stream.seek(self.stream_start)
+
+        self.total_length = length
+
+    @property
+    def length(self) -> int:
+        # Does not read from the stream, so it can be used in checks without blocking
+        if self.total_length is None:
+            return self.buffer_offset + len(self.data)
 
-        elif 'phantom' in scale_info_type.value['def']:
-            decoder_class = type(type_string, (self.get_decoder_class('Null'),), {})
+        return self.total_length
 
-        elif 'bitsequence' in scale_info_type.value['def']:
-            decoder_class = type(type_string, (self.get_decoder_class('BitVec'),), {})
+    def get_remaining_length(self) -> int:
+        """
+        Returns how many bytes are left in the stream. When the length of the stream is unknown, this reads from the
+        stream until at least one byte after the current offset is buffered or the end of the stream is reached,
+        which blocks while no data is available; a result of 0 then means the stream has ended.
 
-        else:
-            raise NotImplementedError(f"RegistryTypeDef {scale_info_type.value['def']} not implemented")
+        Returns
+        -------
+        int
+        """
+        if self.total_length is None:
+            self.fill_buffer(self.offset + 1)
 
-        # if 'path' in scale_info_type.value:
-        #     decoder_class.type_string = '::'.join(scale_info_type.value['path'])
+        return self.length - self.offset
 
-        # Link ScaleInfo RegistryType to decoder class
+    def fill_buffer(self, end: Optional[int]):
+        """
+        Reads from the stream until buffer contains bytes up to offset `end`, or the end of the stream is reached.
+        If `end` is None the stream is read until the end.
 
-        decoder_class.scale_info_type = scale_info_type
+        Parameters
+        ----------
+        end: offset (exclusive) up to which bytes should be buffered
+        """
+        while end is None or self.buffer_offset + len(self.data) < end:
 
-        return decoder_class
+            if self.total_length is not None and self.buffer_offset + len(self.data) >= self.total_length:
+                return
 
-    def update_from_scale_info_types(self, scale_info_types: list, prefix: str = None):
+            if end is None:
+                read_size = self.buffer_size
+            else:
+                read_size = max(self.buffer_size, end - self.buffer_offset - len(self.data))
 
-        if prefix is None:
-            prefix = 'scale_info'
+            chunk = self.read_stream(read_size)
 
-        for scale_info_type in scale_info_types:
+            if not chunk:
+                # End of stream
+                self.total_length = self.buffer_offset + len(self.data)
+                return
 
-            idx = scale_info_type['id'].value
+            self.data += chunk
 
-            type_string = f"{prefix}::{idx}"
+    def get_next_bytes(self, length: int) -> bytearray:
+        """
+        Retrieve `length` amount of bytes of the stream
 
-            decoder_class = self.get_decoder_class_for_scale_info_definition(
-                type_string, scale_info_type['type'], prefix
-            )
+        Parameters
+        ----------
+        length: amount of requested bytes
 
-            if decoder_class is None:
-                raise NotImplementedError(f"No decoding class found for scale type {idx}")
+        Returns
+        -------
+        bytearray
+        """
+        end = self.offset + length
 
-            if decoder_class:
-                self.type_registry['types'][type_string] = decoder_class
+        if end > self.buffer_offset + len(self.data):
+            self.fill_buffer(end)
 
-                if len(scale_info_type['type'].value.get('path', [])) > 0:
-                    path_string = '::'.join(scale_info_type['type'].value['path']).lower()
-                    self.type_registry['types'][path_string] = decoder_class
+        data = self.get_data_range(self.offset, end)
+        self.offset = end
+        return data
 
-    def add_portable_registry(self, metadata: 'GenericMetadataVersioned', prefix=None):
+    def skip_bytes(self, length: int):
+        """
+        Advances the offset `length` amount of bytes, the skipped bytes are read into the buffer when not available
+        yet, so the length of the stream remains known
 
-        if prefix is None:
-            prefix = 'scale_info'
+        Parameters
+        ----------
+        length: amount of skipped bytes
+        """
+        end = self.offset + length
 
-        scale_info_types = metadata.portable_registry.value_object['types'].value_object
+        if end > self.buffer_offset + len(self.data):
+            self.fill_buffer(end)
 
-        self.update_from_scale_info_types(scale_info_types, prefix=prefix)
+        self.offset = end
 
-        # Process extrinsic type in metadata to register correct Address and ExtrinsicSignature types
-        try:
-            # Retrieve Extrinsic using common namespace
-            extrinsic_type = self.get_decoder_class("sp_runtime::generic::unchecked_extrinsic::UncheckedExtrinsic")
+    def skip_remaining_bytes(self):
+        """
+        Reads the stream until the end and advances the offset to the end, the skipped bytes remain buffered
+        """
+        self.fill_buffer(None)
+        self.offset = self.total_length
 
-            # Try to fall back on extrinsic type in metadata
-            if extrinsic_type is None:
-                extrinsic_type_id = metadata[1][1]['extrinsic']['ty'].value
-                extrinsic_type = self.get_decoder_class(f"{prefix}::{extrinsic_type_id}")
+    def get_remaining_bytes(self) -> bytearray:
+        """
+        Reads and retrieves all remaining bytes from the stream
 
-            if extrinsic_type is not None:
-                # Extract Address and Signature type and set in type registry
+        Returns
+        -------
+        bytearray
+        """
+        self.fill_buffer(None)
+        data = self.get_data_range(self.offset, self.total_length)
+        self.offset = self.total_length
+        return data
 
-                types_dict = {}
+    def get_data_range(self, start: int, end: int) -> bytearray:
+        if start < self.buffer_offset:
+            raise ValueError(f'Bytes at offset {start} are already discarded from the buffer')
 
-                for param in extrinsic_type.scale_info_type.value['params']:
-                    if param['name'] == 'Address':
+        return self.data[start - self.buffer_offset:end - self.buffer_offset]
 
-                        type_string = f'{prefix}::{param["type"]}'
+    def discard_consumed_bytes(self):
+        """
+        Removes all bytes before the current offset from the buffer. After discarding, those bytes can no longer be
+        accessed (e.g. by `ScaleDecoder.get_used_bytes()`)
+        """
+        discard_length = min(self.offset - self.buffer_offset, len(self.data))
 
-                        types_dict['Address'] = type_string
-                        types_dict['AccountId'] = type_string
-                        types_dict['LookupSource'] = type_string
+        if discard_length > 0:
+            del self.data[:discard_length]
+            self.buffer_offset += discard_length
 
-                        # Check if Address is MultiAddress
-                        addres_type = self.get_decoder_class(type_string)
+    def reset(self):
+        """
+        Resets the pointer of the stream to the beginning. If bytes are already discarded from the buffer, the stream
+        must be seekable
 
-                        if addres_type is self.get_decoder_class('sp_runtime::multiaddress::MultiAddress'):
-                            for address_param in addres_type.scale_info_type.value['params']:
-                                if address_param['name'] == 'AccountId':
-                                    # Set AccountId
-                                    types_dict['AccountId'] = f'{prefix}::{address_param["type"]}'
+        Returns
+        -------
 
-                    elif param['name'] == 'Signature':
-                        types_dict['ExtrinsicSignature'] = f'{prefix}::{param["type"]}'
+        """
+        if self.buffer_offset > 0:
+            if self.stream_start is None:
+                raise ValueError('Cannot reset a non-seekable stream after bytes are discarded')
 
-                # Update type registry
-                self.update_type_registry_types(types_dict)
-        except NotImplementedError:
-            pass
+            self.stream.seek(self.stream_start)
+            self.data = bytearray()
+            self.buffer_offset = 0
 
-    def add_contract_metadata_dict_to_type_registry(self, metadata_dict):
-        # TODO
-        prefix = f"ink::{metadata_dict['source']['hash']}"
-        return self.update_from_scale_info_types(metadata_dict['types'], prefix=prefix)
+        self.offset = 0
 
+    def __bool__(self):
+        return True
 
-class ScaleBytes:
+    def __repr__(self):
+        return "<{}(offset={}, buffered={})>".format(self.__class__.__name__, self.offset, len(self.data))
+
+
+class LazyElements:
     """
-    Representation of SCALE encoded Bytes.
+    Shared state of a lazily decoded Struct, Tuple or Vec. Elements are decoded on first access; preceding elements
+    are skipped (see `RuntimeConfigurationObject.skip()`) to find the offset of the requested element.
+
+    The elements are decoded from the data of the lazily decoded object itself, at the offsets of its byte range, so
+    bytes are not copied. The offset of that data is restored after each access.
     """
 
-    def __init__(self, data: Union[str, bytes, bytearray]):
+    def __init__(self, scale_obj: 'ScaleType', element_types: list, check_remaining: bool = True,
+                 end_offset: int = None):
         """
-        Constructs a SCALE bytes-stream with provided `data`
+        The elements start at the current offset of the data of `scale_obj`, which is moved to `end_offset`. Without
+        `end_offset` a lazily decoded value spans the rest of the data.
 
         Parameters
         ----------
-        data
+        scale_obj: ScaleType object that is decoded lazily
+        element_types: type string of each element
+        check_remaining: If enabled, an exception will be raised when data is remaining after the last element
+        end_offset: offset after the last element, if known (e.g. from a length prefix)
         """
-        self.offset = 0
-
-        if type(data) is bytearray:
-            self.data = data
-        elif type(data) is bytes:
-            self.data = bytearray(data)
-        elif type(data) is str and data[0:2] == '0x':
-            self.data = bytearray.fromhex(data[2:])
+        self.runtime_config = scale_obj.runtime_config
+        self.metadata = scale_obj.metadata
+        self.element_types = element_types
+        self.check_remaining = check_remaining
+        self.type_string = scale_obj.__class__.__name__
+
+        self.data = scale_obj.data
+
+        # Start offset of each element; the last item is the end offset of the last traversed element
+        self.offsets = [self.data.offset]
+        self.values = {}
+        self.objects = {}
+
+        if end_offset is None:
+            self.data.skip_remaining_bytes()
+            self.end_offset = self.data.offset
         else:
-            raise ValueError("Provided data is not in supported format: provided '{}'".format(type(data)))
+            self.end_offset = end_offset
+            self.data.skip_bytes(end_offset - self.data.offset)
 
-        self.length = len(self.data)
+        if len(element_types) == 0:
+            self.check_decoded_data(self.offsets[0])
 
-    def get_next_bytes(self, length: int) -> bytearray:
+    def __len__(self):
+        return len(self.element_types)
+
+    def check_decoded_data(self, offset: int):
         """
-        Retrieve `length` amount of bytes of the stream
+        Performs the same checks as `RuntimeConfigurationObject.check_decoded_data()` for the byte range of the
+        elements, after the last element is decoded up to `offset`
 
         Parameters
         ----------
-        length: amount of requested bytes
+        offset
+        """
+        if self.check_remaining and self.data.check_remaining and offset != self.end_offset:
+            raise RemainingScaleBytesNotEmptyException(
+                f'Decoding <{self.type_string}> - Current offset: {offset} / length: {self.end_offset}'
+            )
 
-        Returns
-        -------
-        bytearray
+        if offset > self.end_offset:
+            raise RemainingScaleBytesNotEmptyException(
+                f'Decoding <{self.type_string}> - No more bytes available (needed: {offset} / total: {self.end_offset})'
+            )
+
+    def seek_element(self, index: int):
         """
-        data = self.data[self.offset:self.offset + length]
-        self.offset += length
-        return data
+        Positions the data at the start of element `index`, traversing preceding elements when their length is
+        not yet known. Callers restore the offset of the data afterwards.
 
-    def get_remaining_bytes(self) -> bytearray:
+        Parameters
+        ----------
+        index
         """
-        Retrieves all remaining bytes from the stream
+        if not 0 <= index < len(self.element_types):
+            raise IndexError('Element index out of range')
+
+        while len(self.offsets) <= index:
+            skipped_index = len(self.offsets) - 1
+            self.data.offset = self.offsets[skipped_index]
+            self.runtime_config.skip(self.element_types[skipped_index], self.data, metadata=self.metadata)
+            self.element_decoded(skipped_index)
+
+        self.data.offset = self.offsets[index]
+
+    def element_decoded(self, index: int):
+        # Record the end offset of the element that was just decoded
+        if len(self.offsets) == index + 1:
+            self.offsets.append(self.data.offset)
+
+            if index == len(self.element_types) - 1:
+                self.check_decoded_data(self.data.offset)
+
+    def get_value(self, index: int):
+        """
+        Returns the decoded value of element `index`, without creating ScaleType objects if decode plans are used
+
+        Parameters
+        ----------
+        index
 
         Returns
         -------
-        bytearray
+        Decoded value
         """
+        if index not in self.values:
+            offset = self.data.offset
+            try:
+                self.seek_element(index)
+                self.values[index] = self.runtime_config.decode_value(
+                    self.element_types[index], self.data, metadata=self.metadata, check_remaining=False
+                )
+                self.element_decoded(index)
+            finally:
+                self.data.offset = offset
 
-        data = self.data[self.offset:]
-        self.offset = self.length
-        return data
+        return self.values[index]
 
-    def get_remaining_length(self) -> int:
+    def get_object(self, index: int) -> 'ScaleType':
         """
-        Returns how many bytes are left in the stream
+        Returns the decoded ScaleType object of element `index`
+
+        Parameters
+        ----------
+        index
 
         Returns
         -------
-        int
+        ScaleType
         """
-        return self.length - self.offset
+        if index not in self.objects:
+            offset = self.data.offset
+            try:
+                self.seek_element(index)
+                element_obj = self.runtime_config.create_scale_object(
+                    self.element_types[index], data=self.data, metadata=self.metadata
+                )
+                element_obj.decode(check_remaining=False)
+                self.objects[index] = element_obj
+                self.values.setdefault(index, element_obj.value)
+                self.element_decoded(index)
+            finally:
+                self.data.offset = offset
 
-    def reset(self):
+        return self.objects[index]
+
+    def get_element(self, index: int, objects: bool):
+        if objects:
+            return self.get_object(index)
+        return self.get_value(index)
+
+
+class LazyStruct(Mapping):
+    """
+    Read-only mapping of the fields of a lazily decoded Struct, see `ScaleDecoder.decode(lazy=True)`. Accessing a
+    field decodes only that field.
+    """
+
+    def __init__(self, lazy_elements: LazyElements, keys: list, objects: bool = False, decoded: dict = None):
         """
-        Resets the pointer of the stream to the beginning
+        Parameters
+        ----------
+        lazy_elements
+        keys: field names in order of `lazy_elements`
+        objects: If enabled, ScaleType objects are returned instead of decoded values
+        decoded: fields that are already decoded, preceding the fields of `lazy_elements`
+        """
+        self.lazy_elements = lazy_elements
+        self.keys_index = {key: index for index, key in enumerate(keys)}
+        self.objects = objects
+        self.decoded = decoded or {}
 
-        Returns
-        -------
+    def __getitem__(self, key):
+        if key in self.decoded:
+            return self.decoded[key]
+        return self.lazy_elements.get_element(self.keys_index[key], self.objects)
+
+    def __iter__(self):
+        yield from self.decoded
+        yield from self.keys_index
+
+    def __len__(self):
+        return len(self.decoded) + len(self.keys_index)
+
+    def __repr__(self):
+        return '<{}({})>'.format(self.__class__.__name__, ', '.join([str(key) for key in self]))
+
+
+class LazySequence(Sequence):
+    """
+    Read-only sequence of the elements of a lazily decoded Tuple or Vec, see `ScaleDecoder.decode(lazy=True)`.
+    Accessing an element decodes only that element.
+    """
 
+    def __init__(self, lazy_elements: LazyElements, sequence_type: type = list, objects: bool = False):
         """
-        self.offset = 0
+        Parameters
+        ----------
+        lazy_elements
+        sequence_type: `list` or `tuple`, the type of the value when decoded eagerly
+        objects: If enabled, ScaleType objects are returned instead of decoded values
+        """
+        self.lazy_elements = lazy_elements
+        self.sequence_type = sequence_type
+        self.objects = objects
 
-    def __str__(self):
-        return "0x{}".format(self.data.hex())
+    def __getitem__(self, index):
+        if type(index) is slice:
+            return self.sequence_type([self[i] for i in range(*index.indices(len(self)))])
 
-    def __eq__(self, other):
-        if not hasattr(other, 'data'):
-            return False
-        return self.data == other.data
+        if index < 0:
+            index += len(self)
+
+        return self.lazy_elements.get_element(index, self.objects)
 
     def __len__(self):
-        return len(self.data)
+        return len(self.lazy_elements)
+
+    def __eq__(self, other):
+        if isinstance(other, LazySequence):
+            other = other.sequence_type(other)
+        return self.sequence_type(self) == other
 
     def __repr__(self):
-        return "<{}(data=0x{})>".format(self.__class__.__name__, self.data.hex())
+        return '<{}(length={})>'.format(self.__class__.__name__, len(self))
 
-    def __add__(self, data):
 
-        if type(data) == ScaleBytes:
-            return ScaleBytes(self.data + data.data)
+class ScaleDecoderMeta(ABCMeta):
+    """
+    Metaclass of `ScaleDecoder`. Instances store their runtime configuration and `sub_type` in the `runtime_config`
+    and `sub_type` slots, a class attribute of the same name would shadow those slots. The values of a decoder class
+    itself are therefore accessed through properties of this metaclass, a `sub_type` in the class namespace is stored
+    as `_sub_type`.
+    """
 
-        if type(data) == bytes:
-            data = bytearray(data)
-        elif type(data) == str and data[0:2] == '0x':
-            data = bytearray.fromhex(data[2:])
+    # Incremented for every new module level class, used to detect when the builtin type registry layer has to be
+    # rebuilt
+    class_generation = 0
 
-        if type(data) == bytearray:
-            return ScaleBytes(self.data + data)
+    def __new__(mcs, name, bases, namespace, **kwargs):
+        if 'sub_type' in namespace:
+            namespace = dict(namespace)
+            namespace['_sub_type'] = namespace.pop('sub_type')
 
-    def to_hex(self) -> str:
-        """
-        Return a hex-string (e.g. "0x00") representation of the byte-stream
+        cls = super().__new__(mcs, name, bases, namespace, **kwargs)
 
-        Returns
-        -------
-        str
-        """
-        return f'0x{self.data.hex()}'
+        # Only classes defined by a module level class statement are part of the builtin type registry layer, decoder
+        # classes created at runtime with `type()` have no `__qualname__` in their namespace
+        if '.' not in namespace.get('__qualname__', '.'):
+            ScaleDecoderMeta.class_generation += 1
+
+        return cls
+
+    @property
+    def runtime_config(cls) -> Optional['RuntimeConfigurationObject']:
+        return cls._runtime_config
 
+    @runtime_config.setter
+    def runtime_config(cls, runtime_config: Optional['RuntimeConfigurationObject']):
+        cls._runtime_config = runtime_config
 
-class ScaleDecoder(ABC):
+    @property
+    def sub_type(cls) -> Optional[str]:
+        return cls._sub_type
+
+    @sub_type.setter
+    def sub_type(cls, sub_type: Optional[str]):
+        cls._sub_type = sub_type
+
+
+class ScaleDecoder(ABC, metaclass=ScaleDecoderMeta):
     """
     Base class for all SCALE decoding/encoding
     """
 
+    # Attributes of every instance are stored in slots. Subclasses without `__slots__` (e.g. types that accept a
+    # `type_mapping` per instance) have an instance dict for other attributes.
+    __slots__ = (
+        'data', 'value_object', 'value_serialized', 'decoded', 'data_start_offset', 'data_end_offset',
+        'runtime_config', 'sub_type', '__weakref__'
+    )
+
     type_string = None
 
     type_mapping = None
 
-    sub_type = None
+    # Sub type of the class, see `ScaleDecoderMeta`
+    _sub_type = None
 
-    runtime_config = None
+    # Runtime configuration attached to the class, see `ScaleDecoderMeta`
+    _runtime_config = None
 
     def __init__(self, data: ScaleBytes, sub_type: str = None, runtime_config: RuntimeConfigurationObject = None):
         """
@@ -717,21 +2662,17 @@ class ScaleDecoder(ABC):
         sub_type
         runtime_config
         """
-        if sub_type:
-            self.sub_type = sub_type
+        # A `sub_type` passed during init overrides the sub type of the class
+        self.sub_type = sub_type or self.__class__.sub_type
 
         if self.type_mapping is None and self.type_string:
             self.build_type_mapping()
 
         if data:
-            assert(type(data) == ScaleBytes)
-
-        if runtime_config:
-            self.runtime_config = runtime_config
+            assert(isinstance(data, ScaleBytes))
 
-        if not self.runtime_config:
-            # if no runtime config is provided, fallback on singleton
-            self.runtime_config = RuntimeConfiguration()
+        # if no runtime config is provided, fallback on the configuration of the class or the singleton
+        self.runtime_config = runtime_config or self.__class__.runtime_config or RuntimeConfiguration()
 
         self.data = data
 
@@ -764,19 +2705,7 @@ class ScaleDecoder(ABC):
     def build_type_mapping(cls):
 
         if cls.type_string and cls.type_string[0] == '(' and cls.type_string[-1] == ')':
-            type_mapping = ()
-
-            tuple_contents = cls.type_string[1:-1]
-
-            # replace subtype types
-            sub_types = re.search(r'([A-Za-z]+[<][^>]*[>])', tuple_contents)
-            if sub_types:
-                sub_types = sub_types.groups()
-                for sub_type in sub_types:
-                    tuple_contents = tuple_contents.replace(sub_type, sub_type.replace(',', '|'))
-
-            for tuple_element in tuple_contents.split(','):
-                type_mapping += (tuple_element.strip().replace('|', ','),)
+            type_mapping = tuple(param.type_string for param in parse_type_string(cls.type_string).params)
 
             cls.type_mapping = type_mapping
 
@@ -837,7 +2766,7 @@ class ScaleDecoder(ABC):
         -------
         bytearray
         """
-        return self.data.data[self.data_start_offset:self.data_end_offset]
+        return self.data.get_data_range(self.data_start_offset, self.data_end_offset)
 
     @abstractmethod
     def process(self):
@@ -850,7 +2779,34 @@ class ScaleDecoder(ABC):
         """
         raise NotImplementedError
 
-    def decode(self, data: ScaleBytes = None, check_remaining=True):
+    def has_instance_type_definition(self) -> bool:
+        """
+        Returns True if the type definition of this instance differs from its class, e.g. a `type_mapping` or
+        `sub_type` passed during init. Compiled decode plans are based on the class and can't be used in that case.
+
+        Returns
+        -------
+        bool
+        """
+        cls = type(self)
+        # Compare with the class attributes, so the instance dict isn't allocated by accessing it
+        return any([
+            getattr(self, attr, None) is not getattr(cls, attr, None) for attr in ('type_mapping', 'sub_type', 'value_list')
+        ])
+
+    @classmethod
+    def has_type_definition(cls) -> bool:
+        """
+        Returns False for a generic class without its type definition, e.g. a `Struct` without `type_mapping`. No
+        compiled plans are used for such a class; the definition is then expected to be passed during init.
+
+        Returns
+        -------
+        bool
+        """
+        return True
+
+    def decode(self, data: ScaleBytes = None, check_remaining=True, values_only=False, lazy=False, selectors=None):
         """
         Decodes available SCALE-bytes according to type specification of this ScaleType
 
@@ -858,10 +2814,28 @@ class ScaleDecoder(ABC):
 
         If `check_remaining` is enabled, an exception will be raised when data is remaining after decoding
 
+        If `values_only` is enabled, only the serialized value is decoded using the compiled decode plan of this type
+        (see `RuntimeConfigurationObject.get_decode_plan()`), so no ScaleType objects are created for nested fields
+        and `value_object` is the same as `value`.
+
+        If `lazy` is enabled, a Struct, Tuple, Vec or Extrinsic is decoded on access: `value` and `value_object` are
+        read-only `LazyStruct` or `LazySequence` containers and accessing e.g. `obj['field']` or `obj.value['field']`
+        only decodes that field. A lazily decoded Struct, Tuple or Vec spans all remaining data, an Extrinsic the length
+        of its prefix; remaining bytes are checked once the last element is decoded. Elements are decoded from `data`
+        itself, so with a `ScaleBytesStream` they must be accessed before `discard_consumed_bytes()`. Other types are
+        decoded eagerly.
+
+        If `selectors` are provided (e.g. `['phase', 'event.module_id']`), only the selected fields are decoded and
+        `value` contains just those fields; all other fields are skipped at byte level, see
+        `RuntimeConfigurationObject.get_projection_plan()`. Like `values_only`, no `value_object` graph is built.
+
         Parameters
         ----------
         data
         check_remaining: If enabled, an exception will be raised when data is remaining after decoding
+        values_only: If enabled, no `value_object` graph of nested ScaleType objects is built
+        lazy: If enabled, elements of a Struct, Tuple or Vec are decoded on first access
+        selectors: list of dotted paths of the fields to decode
 
         Returns
         -------
@@ -874,8 +2848,27 @@ class ScaleDecoder(ABC):
 
         if not self.decoded:
 
-            self.data_start_offset = self.data.offset
-            self.value_serialized = self.process()
+            self.data_start_offset = self.data.offset
+
+            if lazy:
+                self.value_serialized = self.process_lazy(check_remaining)
+            elif selectors is not None:
+                if self.has_instance_type_definition():
+                    self.value_serialized = self.project_value(
+                        self.process(), self.runtime_config.build_selector_tree(selectors)
+                    )
+                    self.value_object = None
+                else:
+                    self.value_serialized = self.runtime_config.get_projection_plan(self.__class__, selectors)(
+                        self.data, getattr(self, 'metadata', None)
+                    )
+            elif values_only and self.runtime_config.use_decode_plans and not self.has_instance_type_definition():
+                self.value_serialized = self.runtime_config.get_value_decode_plan(self.__class__)(
+                    self.data, getattr(self, 'metadata', None)
+                )
+            else:
+                self.value_serialized = self.process()
+
             self.decoded = True
 
             if self.value_object is None:
@@ -884,7 +2877,7 @@ class ScaleDecoder(ABC):
 
             self.data_end_offset = self.data.offset
 
-            if check_remaining and self.data.offset != self.data.length:
+            if check_remaining and self.data.check_remaining and self.data.get_remaining_length() != 0:
                 raise RemainingScaleBytesNotEmptyException(
                     f'Decoding <{self.__class__.__name__}> - Current offset: {self.data.offset} / length: {self.data.length}'
                 )
@@ -915,7 +2908,7 @@ class ScaleDecoder(ABC):
         ScaleBytes
         """
 
-        if value and issubclass(self.__class__, value.__class__):
+        if isinstance(value, ScaleDecoder) and value and issubclass(self.__class__, value.__class__):
             # Accept instance of current class directly
             self.data = value.data
             self.value_object = value.value_object
@@ -1002,10 +2995,270 @@ class RuntimeConfiguration(RuntimeConfigurationObject, metaclass=Singleton):
     pass
 
 
+RuntimeConfigurationObject.set_type_string_cache_size(TYPE_STRING_CACHE_SIZE)
+
+
+class RuntimeConfigurationPoolEntry:
+    """
+    Configuration of a `RuntimeConfigurationPool` with the metadata it was built from. When the portable registry was
+    applied from a snapshot, the metadata is only decoded on first access of `metadata`.
+    """
+    __slots__ = ('runtime_config', 'encoded_metadata', 'decoded_metadata')
+
+    def __init__(self, runtime_config: RuntimeConfigurationObject, encoded_metadata: Union[str, bytes, 'ScaleBytes'],
+                 decoded_metadata: 'GenericMetadataVersioned' = None):
+        """
+        Parameters
+        ----------
+        runtime_config
+        encoded_metadata: SCALE encoded metadata of the runtime
+        decoded_metadata: decoded metadata, if already available
+        """
+        self.runtime_config = runtime_config
+        self.encoded_metadata = encoded_metadata
+        self.decoded_metadata = decoded_metadata
+
+    @property
+    def metadata(self) -> 'GenericMetadataVersioned':
+        if self.decoded_metadata is None:
+            data = self.encoded_metadata
+            if type(data) is not ScaleBytes:
+                data = ScaleBytes(data)
+
+            metadata_obj = self.runtime_config.create_scale_object('MetadataVersioned', data=data)
+            metadata_obj.decode()
+
+            self.decoded_metadata = metadata_obj
+            self.encoded_metadata = None
+
+        return self.decoded_metadata
+
+
+class RuntimeConfigurationPool:
+    """
+    Pool of `RuntimeConfigurationObject` instances keyed by spec version, each built on demand from the SCALE encoded
+    metadata of that runtime. When the pool holds more than `max_size` configurations or, if set, configurations with
+    a total weight of more than `max_weight`, least-recently-used configurations are evicted.
+
+    Evicting a configuration only removes it from the pool, it stays usable by code that still references it.
+    """
+
+    def __init__(self, metadata_loader: Callable = None, max_size: int = RUNTIME_CONFIGURATION_POOL_SIZE,
+                 max_weight: int = None, sizer: Callable = None, shared_presets: Sequence = ('core',),
+                 type_registry: dict = None, snapshot_cache: 'MetadataSnapshotCache' = None, **config_kwargs):
+        """
+        Parameters
+        ----------
+        metadata_loader: function that returns the SCALE encoded metadata (hex string, bytes or ScaleBytes) for a
+            spec version, used when no metadata is passed to `get()`
+        max_size: maximum amount of configurations kept in the pool
+        max_weight: maximum total weight of the configurations in the pool, as determined by `sizer`
+        sizer: function that returns the weight of a configuration, called with the configuration. Defaults to
+            `get_runtime_config_weight()`. Weights are determined again on every miss, so plans compiled after a
+            configuration was built are accounted.
+        shared_presets: names of type registry presets shared between all configurations in the pool
+        type_registry: type registry applied to each configuration before the metadata
+        snapshot_cache: cache of portable registry snapshots, used instead of decoding the metadata when present
+        config_kwargs: keyword arguments passed to `RuntimeConfigurationObject`, e.g. `ss58_format`
+        """
+        if max_size < 1:
+            raise ValueError('max_size must be at least 1')
+
+        self.metadata_loader = metadata_loader
+        self.max_size = max_size
+        self.max_weight = max_weight
+        self.sizer = sizer or self.get_runtime_config_weight
+        self.shared_presets = shared_presets
+        self.type_registry = type_registry
+        self.snapshot_cache = snapshot_cache
+        self.config_kwargs = config_kwargs
+
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, spec_version):
+        return spec_version in self.entries
+
+    @staticmethod
+    def get_runtime_config_weight(runtime_config: RuntimeConfigurationObject) -> int:
+        """
+        Estimates the weight of a configuration as the amount of its type registry entries, cached decoder classes
+        and compiled plans, which make up most of its memory
+
+        Parameters
+        ----------
+        runtime_config
+
+        Returns
+        -------
+        int
+        """
+        return len(runtime_config.type_registry['types']) + sum(
+            len(plans) for plans in runtime_config.get_compiled_plans()
+        )
+
+    def get(self, spec_version: int, metadata: Union[str, bytes, 'ScaleBytes'] = None) -> RuntimeConfigurationObject:
+        """
+        Returns the configuration for `spec_version`, building it when not present in the pool
+
+        Parameters
+        ----------
+        spec_version
+        metadata: SCALE encoded metadata of the runtime, retrieved with `metadata_loader` when omitted
+
+        Returns
+        -------
+        RuntimeConfigurationObject
+        """
+        return self.get_entry(spec_version, metadata).runtime_config
+
+    def get_metadata(self, spec_version: int, metadata: Union[str, bytes, 'ScaleBytes'] = None) \
+            -> 'GenericMetadataVersioned':
+        """
+        Returns the decoded metadata of the configuration for `spec_version`, building it when not present in the pool
+
+        Parameters
+        ----------
+        spec_version
+        metadata: SCALE encoded metadata of the runtime, retrieved with `metadata_loader` when omitted
+
+        Returns
+        -------
+        GenericMetadataVersioned
+        """
+        return self.get_entry(spec_version, metadata).metadata
+
+    def get_entry(self, spec_version: int, metadata: Union[str, bytes, 'ScaleBytes'] = None) \
+            -> RuntimeConfigurationPoolEntry:
+        """
+        Returns the pool entry for `spec_version` and marks it as most recently used. On a miss the configuration is
+        built from `metadata` and least-recently-used entries are evicted until the pool is within its limits again.
+
+        Parameters
+        ----------
+        spec_version
+        metadata: SCALE encoded metadata of the runtime, retrieved with `metadata_loader` when omitted
+
+        Returns
+        -------
+        RuntimeConfigurationPoolEntry
+        """
+        entry = self.entries.get(spec_version)
+
+        if entry is not None:
+            self.hits += 1
+            self.entries.move_to_end(spec_version)
+            return entry
+
+        self.misses += 1
+
+        if metadata is None:
+            if self.metadata_loader is None:
+                raise ValueError(f'No metadata provided for spec version {spec_version}')
+            metadata = self.metadata_loader(spec_version)
+
+        entry = self.build_entry(spec_version, metadata)
+        self.entries[spec_version] = entry
+
+        while len(self.entries) > self.max_size:
+            self.evict(next(iter(self.entries)))
+
+        if self.max_weight is not None:
+            weight = self.get_weight()
+
+            while len(self.entries) > 1 and weight > self.max_weight:
+                evicted_spec_version, evicted_entry = next(iter(self.entries.items()))
+                weight -= self.sizer(evicted_entry.runtime_config)
+                self.evict(evicted_spec_version)
+
+        return entry
+
+    def build_entry(self, spec_version: int, metadata: Union[str, bytes, 'ScaleBytes']) \
+            -> RuntimeConfigurationPoolEntry:
+        """
+        Builds a configuration with the portable registry of given SCALE encoded metadata applied
+
+        Parameters
+        ----------
+        spec_version
+        metadata
+
+        Returns
+        -------
+        RuntimeConfigurationPoolEntry
+        """
+        runtime_config = RuntimeConfigurationObject(shared_presets=self.shared_presets, **self.config_kwargs)
+
+        if self.type_registry:
+            runtime_config.update_type_registry(self.type_registry)
+
+        if self.snapshot_cache is not None:
+            decoded_metadata = self.snapshot_cache.add_portable_registry(runtime_config, metadata, spec_version)
+            return RuntimeConfigurationPoolEntry(runtime_config, metadata, decoded_metadata)
+
+        entry = RuntimeConfigurationPoolEntry(runtime_config, metadata)
+        runtime_config.add_portable_registry(entry.metadata)
+
+        return entry
+
+    def evict(self, spec_version: int):
+        """
+        Removes the configuration for `spec_version` from the pool
+
+        Parameters
+        ----------
+        spec_version
+        """
+        del self.entries[spec_version]
+        self.evictions += 1
+
+    def clear(self):
+        """
+        Removes all configurations from the pool; statistics are kept
+        """
+        self.entries.clear()
+
+    def get_weight(self) -> int:
+        """
+        Returns the total weight of the configurations in the pool, as determined by `sizer`
+
+        Returns
+        -------
+        int
+        """
+        return sum(self.sizer(entry.runtime_config) for entry in self.entries.values())
+
+    def get_pool_info(self) -> dict:
+        """
+        Returns statistics of the pool
+
+        Returns
+        -------
+        dict with the amount of 'hits', 'misses', 'evictions', the current 'size' and 'weight' of the pool and the
+        configured 'max_size' and 'max_weight'
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self.entries),
+            'weight': self.get_weight(),
+            'max_size': self.max_size,
+            'max_weight': self.max_weight
+        }
+
+
 class ScaleType(ScaleDecoder, ABC):
     """
     Base class for all SCALE types
     """
+    __slots__ = ('metadata', '_meta_info')
+
     scale_info_type: 'GenericRegistryType' = None
 
     def __init__(self, data=None, sub_type=None, metadata=None, runtime_config=None):
@@ -1022,16 +3275,40 @@ class ScaleType(ScaleDecoder, ABC):
         """
         self.metadata = metadata
 
-        # Container for meta information
-        self.meta_info: dict = {}
+        # Container for meta information, allocated on first access
+        self._meta_info = None
 
         if not data:
             data = ScaleBytes(bytearray())
         super().__init__(data, sub_type, runtime_config=runtime_config)
 
+    @property
+    def meta_info(self) -> dict:
+        if self._meta_info is None:
+            self._meta_info = {}
+        return self._meta_info
+
+    @meta_info.setter
+    def meta_info(self, value: dict):
+        self._meta_info = value
+
     def __getitem__(self, item):
         return self.value_object[item]
 
+    def process_lazy(self, check_remaining: bool = True):
+        """
+        Implementation of the lazy decoding process, see `decode(lazy=True)`. By default the value is decoded eagerly
+
+        Parameters
+        ----------
+        check_remaining: If enabled, an exception will be raised when data is remaining after the last element
+
+        Returns
+        -------
+
+        """
+        return self.process()
+
     def __iter__(self):
         for item in self.value_object:
             yield item
@@ -1070,11 +3347,238 @@ class ScaleType(ScaleDecoder, ABC):
     def generate_type_decomposition(cls, _recursion_level: int = 0, max_recursion: int = TYPE_DECOMP_MAX_RECURSIVE):
         return cls.__name__
 
+    @classmethod
+    def compile_decode_plan(cls, runtime_config: RuntimeConfigurationObject) -> Callable:
+        """
+        Compiles a decode plan for this type: a function `decode_plan(data: ScaleBytes, metadata)` that decodes a
+        value from `data` and returns the same value as `decode()` would.
+
+        Types with a generic `process()` override this method to decode directly from the ScaleBytes, using the
+        plans of their nested types (`runtime_config.get_decode_plan()`). This default implementation decodes via a
+        ScaleType object.
+
+        Parameters
+        ----------
+        runtime_config
+
+        Returns
+        -------
+        Callable
+        """
+
+        def decode_plan(data, metadata):
+            if metadata is None:
+                obj = cls(data=data, runtime_config=runtime_config)
+            else:
+                obj = cls(data=data, metadata=metadata, runtime_config=runtime_config)
+            obj.decode(check_remaining=False)
+            return obj.value
+
+        return decode_plan
+
+    @classmethod
+    def compile_skip_plan(cls, runtime_config: RuntimeConfigurationObject) -> Union[int, Callable]:
+        """
+        Compiles a skip plan for this type: the encoded length if it is fixed, otherwise a function
+        `skip_plan(data: ScaleBytes, metadata)` that advances the offset of `data` past an encoded value.
+
+        Types override this method to skip values with the fewest reads possible, using the plans of their nested
+        types (`runtime_config.get_skip_plan()`). This default implementation decodes the value and discards it.
+
+        Parameters
+        ----------
+        runtime_config
+
+        Returns
+        -------
+        int or Callable
+        """
+        decode_plan = runtime_config.get_decode_plan(cls)
+
+        def skip_plan(data, metadata):
+            decode_plan(data, metadata)
+
+        return skip_plan
+
+    @classmethod
+    def compile_projection_plan(cls, runtime_config: RuntimeConfigurationObject, selector_tree: dict) -> Callable:
+        """
+        Compiles a projection plan for this type: a function `projection_plan(data: ScaleBytes, metadata)` that only
+        returns the fields selected in `selector_tree` (see `RuntimeConfigurationObject.build_selector_tree()`).
+
+        Composite types override this method to skip unselected fields with their skip plans. This default
+        implementation decodes the complete value and projects it afterwards.
+
+        Parameters
+        ----------
+        runtime_config
+        selector_tree
+
+        Returns
+        -------
+        Callable
+        """
+        decode_plan = runtime_config.get_decode_plan(cls)
+
+        def projection_plan(data, metadata):
+            return cls.project_value(decode_plan(data, metadata), selector_tree)
+
+        return projection_plan
+
+    @classmethod
+    def compile_encode_plan(cls, runtime_config: RuntimeConfigurationObject) -> Callable:
+        """
+        Compiles an encode plan for this type: a function `encode_plan(value, buffer: bytearray, metadata)` that
+        appends the same data to `buffer` as `encode(value)` returns.
+
+        Types with a generic `process_encode()` override this method to write directly to the buffer, using the
+        plans of their nested types (`runtime_config.get_encode_plan()`). This default implementation encodes via a
+        ScaleType object.
+
+        Parameters
+        ----------
+        runtime_config
+
+        Returns
+        -------
+        Callable
+        """
+
+        def encode_plan(value, buffer, metadata):
+            data = cls(data=None, metadata=metadata, runtime_config=runtime_config).encode(value)
+
+            if isinstance(data, ScaleBytes):
+                data = data.data
+
+            buffer += data
+
+        return encode_plan
+
+    @classmethod
+    def compile_numpy_dtype(cls, runtime_config: RuntimeConfigurationObject) -> Union[str, list, None]:
+        """
+        Returns the NumPy dtype specification of this type, used to decode sequences of fixed-width values with a
+        single `numpy.frombuffer()` call. Types that are not fixed-width primitives (or structs of them) return None.
+
+        Parameters
+        ----------
+        runtime_config
+
+        Returns
+        -------
+        str, list or None
+        """
+        return None
+
+    @classmethod
+    def compile_iterative_plan(cls, runtime_config: RuntimeConfigurationObject) -> Optional[Callable]:
+        """
+        Compiles an iterative plan for this type, see `RuntimeConfigurationObject.get_iterative_plan()`. Composite
+        types override this method and return a generator function if one of their nested types has an iterative
+        plan. This default implementation returns None, so the type is decoded with its decode plan.
+
+        Parameters
+        ----------
+        runtime_config
+
+        Returns
+        -------
+        Callable or None
+        """
+        return None
+
+    @classmethod
+    def compile_unpack_format(cls, runtime_config: RuntimeConfigurationObject) -> Optional[tuple]:
+        """
+        Returns the little-endian `struct` module format of this type and a function to convert the unpacked item
+        (None if the item is the decoded value), so consecutive fixed-width fields of a composite type are decoded
+        with a single `struct.Struct.unpack()` call. Types without a fixed-width format return None.
+
+        Parameters
+        ----------
+        runtime_config
+
+        Returns
+        -------
+        tuple of format and Callable or None, or None
+        """
+        return None
+
+    @classmethod
+    def check_selector_fields(cls, selector_tree: dict, field_names):
+        """
+        Raises `SelectorFieldNotFound` when `selector_tree` selects a field that is not one of `field_names`
+
+        Parameters
+        ----------
+        selector_tree: see `RuntimeConfigurationObject.build_selector_tree()`
+        field_names: names of the fields of a decoded value of this type
+        """
+        for field_name in selector_tree:
+            if field_name not in field_names:
+                raise SelectorFieldNotFound(f'Selected field "{field_name}" not found in <{cls.__name__}>')
+
+    @staticmethod
+    def project_value(value, selector_tree: Optional[dict]):
+        """
+        Returns only the fields of a decoded `value` selected in `selector_tree`. Selectors apply to the keys of a
+        dict and to the elements of a list; keys that are not present are omitted. A string value (e.g. an enum
+        variant without data) or None is returned as is. Raises `SelectorFieldNotFound` for other values, e.g. a tuple
+        or an integer, as they have no fields.
+
+        Parameters
+        ----------
+        value: decoded value
+        selector_tree: see `RuntimeConfigurationObject.build_selector_tree()`
+
+        Returns
+        -------
+        Projected value
+        """
+        if selector_tree is None:
+            return value
+
+        if isinstance(value, dict):
+            return {
+                key: ScaleType.project_value(field_value, selector_tree[key])
+                for key, field_value in value.items() if key in selector_tree
+            }
+
+        if type(value) is list:
+            return [ScaleType.project_value(element, selector_tree) for element in value]
+
+        if value is None or type(value) is str:
+            return value
+
+        raise SelectorFieldNotFound(
+            'Selected fields {} not found in {} value'.format(', '.join(selector_tree), type(value).__name__)
+        )
+
+    @classmethod
+    def skip(cls, data: ScaleBytes, metadata=None) -> int:
+        """
+        Advances the offset of `data` past an encoded value of this type without materialising it, see
+        `RuntimeConfigurationObject.skip()`
+
+        Parameters
+        ----------
+        data: ScaleBytes positioned at the start of the value
+        metadata: VersionedMetadata, required for e.g. skipping calls
+
+        Returns
+        -------
+        int: the encoded length of the skipped value
+        """
+        runtime_config = cls.runtime_config or RuntimeConfiguration()
+        return runtime_config.skip(cls, data, metadata=metadata)
+
 
 class ScalePrimitive(ScaleType, ABC):
     """
     A SCALE representation of a RUST primitive
     """
+    __slots__ = ()
+
     @classmethod
     def generate_type_decomposition(cls, _recursion_level: int = 0, max_recursion: int = TYPE_DECOMP_MAX_RECURSIVE):
         return cls.__name__.lower()
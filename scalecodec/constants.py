@@ -1 +1,3 @@
 TYPE_DECOMP_MAX_RECURSIVE = 9
+TYPE_STRING_CACHE_SIZE = 4096
+RUNTIME_CONFIGURATION_POOL_SIZE = 8
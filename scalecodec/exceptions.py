@@ -25,3 +25,7 @@ class InvalidScaleTypeValueException(Exception):
 
 class MetadataCallFunctionNotFound(ValueError):
     pass
+
+
+class SelectorFieldNotFound(ValueError):
+    pass
@@ -0,0 +1,248 @@
+# Python SCALE Codec Library
+#
+# Copyright 2018-2020 Stichting Polkascan (Polkascan Foundation).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+#  snapshot.py
+
+"""Persistent snapshots of portable registries, so runtime configurations can be rebuilt without decoding metadata.
+
+Snapshots are JSON files that index the types of the portable registry of V14+ metadata by id, path and offset in the
+SCALE encoded metadata. Applying a snapshot registers a placeholder per type; the definition of a type is only decoded
+from the metadata when its decoder class is first looked up.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import warnings
+from typing import Optional, Union, TYPE_CHECKING
+
+from scalecodec.base import LazyScaleInfoType, RuntimeConfigurationObject, ScaleBytes
+
+if TYPE_CHECKING:
+    from scalecodec.types import GenericMetadataVersioned
+
+# Increment when the layout of snapshots changes, existing snapshots are then ignored
+SNAPSHOT_FORMAT_VERSION = 2
+
+SNAPSHOT_FILE_EXTENSION = '.json'
+
+
+def get_metadata_bytes(metadata: Union[str, bytes, bytearray, ScaleBytes]) -> bytes:
+    if type(metadata) is ScaleBytes:
+        return bytes(metadata.data)
+    return bytes(ScaleBytes(metadata).data)
+
+
+def get_metadata_hash(metadata: Union[str, bytes, bytearray, ScaleBytes]) -> str:
+    """
+    Returns the hex encoded blake2b-256 hash of SCALE encoded metadata, used in the key of snapshots
+
+    Parameters
+    ----------
+    metadata
+
+    Returns
+    -------
+    str
+    """
+    return hashlib.blake2b(get_metadata_bytes(metadata), digest_size=32).hexdigest()
+
+
+def dump_registry_snapshot(metadata_obj: 'GenericMetadataVersioned', spec_version: int, metadata_hash: str, file):
+    """
+    Writes a snapshot of the portable registry of decoded V14+ metadata to given text file object
+
+    Parameters
+    ----------
+    metadata_obj: decoded metadata
+    spec_version: spec version of the runtime of the metadata
+    metadata_hash: hash of the SCALE encoded metadata, see `get_metadata_hash()`
+    file
+    """
+    if metadata_obj.portable_registry is None:
+        raise ValueError('Metadata does not contain a portable registry')
+
+    types = []
+
+    for portable_type in metadata_obj.portable_registry.value_object['types'].value_object:
+        path = portable_type.value['type'].get('path')
+        types.append([
+            portable_type.value['id'],
+            '::'.join(path).lower() if path else None,
+            portable_type.data_start_offset - metadata_obj.data_start_offset
+        ])
+
+    json.dump({
+        'format_version': SNAPSHOT_FORMAT_VERSION,
+        'spec_version': spec_version,
+        'metadata_hash': metadata_hash,
+        'extrinsic_type': metadata_obj[1][1]['extrinsic']['ty'].value,
+        'types': types
+    }, file, separators=(',', ':'))
+
+
+def load_registry_snapshot(file, runtime_config: RuntimeConfigurationObject,
+                           metadata: Union[str, bytes, bytearray, ScaleBytes], spec_version: int = None,
+                           metadata_hash: str = None, prefix: str = 'scale_info'):
+    """
+    Reads a snapshot written by `dump_registry_snapshot()` from given text file object and applies the portable
+    registry to `runtime_config`, like `add_portable_registry()` with the decoded metadata
+
+    Parameters
+    ----------
+    file
+    runtime_config
+    metadata: the SCALE encoded metadata of the snapshot, definitions of types are decoded from it on first lookup
+    spec_version: if set, the snapshot must have been made for this spec version
+    metadata_hash: if set, the snapshot must have been made of metadata with this hash
+    prefix: prefix of the portable registry in the type registry
+    """
+    snapshot = json.load(file)
+
+    if type(snapshot) is not dict or snapshot.get('format_version') != SNAPSHOT_FORMAT_VERSION:
+        raise ValueError('Unsupported snapshot format version')
+
+    if spec_version is not None and snapshot.get('spec_version') != spec_version:
+        raise ValueError('Snapshot does not match spec version')
+
+    if metadata_hash is not None and snapshot.get('metadata_hash') != metadata_hash:
+        raise ValueError('Snapshot does not match metadata hash')
+
+    data = bytearray(get_metadata_bytes(metadata))
+    lazy_types = []
+
+    # Validate all entries before the type registry is changed
+    for type_id, path_string, offset in snapshot['types']:
+        if type(type_id) is not int or type(offset) is not int or not 0 <= offset < len(data) or \
+                (path_string is not None and type(path_string) is not str):
+            raise ValueError(f'Invalid type entry {[type_id, path_string, offset]} in snapshot')
+
+        lazy_types.append(
+            LazyScaleInfoType(f'{prefix}::{type_id}', None, prefix, path_string=path_string, data=data, offset=offset)
+        )
+
+    if type(snapshot['extrinsic_type']) is not int:
+        raise ValueError('Invalid extrinsic type in snapshot')
+
+    runtime_config.clear_compiled_plans()
+
+    for lazy_type in lazy_types:
+        runtime_config.add_lazy_scale_info_type(lazy_type)
+
+    runtime_config.clear_compiled_plans()
+    runtime_config.update_from_extrinsic_type(snapshot['extrinsic_type'], prefix=prefix)
+
+
+class MetadataSnapshotCache:
+    """
+    Directory of portable registry snapshots keyed by spec version and metadata hash. Metadata that is not present in
+    the cache is decoded and a snapshot is written, so subsequent processes can skip decoding.
+    """
+
+    def __init__(self, cache_dir: str):
+        """
+        Parameters
+        ----------
+        cache_dir: directory of the snapshot files, created when it does not exist
+        """
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def get_snapshot_path(self, spec_version: int, metadata_hash: str) -> str:
+        return os.path.join(self.cache_dir, f'{spec_version}-{metadata_hash}{SNAPSHOT_FILE_EXTENSION}')
+
+    def add_portable_registry(self, runtime_config: RuntimeConfigurationObject,
+                              metadata: Union[str, bytes, bytearray, ScaleBytes], spec_version: int) \
+            -> Optional['GenericMetadataVersioned']:
+        """
+        Applies the portable registry of given SCALE encoded metadata to `runtime_config`, from its snapshot when
+        present in the cache. Otherwise the metadata is decoded with `runtime_config` and a snapshot is stored.
+        Snapshots that cannot be loaded (e.g. of an older format) are replaced.
+
+        Metadata without portable registry (before V14) is decoded and not stored.
+
+        Parameters
+        ----------
+        runtime_config
+        metadata
+        spec_version: spec version of the runtime of the metadata
+
+        Returns
+        -------
+        The decoded metadata when it was decoded, None when the portable registry was applied from a snapshot
+        """
+        metadata_bytes = get_metadata_bytes(metadata)
+        metadata_hash = hashlib.blake2b(metadata_bytes, digest_size=32).hexdigest()
+        snapshot_path = self.get_snapshot_path(spec_version, metadata_hash)
+
+        if os.path.exists(snapshot_path):
+            try:
+                with open(snapshot_path, encoding='utf-8') as snapshot_file:
+                    load_registry_snapshot(snapshot_file, runtime_config, metadata_bytes, spec_version, metadata_hash)
+                self.hits += 1
+                return None
+            except Exception as e:
+                warnings.warn(f'Ignoring snapshot "{snapshot_path}": {e}')
+
+        self.misses += 1
+
+        metadata_obj = runtime_config.create_scale_object('MetadataVersioned', data=ScaleBytes(metadata_bytes))
+        metadata_obj.decode()
+
+        if metadata_obj.portable_registry is not None:
+            runtime_config.add_portable_registry(metadata_obj)
+            self.store(metadata_obj, spec_version, metadata_hash)
+
+        return metadata_obj
+
+    def store(self, metadata_obj: 'GenericMetadataVersioned', spec_version: int, metadata_hash: str):
+        """
+        Writes the snapshot of the portable registry of decoded metadata; the file is replaced atomically, so
+        concurrent processes never read a partially written snapshot
+
+        Parameters
+        ----------
+        metadata_obj
+        spec_version
+        metadata_hash
+        """
+        snapshot_file = tempfile.NamedTemporaryFile(
+            'w', dir=self.cache_dir, suffix='.tmp', delete=False, encoding='utf-8'
+        )
+        try:
+            with snapshot_file:
+                dump_registry_snapshot(metadata_obj, spec_version, metadata_hash, snapshot_file)
+            os.replace(snapshot_file.name, self.get_snapshot_path(spec_version, metadata_hash))
+        except BaseException:
+            os.unlink(snapshot_file.name)
+            raise
+
+    def get_cache_info(self) -> dict:
+        """
+        Returns statistics of the snapshot cache
+
+        Returns
+        -------
+        dict with the amount of snapshot 'hits' and 'misses'
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses
+        }
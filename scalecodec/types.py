@@ -18,14 +18,20 @@ import struct
 import warnings
 from datetime import datetime
 from hashlib import blake2b
-from typing import Union, Optional
+from typing import Union, Optional, Callable, Iterator
 
 from scalecodec.constants import TYPE_DECOMP_MAX_RECURSIVE
 from scalecodec.utils.ss58 import ss58_decode_account_index, ss58_decode, ss58_encode, is_valid_ss58_address
 
-from scalecodec.base import ScaleType, ScaleBytes, ScalePrimitive
+from scalecodec.base import ScaleType, ScaleBytes, ScalePrimitive, LazyElements, LazyStruct, LazySequence
 from scalecodec.exceptions import InvalidScaleTypeValueException, MetadataCallFunctionNotFound
 from scalecodec.utils.math import trailing_zeros, next_power_of_two
+from scalecodec.utils.type_parser import split_type_params
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 class Compact(ScaleType):
@@ -33,6 +39,8 @@ class Compact(ScaleType):
     A space efficient type to encoding fixed-width integers
     """
 
+    __slots__ = ('compact_length', 'compact_bytes')
+
     def __init__(self, data=None, **kwargs):
         self.compact_length = 0
         self.compact_bytes = None
@@ -57,7 +65,7 @@ class Compact(ScaleType):
         if self.compact_length == 1:
             self.compact_bytes = compact_byte
         elif self.compact_length in [2, 4]:
-            self.compact_bytes = compact_byte + self.get_next_bytes(self.compact_length - 1)
+            self.compact_bytes = bytearray(compact_byte) + self.get_next_bytes(self.compact_length - 1)
         else:
             self.compact_bytes = self.get_next_bytes(self.compact_length - 1)
 
@@ -102,12 +110,109 @@ class Compact(ScaleType):
         scale_obj = cls.runtime_config.create_scale_object(cls.sub_type)
         return scale_obj.generate_type_decomposition(_recursion_level=_recursion_level + 1, max_recursion=max_recursion)
 
+    @staticmethod
+    def decode_compact_int(data: ScaleBytes) -> int:
+        """
+        Decodes a compact encoded integer directly from given ScaleBytes
+
+        Parameters
+        ----------
+        data
+
+        Returns
+        -------
+        int
+        """
+        compact_byte = data.get_next_bytes(1)
+        try:
+            first_byte = compact_byte[0]
+        except IndexError:
+            raise InvalidScaleTypeValueException("Invalid byte for Compact")
+
+        byte_mod = first_byte % 4
+
+        if byte_mod == 0:
+            return first_byte >> 2
+        elif byte_mod == 1:
+            return (first_byte | int.from_bytes(data.get_next_bytes(1), byteorder='little') << 8) >> 2
+        elif byte_mod == 2:
+            return (first_byte | int.from_bytes(data.get_next_bytes(3), byteorder='little') << 8) >> 2
+        else:
+            return int.from_bytes(data.get_next_bytes((first_byte >> 2) + 4), byteorder='little')
+
+    @classmethod
+    def compile_decode_plan(cls, runtime_config):
+        decode_compact_int = cls.decode_compact_int
+
+        def decode_plan(data, metadata):
+            return decode_compact_int(data)
+
+        return decode_plan
+
+    @classmethod
+    def compile_skip_plan(cls, runtime_config):
+        def skip_plan(data, metadata):
+            compact_byte = data.get_next_bytes(1)
+            try:
+                first_byte = compact_byte[0]
+            except IndexError:
+                raise InvalidScaleTypeValueException("Invalid byte for Compact")
+
+            byte_mod = first_byte % 4
+
+            if byte_mod == 1:
+                data.skip_bytes(1)
+            elif byte_mod == 2:
+                data.skip_bytes(3)
+            elif byte_mod == 3:
+                data.skip_bytes((first_byte >> 2) + 4)
+
+        return skip_plan
+
+    @classmethod
+    def compile_encode_plan(cls, runtime_config):
+        def encode_plan(value, buffer, metadata):
+            buffer += cls.encode_compact_int(int(value))
+
+        return encode_plan
+
+    @staticmethod
+    def encode_compact_int(value: int) -> bytes:
+        """
+        Encodes given integer as a Compact
+
+        Parameters
+        ----------
+        value
+
+        Returns
+        -------
+        bytes
+        """
+        if value <= 0b00111111:
+            return int(value << 2).to_bytes(1, 'little')
+
+        elif value <= 0b0011111111111111:
+            return int((value << 2) | 0b01).to_bytes(2, 'little')
+
+        elif value <= 0b00111111111111111111111111111111:
+            return int((value << 2) | 0b10).to_bytes(4, 'little')
+
+        else:
+            for bytes_length in range(4, 68):
+                if 2 ** (8 * (bytes_length - 1)) <= value < 2 ** (8 * bytes_length):
+                    return ((bytes_length - 4) << 2 | 0b11).to_bytes(1, 'little') + value.to_bytes(bytes_length, 'little')
+            else:
+                raise ValueError('{} out of range'.format(value))
+
 
 class CompactU32(Compact):
     """
     Specialized composite implementation for performance improvement
     """
 
+    __slots__ = ()
+
     type_string = 'Compact<u32>'
 
     def process(self):
@@ -137,6 +242,23 @@ class CompactU32(Compact):
             else:
                 raise ValueError('{} out of range'.format(value))
 
+    @classmethod
+    def compile_decode_plan(cls, runtime_config):
+        return super().compile_decode_plan(runtime_config)
+
+    @classmethod
+    def compile_skip_plan(cls, runtime_config):
+        return super().compile_skip_plan(runtime_config)
+
+    @classmethod
+    def compile_encode_plan(cls, runtime_config):
+        encode_compact_int = Compact.encode_compact_int
+
+        def encode_plan(value, buffer, metadata):
+            buffer += encode_compact_int(value)
+
+        return encode_plan
+
 
 class Option(ScaleType):
     """
@@ -177,6 +299,80 @@ class Option(ScaleType):
             _recursion_level=_recursion_level + 1, max_recursion=max_recursion
         )
 
+    @classmethod
+    def compile_decode_plan(cls, runtime_config):
+        sub_type_plan = runtime_config.get_decode_plan(cls.sub_type) if cls.sub_type else None
+
+        def decode_plan(data, metadata):
+            if data.get_next_bytes(1) != b'\x00' and sub_type_plan is not None:
+                return sub_type_plan(data, None)
+            return None
+
+        return decode_plan
+
+    @classmethod
+    def compile_iterative_plan(cls, runtime_config):
+        sub_type_plan = runtime_config.get_iterative_plan(cls.sub_type) if cls.sub_type else None
+
+        if sub_type_plan is None:
+            return None
+
+        def iterative_plan(data, metadata):
+            if data.get_next_bytes(1) != b'\x00':
+                return (yield sub_type_plan)
+            return None
+
+        return iterative_plan
+
+    @classmethod
+    def compile_skip_plan(cls, runtime_config):
+        if not cls.sub_type:
+            return 1
+
+        sub_type_plan = runtime_config.get_skip_plan(cls.sub_type)
+
+        def skip_plan(data, metadata):
+            if data.get_next_bytes(1) != b'\x00':
+                if type(sub_type_plan) is int:
+                    data.skip_bytes(sub_type_plan)
+                else:
+                    sub_type_plan(data, None)
+
+        return skip_plan
+
+    @classmethod
+    def compile_projection_plan(cls, runtime_config, selector_tree):
+        if not cls.sub_type:
+            raise NotImplementedError('Option without sub type')
+
+        sub_type_plan = runtime_config.get_projection_plan(cls.sub_type, selector_tree)
+
+        def projection_plan(data, metadata):
+            if data.get_next_bytes(1) != b'\x00':
+                return sub_type_plan(data, None)
+            return None
+
+        return projection_plan
+
+    @classmethod
+    def compile_encode_plan(cls, runtime_config):
+        if not cls.sub_type:
+            def encode_plan(value, buffer, metadata):
+                buffer.append(0)
+
+            return encode_plan
+
+        sub_type_plan = runtime_config.get_encode_plan(cls.sub_type)
+
+        def encode_plan(value, buffer, metadata):
+            if value is not None:
+                buffer.append(1)
+                sub_type_plan(value, buffer, None)
+            else:
+                buffer.append(0)
+
+        return encode_plan
+
 
 class Bytes(ScaleType):
     """
@@ -192,7 +388,7 @@ class Bytes(ScaleType):
         self.value_object = value
 
         try:
-            return value.decode()
+            return str(value, 'utf-8')
         except UnicodeDecodeError:
             return '0x{}'.format(value.hex())
 
@@ -220,6 +416,50 @@ class Bytes(ScaleType):
     def serialize(self):
         return f'0x{self.value_object.hex()}'
 
+    @classmethod
+    def compile_decode_plan(cls, runtime_config):
+        decode_compact_int = Compact.decode_compact_int
+
+        def decode_plan(data, metadata):
+            value = data.get_next_bytes(decode_compact_int(data))
+            try:
+                return str(value, 'utf-8')
+            except UnicodeDecodeError:
+                return '0x{}'.format(value.hex())
+
+        return decode_plan
+
+    @classmethod
+    def compile_skip_plan(cls, runtime_config):
+        decode_compact_int = Compact.decode_compact_int
+
+        def skip_plan(data, metadata):
+            data.skip_bytes(decode_compact_int(data))
+
+        return skip_plan
+
+    @classmethod
+    def compile_encode_plan(cls, runtime_config):
+        encode_compact_int = Compact.encode_compact_int
+
+        def encode_plan(value, buffer, metadata):
+            if type(value) is str:
+                if value[0:2] == '0x':
+                    value = bytes.fromhex(value[2:])
+                else:
+                    value = value.encode()
+
+            elif type(value) in (bytearray, list):
+                value = bytes(value)
+
+            if type(value) is not bytes:
+                raise ValueError(f'Cannot encode type "{type(value)}"')
+
+            buffer += encode_compact_int(len(value))
+            buffer += value
+
+        return encode_plan
+
 
 class Str(Bytes):
     def serialize(self):
@@ -251,6 +491,40 @@ class OptionBytes(ScaleType):
 
         return ScaleBytes('0x00')
 
+    @classmethod
+    def compile_decode_plan(cls, runtime_config):
+        bytes_plan = runtime_config.get_decode_plan('Bytes')
+
+        def decode_plan(data, metadata):
+            if data.get_next_bytes(1) != b'\x00':
+                return bytes_plan(data, None)
+            return None
+
+        return decode_plan
+
+    @classmethod
+    def compile_skip_plan(cls, runtime_config):
+        decode_compact_int = Compact.decode_compact_int
+
+        def skip_plan(data, metadata):
+            if data.get_next_bytes(1) != b'\x00':
+                data.skip_bytes(decode_compact_int(data))
+
+        return skip_plan
+
+    @classmethod
+    def compile_encode_plan(cls, runtime_config):
+        bytes_plan = runtime_config.get_encode_plan('Bytes')
+
+        def encode_plan(value, buffer, metadata):
+            if value is not None:
+                buffer.append(1)
+                bytes_plan(value, buffer, None)
+            else:
+                buffer.append(0)
+
+        return encode_plan
+
 
 class HexBytes(ScaleType):
 
@@ -276,6 +550,39 @@ class HexBytes(ScaleType):
         data += value
         return data
 
+    @classmethod
+    def compile_decode_plan(cls, runtime_config):
+        decode_compact_int = Compact.decode_compact_int
+
+        def decode_plan(data, metadata):
+            return '0x{}'.format(data.get_next_bytes(decode_compact_int(data)).hex())
+
+        return decode_plan
+
+    @classmethod
+    def compile_skip_plan(cls, runtime_config):
+        decode_compact_int = Compact.decode_compact_int
+
+        def skip_plan(data, metadata):
+            data.skip_bytes(decode_compact_int(data))
+
+        return skip_plan
+
+    @classmethod
+    def compile_encode_plan(cls, runtime_config):
+        encode_compact_int = Compact.encode_compact_int
+
+        def encode_plan(value, buffer, metadata):
+            if value[0:2] != '0x':
+                raise ValueError('HexBytes value should start with "0x"')
+
+            value = bytes.fromhex(value[2:])
+
+            buffer += encode_compact_int(len(value))
+            buffer += value
+
+        return encode_plan
+
 
 class CallBytes(ScaleType):
 
@@ -303,6 +610,8 @@ class U8(ScalePrimitive):
     Unsigned 8-bit int type, encoded in little-endian (LE) format
     """
 
+    __slots__ = ()
+
     def process(self):
         return self.get_next_u8()
 
@@ -313,12 +622,45 @@ class U8(ScalePrimitive):
         else:
             raise ValueError('{} out of range for u8'.format(value))
 
+    @classmethod
+    def compile_decode_plan(cls, runtime_config):
+        def decode_plan(data, metadata):
+            return int.from_bytes(data.get_next_bytes(1), byteorder='little')
+
+        return decode_plan
+
+    @classmethod
+    def compile_skip_plan(cls, runtime_config):
+        return 1
+
+    @classmethod
+    def compile_numpy_dtype(cls, runtime_config):
+        return 'u1'
+
+    @classmethod
+    def compile_unpack_format(cls, runtime_config):
+        return 'B', None
+
+    @classmethod
+    def compile_encode_plan(cls, runtime_config):
+        def encode_plan(value, buffer, metadata):
+            int_value = int(value)
+
+            if 0 <= int_value <= 2**8 - 1:
+                buffer += int_value.to_bytes(1, 'little')
+            else:
+                raise ValueError('{} out of range for u8'.format(value))
+
+        return encode_plan
+
 
 class U16(ScalePrimitive):
     """
     Unsigned 16-bit int type, encoded in little-endian (LE) format
     """
 
+    __slots__ = ()
+
     def process(self):
         return int.from_bytes(self.get_next_bytes(2), byteorder='little')
 
@@ -329,11 +671,45 @@ class U16(ScalePrimitive):
         else:
             raise ValueError('{} out of range for u16'.format(value))
 
+    @classmethod
+    def compile_decode_plan(cls, runtime_config):
+        def decode_plan(data, metadata):
+            return int.from_bytes(data.get_next_bytes(2), byteorder='little')
+
+        return decode_plan
+
+    @classmethod
+    def compile_skip_plan(cls, runtime_config):
+        return 2
+
+    @classmethod
+    def compile_numpy_dtype(cls, runtime_config):
+        return '<u2'
+
+    @classmethod
+    def compile_unpack_format(cls, runtime_config):
+        return 'H', None
+
+    @classmethod
+    def compile_encode_plan(cls, runtime_config):
+        def encode_plan(value, buffer, metadata):
+            int_value = int(value)
+
+            if 0 <= int_value <= 2**16 - 1:
+                buffer += int_value.to_bytes(2, 'little')
+            else:
+                raise ValueError('{} out of range for u16'.format(value))
+
+        return encode_plan
+
 
 class U32(ScalePrimitive):
     """
     Unsigned 32-bit int type, encoded in little-endian (LE) format
     """
+
+    __slots__ = ()
+
     def process(self):
         return int.from_bytes(self.get_next_bytes(4), byteorder='little')
 
@@ -344,11 +720,45 @@ class U32(ScalePrimitive):
         else:
             raise ValueError('{} out of range for u32'.format(value))
 
+    @classmethod
+    def compile_decode_plan(cls, runtime_config):
+        def decode_plan(data, metadata):
+            return int.from_bytes(data.get_next_bytes(4), byteorder='little')
+
+        return decode_plan
+
+    @classmethod
+    def compile_skip_plan(cls, runtime_config):
+        return 4
+
+    @classmethod
+    def compile_numpy_dtype(cls, runtime_config):
+        return '<u4'
+
+    @classmethod
+    def compile_unpack_format(cls, runtime_config):
+        return 'I', None
+
+    @classmethod
+    def compile_encode_plan(cls, runtime_config):
+        def encode_plan(value, buffer, metadata):
+            int_value = int(value)
+
+            if 0 <= int_value <= 2**32 - 1:
+                buffer += int_value.to_bytes(4, 'little')
+            else:
+                raise ValueError('{} out of range for u32'.format(value))
+
+        return encode_plan
+
 
 class U64(ScalePrimitive):
     """
     Unsigned 64-bit int type, encoded in little-endian (LE) format
     """
+
+    __slots__ = ()
+
     def process(self):
         return int(int.from_bytes(self.get_next_bytes(8), byteorder='little'))
 
@@ -359,12 +769,45 @@ class U64(ScalePrimitive):
         else:
             raise ValueError('{} out of range for u64'.format(value))
 
+    @classmethod
+    def compile_decode_plan(cls, runtime_config):
+        def decode_plan(data, metadata):
+            return int.from_bytes(data.get_next_bytes(8), byteorder='little')
+
+        return decode_plan
+
+    @classmethod
+    def compile_skip_plan(cls, runtime_config):
+        return 8
+
+    @classmethod
+    def compile_numpy_dtype(cls, runtime_config):
+        return '<u8'
+
+    @classmethod
+    def compile_unpack_format(cls, runtime_config):
+        return 'Q', None
+
+    @classmethod
+    def compile_encode_plan(cls, runtime_config):
+        def encode_plan(value, buffer, metadata):
+            int_value = int(value)
+
+            if 0 <= int_value <= 2**64 - 1:
+                buffer += int_value.to_bytes(8, 'little')
+            else:
+                raise ValueError('{} out of range for u64'.format(value))
+
+        return encode_plan
+
 
 class U128(ScalePrimitive):
     """
     Unsigned 128-bit int type, encoded in little-endian (LE) format
     """
 
+    __slots__ = ()
+
     def process(self):
         return int(int.from_bytes(self.get_next_bytes(16), byteorder='little'))
 
@@ -375,12 +818,44 @@ class U128(ScalePrimitive):
         else:
             raise ValueError('{} out of range for u128'.format(value))
 
+    @classmethod
+    def compile_decode_plan(cls, runtime_config):
+        def decode_plan(data, metadata):
+            return int.from_bytes(data.get_next_bytes(16), byteorder='little')
+
+        return decode_plan
+
+    @classmethod
+    def compile_skip_plan(cls, runtime_config):
+        return 16
+
+    @classmethod
+    def compile_unpack_format(cls, runtime_config):
+        def convert(value):
+            return int.from_bytes(value, byteorder='little')
+
+        return '16s', convert
+
+    @classmethod
+    def compile_encode_plan(cls, runtime_config):
+        def encode_plan(value, buffer, metadata):
+            int_value = int(value)
+
+            if 0 <= int_value <= 2**128 - 1:
+                buffer += int_value.to_bytes(16, 'little')
+            else:
+                raise ValueError('{} out of range for u128'.format(value))
+
+        return encode_plan
+
 
 class U256(ScalePrimitive):
     """
     Unsigned 256-bit int type, encoded in little-endian (LE) format
     """
 
+    __slots__ = ()
+
     def process(self):
         return int(int.from_bytes(self.get_next_bytes(32), byteorder='little'))
 
@@ -391,11 +866,44 @@ class U256(ScalePrimitive):
         else:
             raise ValueError('{} out of range for u256'.format(value))
 
+    @classmethod
+    def compile_decode_plan(cls, runtime_config):
+        def decode_plan(data, metadata):
+            return int.from_bytes(data.get_next_bytes(32), byteorder='little')
+
+        return decode_plan
+
+    @classmethod
+    def compile_skip_plan(cls, runtime_config):
+        return 32
+
+    @classmethod
+    def compile_unpack_format(cls, runtime_config):
+        def convert(value):
+            return int.from_bytes(value, byteorder='little')
+
+        return '32s', convert
+
+    @classmethod
+    def compile_encode_plan(cls, runtime_config):
+        def encode_plan(value, buffer, metadata):
+            int_value = int(value)
+
+            if 0 <= int_value <= 2**256 - 1:
+                buffer += int_value.to_bytes(32, 'little')
+            else:
+                raise ValueError('{} out of range for u256'.format(value))
+
+        return encode_plan
+
 
 class I8(ScalePrimitive):
     """
     Signed 8-bit int type, encoded in little-endian (LE) format
     """
+
+    __slots__ = ()
+
     def process(self):
         return int.from_bytes(self.get_next_bytes(1), byteorder='little', signed=True)
 
@@ -406,11 +914,45 @@ class I8(ScalePrimitive):
         else:
             raise ValueError('{} out of range for i8'.format(value))
 
+    @classmethod
+    def compile_decode_plan(cls, runtime_config):
+        def decode_plan(data, metadata):
+            return int.from_bytes(data.get_next_bytes(1), byteorder='little', signed=True)
+
+        return decode_plan
+
+    @classmethod
+    def compile_skip_plan(cls, runtime_config):
+        return 1
+
+    @classmethod
+    def compile_numpy_dtype(cls, runtime_config):
+        return 'i1'
+
+    @classmethod
+    def compile_unpack_format(cls, runtime_config):
+        return 'b', None
+
+    @classmethod
+    def compile_encode_plan(cls, runtime_config):
+        def encode_plan(value, buffer, metadata):
+            int_value = int(value)
+
+            if -128 <= int_value <= 127:
+                buffer += int_value.to_bytes(1, 'little', signed=True)
+            else:
+                raise ValueError('{} out of range for i8'.format(value))
+
+        return encode_plan
+
 
 class I16(ScalePrimitive):
     """
     Signed 16-bit int type, encoded in little-endian (LE) format
     """
+
+    __slots__ = ()
+
     def process(self):
         return int.from_bytes(self.get_next_bytes(2), byteorder='little', signed=True)
 
@@ -421,11 +963,45 @@ class I16(ScalePrimitive):
         else:
             raise ValueError('{} out of range for i16'.format(value))
 
+    @classmethod
+    def compile_decode_plan(cls, runtime_config):
+        def decode_plan(data, metadata):
+            return int.from_bytes(data.get_next_bytes(2), byteorder='little', signed=True)
 
-class I32(ScalePrimitive):
-    """
-    Signed 32-bit int type, encoded in little-endian (LE) format
+        return decode_plan
+
+    @classmethod
+    def compile_skip_plan(cls, runtime_config):
+        return 2
+
+    @classmethod
+    def compile_numpy_dtype(cls, runtime_config):
+        return '<i2'
+
+    @classmethod
+    def compile_unpack_format(cls, runtime_config):
+        return 'h', None
+
+    @classmethod
+    def compile_encode_plan(cls, runtime_config):
+        def encode_plan(value, buffer, metadata):
+            int_value = int(value)
+
+            if -32768 <= int_value <= 32767:
+                buffer += int_value.to_bytes(2, 'little', signed=True)
+            else:
+                raise ValueError('{} out of range for i16'.format(value))
+
+        return encode_plan
+
+
+class I32(ScalePrimitive):
+    """
+    Signed 32-bit int type, encoded in little-endian (LE) format
     """
+
+    __slots__ = ()
+
     def process(self):
         return int.from_bytes(self.get_next_bytes(4), byteorder='little', signed=True)
 
@@ -436,11 +1012,45 @@ class I32(ScalePrimitive):
         else:
             raise ValueError('{} out of range for i32'.format(value))
 
+    @classmethod
+    def compile_decode_plan(cls, runtime_config):
+        def decode_plan(data, metadata):
+            return int.from_bytes(data.get_next_bytes(4), byteorder='little', signed=True)
+
+        return decode_plan
+
+    @classmethod
+    def compile_skip_plan(cls, runtime_config):
+        return 4
+
+    @classmethod
+    def compile_numpy_dtype(cls, runtime_config):
+        return '<i4'
+
+    @classmethod
+    def compile_unpack_format(cls, runtime_config):
+        return 'i', None
+
+    @classmethod
+    def compile_encode_plan(cls, runtime_config):
+        def encode_plan(value, buffer, metadata):
+            int_value = int(value)
+
+            if -2147483648 <= int_value <= 2147483647:
+                buffer += int_value.to_bytes(4, 'little', signed=True)
+            else:
+                raise ValueError('{} out of range for i32'.format(value))
+
+        return encode_plan
+
 
 class I64(ScalePrimitive):
     """
     Signed 64-bit int type, encoded in little-endian (LE) format
     """
+
+    __slots__ = ()
+
     def process(self):
         return int.from_bytes(self.get_next_bytes(8), byteorder='little', signed=True)
 
@@ -451,11 +1061,45 @@ class I64(ScalePrimitive):
         else:
             raise ValueError('{} out of range for i64'.format(value))
 
+    @classmethod
+    def compile_decode_plan(cls, runtime_config):
+        def decode_plan(data, metadata):
+            return int.from_bytes(data.get_next_bytes(8), byteorder='little', signed=True)
+
+        return decode_plan
+
+    @classmethod
+    def compile_skip_plan(cls, runtime_config):
+        return 8
+
+    @classmethod
+    def compile_numpy_dtype(cls, runtime_config):
+        return '<i8'
+
+    @classmethod
+    def compile_unpack_format(cls, runtime_config):
+        return 'q', None
+
+    @classmethod
+    def compile_encode_plan(cls, runtime_config):
+        def encode_plan(value, buffer, metadata):
+            int_value = int(value)
+
+            if -2**64 <= int_value <= 2**64-1:
+                buffer += int_value.to_bytes(8, 'little', signed=True)
+            else:
+                raise ValueError('{} out of range for i64'.format(value))
+
+        return encode_plan
+
 
 class I128(ScalePrimitive):
     """
     Signed 128-bit int type, encoded in little-endian (LE) format
     """
+
+    __slots__ = ()
+
     def process(self):
         return int.from_bytes(self.get_next_bytes(16), byteorder='little', signed=True)
 
@@ -466,11 +1110,44 @@ class I128(ScalePrimitive):
         else:
             raise ValueError('{} out of range for i128'.format(value))
 
+    @classmethod
+    def compile_decode_plan(cls, runtime_config):
+        def decode_plan(data, metadata):
+            return int.from_bytes(data.get_next_bytes(16), byteorder='little', signed=True)
+
+        return decode_plan
+
+    @classmethod
+    def compile_skip_plan(cls, runtime_config):
+        return 16
+
+    @classmethod
+    def compile_unpack_format(cls, runtime_config):
+        def convert(value):
+            return int.from_bytes(value, byteorder='little', signed=True)
+
+        return '16s', convert
+
+    @classmethod
+    def compile_encode_plan(cls, runtime_config):
+        def encode_plan(value, buffer, metadata):
+            int_value = int(value)
+
+            if -2**128 <= int_value <= 2**128-1:
+                buffer += int_value.to_bytes(16, 'little', signed=True)
+            else:
+                raise ValueError('{} out of range for i128'.format(value))
+
+        return encode_plan
+
 
 class I256(ScalePrimitive):
     """
     Signed 256-bit int type, encoded in little-endian (LE) format
     """
+
+    __slots__ = ()
+
     def process(self):
         return int.from_bytes(self.get_next_bytes(32), byteorder='little', signed=True)
 
@@ -481,6 +1158,36 @@ class I256(ScalePrimitive):
         else:
             raise ValueError('{} out of range for i256'.format(value))
 
+    @classmethod
+    def compile_decode_plan(cls, runtime_config):
+        def decode_plan(data, metadata):
+            return int.from_bytes(data.get_next_bytes(32), byteorder='little', signed=True)
+
+        return decode_plan
+
+    @classmethod
+    def compile_skip_plan(cls, runtime_config):
+        return 32
+
+    @classmethod
+    def compile_unpack_format(cls, runtime_config):
+        def convert(value):
+            return int.from_bytes(value, byteorder='little', signed=True)
+
+        return '32s', convert
+
+    @classmethod
+    def compile_encode_plan(cls, runtime_config):
+        def encode_plan(value, buffer, metadata):
+            int_value = int(value)
+
+            if -2**256 <= int_value <= 2**256-1:
+                buffer += int_value.to_bytes(32, 'little', signed=True)
+            else:
+                raise ValueError('{} out of range for i256'.format(value))
+
+        return encode_plan
+
 
 class F32(ScalePrimitive):
 
@@ -493,6 +1200,35 @@ class F32(ScalePrimitive):
 
         return ScaleBytes(struct.pack('f', value))
 
+    @classmethod
+    def compile_decode_plan(cls, runtime_config):
+        def decode_plan(data, metadata):
+            return struct.unpack('f', data.get_next_bytes(4))[0]
+
+        return decode_plan
+
+    @classmethod
+    def compile_skip_plan(cls, runtime_config):
+        return 4
+
+    @classmethod
+    def compile_numpy_dtype(cls, runtime_config):
+        return '<f4'
+
+    @classmethod
+    def compile_unpack_format(cls, runtime_config):
+        return 'f', None
+
+    @classmethod
+    def compile_encode_plan(cls, runtime_config):
+        def encode_plan(value, buffer, metadata):
+            if type(value) is not float:
+                raise ValueError(f'{value} is not a float')
+
+            buffer += struct.pack('f', value)
+
+        return encode_plan
+
 
 class F64(ScalePrimitive):
 
@@ -505,11 +1241,43 @@ class F64(ScalePrimitive):
 
         return ScaleBytes(struct.pack('d', value))
 
+    @classmethod
+    def compile_decode_plan(cls, runtime_config):
+        def decode_plan(data, metadata):
+            return struct.unpack('d', data.get_next_bytes(8))[0]
+
+        return decode_plan
+
+    @classmethod
+    def compile_skip_plan(cls, runtime_config):
+        return 8
+
+    @classmethod
+    def compile_numpy_dtype(cls, runtime_config):
+        return '<f8'
+
+    @classmethod
+    def compile_unpack_format(cls, runtime_config):
+        return 'd', None
+
+    @classmethod
+    def compile_encode_plan(cls, runtime_config):
+        def encode_plan(value, buffer, metadata):
+            if type(value) is not float:
+                raise ValueError(f'{value} is not a float')
+
+            buffer += struct.pack('d', value)
+
+        return encode_plan
+
 
 class H160(ScalePrimitive):
     """
     Fixed-size uninterpreted hash type with 20 bytes (160 bits) size.
     """
+
+    __slots__ = ()
+
     def process(self):
         return '0x{}'.format(self.get_next_bytes(20).hex())
 
@@ -518,11 +1286,41 @@ class H160(ScalePrimitive):
             raise ValueError('Value should start with "0x" and should be 20 bytes long')
         return ScaleBytes(value)
 
+    @classmethod
+    def compile_decode_plan(cls, runtime_config):
+        def decode_plan(data, metadata):
+            return '0x{}'.format(data.get_next_bytes(20).hex())
+
+        return decode_plan
+
+    @classmethod
+    def compile_skip_plan(cls, runtime_config):
+        return 20
+
+    @classmethod
+    def compile_unpack_format(cls, runtime_config):
+        def convert(value):
+            return '0x{}'.format(value.hex())
+
+        return '20s', convert
+
+    @classmethod
+    def compile_encode_plan(cls, runtime_config):
+        def encode_plan(value, buffer, metadata):
+            if value[0:2] != '0x' or len(value) != 42:
+                raise ValueError('Value should start with "0x" and should be 20 bytes long')
+            buffer += bytes.fromhex(value[2:])
+
+        return encode_plan
+
 
 class H256(ScalePrimitive):
     """
     Fixed-size uninterpreted hash type with 32 bytes (256 bits) size.
     """
+
+    __slots__ = ()
+
     def process(self):
         return '0x{}'.format(self.get_next_bytes(32).hex())
 
@@ -531,11 +1329,41 @@ class H256(ScalePrimitive):
             raise ValueError('Value should start with "0x" and should be 32 bytes long')
         return ScaleBytes(value)
 
+    @classmethod
+    def compile_decode_plan(cls, runtime_config):
+        def decode_plan(data, metadata):
+            return '0x{}'.format(data.get_next_bytes(32).hex())
+
+        return decode_plan
+
+    @classmethod
+    def compile_skip_plan(cls, runtime_config):
+        return 32
+
+    @classmethod
+    def compile_unpack_format(cls, runtime_config):
+        def convert(value):
+            return '0x{}'.format(value.hex())
+
+        return '32s', convert
+
+    @classmethod
+    def compile_encode_plan(cls, runtime_config):
+        def encode_plan(value, buffer, metadata):
+            if value[0:2] != '0x' or len(value) != 66:
+                raise ValueError('Value should start with "0x" and should be 32 bytes long')
+            buffer += bytes.fromhex(value[2:])
+
+        return encode_plan
+
 
 class H512(ScalePrimitive):
     """
     Fixed-size uninterpreted hash type with 64 bytes (512 bits) size.
     """
+
+    __slots__ = ()
+
     def process(self):
         return '0x{}'.format(self.get_next_bytes(64).hex())
 
@@ -549,11 +1377,33 @@ class H512(ScalePrimitive):
 
         return ScaleBytes(value)
 
+    @classmethod
+    def compile_decode_plan(cls, runtime_config):
+        def decode_plan(data, metadata):
+            return '0x{}'.format(data.get_next_bytes(64).hex())
+
+        return decode_plan
+
+    @classmethod
+    def compile_skip_plan(cls, runtime_config):
+        return 64
+
+    @classmethod
+    def compile_unpack_format(cls, runtime_config):
+        def convert(value):
+            return '0x{}'.format(value.hex())
+
+        return '64s', convert
+
 
 class Struct(ScaleType):
     """
     A struct is a composite data type that groups together zero or more values with various types into a single object
     """
+
+    # Instance dict for a `type_mapping` passed during init
+    __slots__ = ('__dict__',)
+
     def __init__(self, data=None, type_mapping=None, **kwargs):
 
         if type_mapping:
@@ -578,7 +1428,8 @@ class Struct(ScaleType):
         return result
 
     def process_encode(self, value: Union[dict, tuple, str, int, bool]) -> ScaleBytes:
-        data = ScaleBytes(bytearray())
+        # Accumulate in a private buffer and wrap it once, see `Vec.process_encode()`
+        data = bytearray()
 
         self.value_object = {}
 
@@ -600,10 +1451,10 @@ class Struct(ScaleType):
             element_obj = self.runtime_config.create_scale_object(
                 type_string=data_type, metadata=self.metadata
             )
-            data += element_obj.encode(value[key])
+            data += element_obj.encode(value[key]).data
             self.value_object[key] = element_obj
 
-        return data
+        return ScaleBytes(data)
 
     @classmethod
     def generate_type_decomposition(cls, _recursion_level: int = 0, max_recursion: int = TYPE_DECOMP_MAX_RECURSIVE):
@@ -624,8 +1475,306 @@ class Struct(ScaleType):
             result[key] = data_type
         return result
 
+    @classmethod
+    def has_type_definition(cls) -> bool:
+        return cls.type_mapping is not None
+
+    @classmethod
+    def compile_decode_plan(cls, runtime_config):
+        fields_plan = cls.compile_fields_decode_plan(
+            runtime_config, ['Null' if data_type is None else data_type for _, data_type in cls.type_mapping]
+        )
+
+        if fields_plan is not None:
+            keys = [key for key, _ in cls.type_mapping]
+
+            def decode_plan(data, metadata):
+                return dict(zip(keys, fields_plan(data, metadata)))
+
+            return decode_plan
+
+        field_plans = [
+            (key, runtime_config.get_decode_plan('Null' if data_type is None else data_type))
+            for key, data_type in cls.type_mapping
+        ]
+
+        def decode_plan(data, metadata):
+            return {key: field_plan(data, metadata) for key, field_plan in field_plans}
+
+        return decode_plan
+
+    @classmethod
+    def compile_iterative_plan(cls, runtime_config):
+        field_plans = []
+        for key, data_type in cls.type_mapping:
+            if data_type is None:
+                data_type = 'Null'
+            field_plans.append(
+                (key, runtime_config.get_iterative_plan(data_type), runtime_config.get_decode_plan(data_type))
+            )
+
+        if all([field_iterative_plan is None for _, field_iterative_plan, _ in field_plans]):
+            return None
+
+        def iterative_plan(data, metadata):
+            value = {}
+            for key, field_iterative_plan, field_plan in field_plans:
+                if field_iterative_plan is None:
+                    value[key] = field_plan(data, metadata)
+                else:
+                    value[key] = yield field_iterative_plan
+            return value
+
+        return iterative_plan
+
+    @classmethod
+    def compile_numpy_dtype(cls, runtime_config):
+        if not cls.type_mapping:
+            return None
+
+        field_dtypes = []
+
+        for key, data_type in cls.type_mapping:
+            field_dtype = None if data_type is None else runtime_config.get_numpy_dtype(data_type)
+
+            # Only flat structs of fixed-width primitives map to a structured dtype
+            if type(field_dtype) is not str:
+                return None
+
+            field_dtypes.append((key, field_dtype))
+
+        return field_dtypes
+
+    def process_lazy(self, check_remaining: bool = True):
+
+        if type(self).process is not Struct.process:
+            return self.process()
+
+        lazy_elements = LazyElements(
+            self, ['Null' if data_type is None else data_type for _, data_type in self.type_mapping], check_remaining
+        )
+        keys = [key for key, _ in self.type_mapping]
+
+        self.value_object = LazyStruct(lazy_elements, keys, objects=True)
+
+        return LazyStruct(lazy_elements, keys)
+
+    @classmethod
+    def compile_skip_plan(cls, runtime_config):
+        return cls.combine_skip_plans([
+            runtime_config.get_skip_plan('Null' if data_type is None else data_type)
+            for _, data_type in cls.type_mapping
+        ])
+
+    @staticmethod
+    def combine_skip_plans(skip_plans: list):
+        """
+        Combines the skip plans of consecutive elements into one skip plan
+
+        Parameters
+        ----------
+        skip_plans: list of skip plans, see `RuntimeConfigurationObject.get_skip_plan()`
+
+        Returns
+        -------
+        int if all elements have a fixed length, otherwise Callable
+        """
+        # Merge consecutive fixed lengths
+        combined_plans = []
+        for skip_plan in skip_plans:
+            if type(skip_plan) is int and len(combined_plans) > 0 and type(combined_plans[-1]) is int:
+                combined_plans[-1] += skip_plan
+            else:
+                combined_plans.append(skip_plan)
+
+        if len(combined_plans) == 0:
+            return 0
+
+        if len(combined_plans) == 1:
+            return combined_plans[0]
+
+        def skip_plan(data, metadata):
+            for element_plan in combined_plans:
+                if type(element_plan) is int:
+                    data.skip_bytes(element_plan)
+                else:
+                    element_plan(data, metadata)
+
+        return skip_plan
+
+    @staticmethod
+    def compile_fields_decode_plan(runtime_config, field_types: list) -> Optional[Callable]:
+        """
+        Compiles a decode plan for consecutive fields that returns a sequence of their values. Consecutive fields with a
+        fixed-width format (see `RuntimeConfigurationObject.get_unpack_format()`) are decoded with a single
+        precompiled `struct.Struct.unpack()` call.
+
+        Parameters
+        ----------
+        runtime_config
+        field_types: list of type strings
+
+        Returns
+        -------
+        Callable, or None if there are no consecutive fixed-width fields to combine
+        """
+        # Group consecutive fixed-width fields
+        field_runs = []
+        for field_type in field_types:
+            unpack_format = runtime_config.get_unpack_format(field_type)
+
+            if unpack_format is not None and len(field_runs) > 0 and type(field_runs[-1]) is list:
+                field_runs[-1].append((field_type, unpack_format))
+            elif unpack_format is not None:
+                field_runs.append([(field_type, unpack_format)])
+            else:
+                field_runs.append(field_type)
+
+        if not any([type(field_run) is list and len(field_run) > 1 for field_run in field_runs]):
+            return None
+
+        run_plans = []
+        for field_run in field_runs:
+            if type(field_run) is list and len(field_run) > 1:
+                run_plans.append((True, Struct.compile_unpack_plan(runtime_config, field_run)))
+            elif type(field_run) is list:
+                run_plans.append((False, runtime_config.get_decode_plan(field_run[0][0])))
+            else:
+                run_plans.append((False, runtime_config.get_decode_plan(field_run)))
+
+        if len(run_plans) == 1:
+            return run_plans[0][1]
+
+        def decode_plan(data, metadata):
+            values = []
+            for is_unpack_plan, run_plan in run_plans:
+                if is_unpack_plan:
+                    values.extend(run_plan(data, metadata))
+                else:
+                    values.append(run_plan(data, metadata))
+            return values
+
+        return decode_plan
+
+    @staticmethod
+    def compile_unpack_plan(runtime_config, fields: list) -> Callable:
+        """
+        Compiles a decode plan that unpacks consecutive fixed-width fields with one precompiled `struct.Struct`
+
+        Parameters
+        ----------
+        runtime_config
+        fields: list of tuples of type string and unpack format, see `RuntimeConfigurationObject.get_unpack_format()`
+
+        Returns
+        -------
+        Callable
+        """
+        unpacker = struct.Struct('<' + ''.join([unpack_format for _, (unpack_format, _) in fields]))
+        unpack = unpacker.unpack
+        length = unpacker.size
+
+        converters = [convert for _, (_, convert) in fields]
+        field_plans = [runtime_config.get_decode_plan(field_type) for field_type, _ in fields]
+
+        def decode_fields(data, metadata):
+            # Not enough bytes available: decode per field, so decoding fails the same way as without unpacking
+            return [field_plan(data, metadata) for field_plan in field_plans]
+
+        if not any(converters):
+            def decode_plan(data, metadata):
+                raw_data = data.get_next_bytes(length)
+
+                if len(raw_data) != length:
+                    data.offset -= length
+                    return decode_fields(data, metadata)
+
+                return unpack(raw_data)
+
+        else:
+            def decode_plan(data, metadata):
+                raw_data = data.get_next_bytes(length)
+
+                if len(raw_data) != length:
+                    data.offset -= length
+                    return decode_fields(data, metadata)
+
+                return [
+                    value if convert is None else convert(value)
+                    for convert, value in zip(converters, unpack(raw_data))
+                ]
+
+        return decode_plan
+
+    @classmethod
+    def compile_projection_plan(cls, runtime_config, selector_tree):
+        cls.check_selector_fields(selector_tree, [key for key, _ in cls.type_mapping])
+
+        field_plans = []
+        skip_plans = []
+
+        for key, data_type in cls.type_mapping:
+            if data_type is None:
+                data_type = 'Null'
+
+            if key in selector_tree:
+                if len(skip_plans) > 0:
+                    field_plans.append((None, cls.combine_skip_plans(skip_plans)))
+                    skip_plans = []
+
+                field_plans.append((key, runtime_config.get_projection_plan(data_type, selector_tree[key])))
+            else:
+                skip_plans.append(runtime_config.get_skip_plan(data_type))
+
+        if len(skip_plans) > 0:
+            field_plans.append((None, cls.combine_skip_plans(skip_plans)))
+
+        def projection_plan(data, metadata):
+            value = {}
+
+            for key, field_plan in field_plans:
+                if key is not None:
+                    value[key] = field_plan(data, metadata)
+                elif type(field_plan) is int:
+                    data.skip_bytes(field_plan)
+                else:
+                    field_plan(data, metadata)
+
+            return value
+
+        return projection_plan
+
+    @classmethod
+    def compile_encode_plan(cls, runtime_config):
+        type_mapping = cls.type_mapping
+        field_plans = [(key, runtime_config.get_encode_plan(data_type)) for key, data_type in type_mapping]
+
+        def encode_plan(value, buffer, metadata):
+            if type(value) in (str, int, bool):
+                # Convert to tuple with one element
+                value = (value,)
+
+            if type(value) is tuple:
+                # Convert tuple to dict
+                try:
+                    value = {key: value[idx] for idx, (key, _) in enumerate(type_mapping)}
+                except IndexError:
+                    raise ValueError("Not enough items in tuple to match type_mapping")
+
+            for key, field_plan in field_plans:
+                if key not in value:
+                    raise ValueError('Element "{}" of struct is missing in given value'.format(key))
+
+                field_plan(value[key], buffer, metadata)
+
+        return encode_plan
+
 
 class Tuple(ScaleType):
+
+    # Instance dict for a `type_mapping` passed during init
+    __slots__ = ('__dict__',)
+
     def __init__(self, data=None, type_mapping=None, **kwargs):
 
         if type_mapping:
@@ -655,7 +1804,8 @@ class Tuple(ScaleType):
         return result
 
     def process_encode(self, value):
-        data = ScaleBytes(bytearray())
+        # Accumulate in a private buffer and wrap it once, see `Vec.process_encode()`
+        data = bytearray()
         self.value_object = ()
 
         if type(value) not in (list,  tuple):
@@ -671,10 +1821,10 @@ class Tuple(ScaleType):
             element_obj = self.runtime_config.create_scale_object(
                 member_type, metadata=self.metadata
             )
-            data += element_obj.encode(value[idx])
+            data += element_obj.encode(value[idx]).data
             self.value_object += (element_obj,)
 
-        return data
+        return ScaleBytes(data)
 
     @classmethod
     def generate_type_decomposition(cls, _recursion_level: int = 0, max_recursion: int = TYPE_DECOMP_MAX_RECURSIVE):
@@ -693,6 +1843,113 @@ class Tuple(ScaleType):
                 result += (member_type,)
         return result
 
+    @classmethod
+    def has_type_definition(cls) -> bool:
+        return cls.type_mapping is not None
+
+    @classmethod
+    def compile_decode_plan(cls, runtime_config):
+        if len(cls.type_mapping) == 1:
+            return runtime_config.get_decode_plan(cls.type_mapping[0])
+
+        members_plan = Struct.compile_fields_decode_plan(
+            runtime_config, ['Null' if member_type is None else member_type for member_type in cls.type_mapping]
+        )
+
+        if members_plan is not None:
+            def decode_plan(data, metadata):
+                return tuple(members_plan(data, metadata))
+
+            return decode_plan
+
+        member_plans = [
+            runtime_config.get_decode_plan('Null' if member_type is None else member_type)
+            for member_type in cls.type_mapping
+        ]
+
+        def decode_plan(data, metadata):
+            return tuple([member_plan(data, metadata) for member_plan in member_plans])
+
+        return decode_plan
+
+    @classmethod
+    def compile_iterative_plan(cls, runtime_config):
+        if len(cls.type_mapping) == 1:
+            return runtime_config.get_iterative_plan(cls.type_mapping[0])
+
+        member_plans = []
+        for member_type in cls.type_mapping:
+            if member_type is None:
+                member_type = 'Null'
+            member_plans.append(
+                (runtime_config.get_iterative_plan(member_type), runtime_config.get_decode_plan(member_type))
+            )
+
+        if all([member_iterative_plan is None for member_iterative_plan, _ in member_plans]):
+            return None
+
+        def iterative_plan(data, metadata):
+            value = []
+            for member_iterative_plan, member_plan in member_plans:
+                if member_iterative_plan is None:
+                    value.append(member_plan(data, metadata))
+                else:
+                    value.append((yield member_iterative_plan))
+            return tuple(value)
+
+        return iterative_plan
+
+    def process_lazy(self, check_remaining: bool = True):
+
+        if type(self).process is not Tuple.process or len(self.type_mapping) == 1:
+            return self.process()
+
+        lazy_elements = LazyElements(
+            self, ['Null' if member_type is None else member_type for member_type in self.type_mapping],
+            check_remaining
+        )
+
+        self.value_object = LazySequence(lazy_elements, tuple, objects=True)
+
+        return LazySequence(lazy_elements, tuple)
+
+    @classmethod
+    def compile_projection_plan(cls, runtime_config, selector_tree):
+        if len(cls.type_mapping) == 1:
+            return runtime_config.get_projection_plan(cls.type_mapping[0], selector_tree)
+
+        # Elements of a tuple have no names to select
+        cls.check_selector_fields(selector_tree, ())
+        return super().compile_projection_plan(runtime_config, selector_tree)
+
+    @classmethod
+    def compile_skip_plan(cls, runtime_config):
+        if len(cls.type_mapping) == 1:
+            return runtime_config.get_skip_plan(cls.type_mapping[0])
+
+        return Struct.combine_skip_plans([
+            runtime_config.get_skip_plan('Null' if member_type is None else member_type)
+            for member_type in cls.type_mapping
+        ])
+
+    @classmethod
+    def compile_encode_plan(cls, runtime_config):
+        member_plans = [runtime_config.get_encode_plan(member_type) for member_type in cls.type_mapping]
+
+        def encode_plan(value, buffer, metadata):
+            if type(value) not in (list, tuple):
+                value = [value]
+
+            if len(value) != len(member_plans):
+                raise ValueError('Element count of value ({}) doesn\'t match type_definition ({})'.format(
+                    len(value), len(member_plans))
+                )
+
+            for member_value, member_plan in zip(value, member_plans):
+                member_plan(member_value, buffer, metadata)
+
+        return encode_plan
+
 
 class Set(ScaleType):
     """
@@ -738,6 +1995,26 @@ class Set(ScaleType):
     def generate_type_decomposition(cls, _recursion_level: int = 0, max_recursion: int = TYPE_DECOMP_MAX_RECURSIVE):
         return tuple(cls.value_list)
 
+    @classmethod
+    def compile_decode_plan(cls, runtime_config):
+        value_type_plan = runtime_config.get_decode_plan(cls.value_type)
+        value_list = cls.value_list
+
+        def decode_plan(data, metadata):
+            set_value = value_type_plan(data, None)
+            result = []
+            if set_value > 0:
+                for value, set_mask in value_list.items():
+                    if set_value & set_mask > 0:
+                        result.append(value)
+            return result
+
+        return decode_plan
+
+    @classmethod
+    def compile_skip_plan(cls, runtime_config):
+        return runtime_config.get_skip_plan(cls.value_type)
+
 
 class Era(ScaleType):
     """
@@ -749,6 +2026,8 @@ class Era(ScaleType):
     in which it is valid.
     """
 
+    __slots__ = ('period', 'phase')
+
     def __init__(self, **kwargs):
         self.period = None
         self.phase = None
@@ -846,6 +2125,9 @@ class Bool(ScalePrimitive):
     """
     Boolean type
     """
+
+    __slots__ = ()
+
     def process(self):
         return self.get_next_bool()
 
@@ -857,6 +2139,32 @@ class Bool(ScalePrimitive):
         else:
             raise ValueError("Value must be boolean")
 
+    @classmethod
+    def compile_decode_plan(cls, runtime_config):
+        def decode_plan(data, metadata):
+            value = data.get_next_bytes(1)
+            if value not in [b'\x00', b'\x01']:
+                raise InvalidScaleTypeValueException('Invalid value for datatype "bool"')
+            return value == b'\x01'
+
+        return decode_plan
+
+    @classmethod
+    def compile_skip_plan(cls, runtime_config):
+        return 1
+
+    @classmethod
+    def compile_encode_plan(cls, runtime_config):
+        def encode_plan(value, buffer, metadata):
+            if value is True:
+                buffer.append(1)
+            elif value is False:
+                buffer.append(0)
+            else:
+                raise ValueError("Value must be boolean")
+
+        return encode_plan
+
 
 class CompactMoment(CompactU32):
     type_string = 'Compact<Moment>'
@@ -894,6 +2202,8 @@ class GenericAccountId(H256):
     An SS58 formatted representation of an account
     """
 
+    __slots__ = ('ss58_address', 'public_key')
+
     def __init__(self, data=None, **kwargs):
         self.ss58_address = None
         self.public_key = None
@@ -925,8 +2235,38 @@ class GenericAccountId(H256):
         return
 
     @classmethod
-    def generate_type_decomposition(cls, _recursion_level: int = 0, max_recursion: int = TYPE_DECOMP_MAX_RECURSIVE):
-        return 'AccountId'
+    def generate_type_decomposition(cls, _recursion_level: int = 0, max_recursion: int = TYPE_DECOMP_MAX_RECURSIVE):
+        return 'AccountId'
+
+    @classmethod
+    def compile_decode_plan(cls, runtime_config):
+        def decode_plan(data, metadata):
+            value = '0x{}'.format(data.get_next_bytes(32).hex())
+
+            if runtime_config.ss58_format is not None:
+                try:
+                    value = ss58_encode(value, ss58_format=runtime_config.ss58_format)
+                except ValueError:
+                    pass
+
+            return value
+
+        return decode_plan
+
+    @classmethod
+    def compile_skip_plan(cls, runtime_config):
+        return 32
+
+    @classmethod
+    def compile_encode_plan(cls, runtime_config):
+        h256_plan = super().compile_encode_plan(runtime_config)
+
+        def encode_plan(value, buffer, metadata):
+            if value[0:2] != '0x':
+                value = '0x{}'.format(ss58_decode(value))
+            h256_plan(value, buffer, metadata)
+
+        return encode_plan
 
 
 class GenericEthereumAccountId(H160):
@@ -951,6 +2291,9 @@ class Vec(ScaleType):
     A Vec in RUST is a dynamically resizable array that can hold a sequence of elements of the same type, allowing for
     efficient random access and insertion or removal of elements at the end of the vector.
     """
+    # Instance dict for a `sub_type` passed during init
+    __slots__ = ('elements', '__dict__')
+
     def __init__(self, data=None, **kwargs):
         self.elements = []
         super().__init__(data, **kwargs)
@@ -963,10 +2306,20 @@ class Vec(ScaleType):
             self.value_object = self.get_next_bytes(element_count)
 
             try:
-                return self.value_object.decode()
+                return str(self.value_object, 'utf-8')
             except UnicodeDecodeError:
                 return '0x{}'.format(self.value_object.hex())
 
+        if self.runtime_config.numpy_arrays:
+            element_dtype = self.runtime_config.get_numpy_dtype(self.sub_type)
+
+            if element_dtype is not None:
+                array = self.decode_numpy_array(self.data, element_count, numpy.dtype(element_dtype))
+
+                if array is not None:
+                    self.value_object = array
+                    return array
+
         result = []
         for _ in range(0, element_count):
             element = self.process_type(self.sub_type, metadata=self.metadata)
@@ -1006,12 +2359,16 @@ class Vec(ScaleType):
 
             return data
 
+        if numpy is not None and isinstance(value, numpy.ndarray):
+            value = value.tolist()
+
         if type(value) is not list:
             raise ValueError("Provided value is not a list")
 
         element_count_compact.encode(len(value))
 
-        data = element_count_compact.data
+        # Accumulate in a private buffer, concatenating ScaleBytes would copy all previous data for every element
+        data = bytearray(element_count_compact.data.data)
         self.value_object = []
 
         for element in value:
@@ -1019,10 +2376,10 @@ class Vec(ScaleType):
             element_obj = self.runtime_config.create_scale_object(
                 type_string=self.sub_type, metadata=self.metadata
             )
-            data += element_obj.encode(element)
+            data += element_obj.encode(element).data
             self.value_object.append(element_obj)
 
-        return data
+        return ScaleBytes(data)
 
     def __len__(self):
         return len(self.value_object)
@@ -1046,6 +2403,315 @@ class Vec(ScaleType):
                 sub_obj.generate_type_decomposition(_recursion_level=_recursion_level + 1, max_recursion=max_recursion)
             ]
 
+    @classmethod
+    def has_type_definition(cls) -> bool:
+        return cls.sub_type is not None
+
+    @classmethod
+    def compile_decode_plan(cls, runtime_config):
+        return cls.compile_elements_decode_plan(runtime_config, cls.sub_type)
+
+    @classmethod
+    def compile_elements_decode_plan(cls, runtime_config, sub_type: str):
+        """
+        Compiles a decode plan for a compact length prefixed sequence of `sub_type` elements
+
+        Parameters
+        ----------
+        runtime_config
+        sub_type
+
+        Returns
+        -------
+        Callable
+        """
+        decode_compact_int = Compact.decode_compact_int
+
+        if runtime_config.get_decoder_class(sub_type) is U8:
+            return Bytes.compile_decode_plan(runtime_config)
+
+        element_plan = runtime_config.get_decode_plan(sub_type)
+        element_dtype = runtime_config.get_numpy_dtype(sub_type)
+
+        if element_dtype is not None:
+            element_dtype = numpy.dtype(element_dtype)
+            decode_numpy_array = cls.decode_numpy_array
+            numpy_array_to_value = cls.numpy_array_to_value
+
+            def decode_plan(data, metadata):
+                element_count = decode_compact_int(data)
+                array = decode_numpy_array(data, element_count, element_dtype)
+
+                if array is None:
+                    return [element_plan(data, metadata) for _ in range(element_count)]
+
+                return numpy_array_to_value(array, runtime_config.numpy_arrays)
+
+            return decode_plan
+
+        def decode_plan(data, metadata):
+            return [element_plan(data, metadata) for _ in range(decode_compact_int(data))]
+
+        return decode_plan
+
+    @classmethod
+    def compile_iterative_plan(cls, runtime_config):
+        return cls.compile_elements_iterative_plan(runtime_config, cls.sub_type)
+
+    @classmethod
+    def compile_elements_iterative_plan(cls, runtime_config, sub_type: str):
+        """
+        Compiles an iterative plan for a compact length prefixed sequence of `sub_type` elements, see
+        `RuntimeConfigurationObject.get_iterative_plan()`
+
+        Parameters
+        ----------
+        runtime_config
+        sub_type
+
+        Returns
+        -------
+        Callable or None if the elements are decoded with their decode plan
+        """
+        decode_compact_int = Compact.decode_compact_int
+
+        element_plan = runtime_config.get_iterative_plan(sub_type)
+
+        if element_plan is None:
+            return None
+
+        def iterative_plan(data, metadata):
+            value = []
+            for _ in range(decode_compact_int(data)):
+                value.append((yield element_plan))
+            return value
+
+        return iterative_plan
+
+    @staticmethod
+    def decode_numpy_array(data: ScaleBytes, element_count: int, dtype) -> Optional['numpy.ndarray']:
+        """
+        Reads `element_count` consecutive fixed-width elements from `data` with a single `numpy.frombuffer()` call
+
+        Parameters
+        ----------
+        data: ScaleBytes positioned at the first element
+        element_count: amount of elements
+        dtype: numpy.dtype of one element, see `RuntimeConfigurationObject.get_numpy_dtype()`
+
+        Returns
+        -------
+        numpy.ndarray, or None if `data` does not contain enough bytes, in which case the offset is left unchanged
+        """
+        length = element_count * dtype.itemsize
+        raw_data = data.get_next_bytes(length)
+
+        if len(raw_data) != length:
+            data.offset -= length
+            return None
+
+        return numpy.frombuffer(raw_data, dtype=dtype)
+
+    @staticmethod
+    def numpy_array_to_value(array: 'numpy.ndarray', numpy_arrays: bool = False) -> Union[list, 'numpy.ndarray']:
+        """
+        Converts an array returned by `decode_numpy_array()` to the decoded value: the array itself if `numpy_arrays`
+        is enabled, otherwise the same list of ints, floats or (for structured dtypes) dicts a ScaleType returns
+
+        Parameters
+        ----------
+        array: numpy.ndarray
+        numpy_arrays: return the ndarray instead of a list
+
+        Returns
+        -------
+        list or numpy.ndarray
+        """
+        if numpy_arrays:
+            return array
+
+        if array.dtype.names:
+            field_names = array.dtype.names
+            return [dict(zip(field_names, element)) for element in array.tolist()]
+
+        return array.tolist()
+
+    def process_lazy(self, check_remaining: bool = True):
+
+        if type(self).process is not Vec.process or self.runtime_config.get_decoder_class(self.sub_type) is U8:
+            return self.process()
+
+        element_count = self.process_type('Compact<u32>').value
+
+        lazy_elements = LazyElements(self, [self.sub_type] * element_count, check_remaining)
+
+        self.value_object = LazySequence(lazy_elements, list, objects=True)
+
+        return LazySequence(lazy_elements, list)
+
+    def iter_decode(
+            self, data: ScaleBytes = None, check_remaining: bool = True, values_only: bool = False,
+            selectors: list = None
+    ) -> Iterator:
+        """
+        Decodes the elements one at a time: the Compact length prefix is read first, then every iteration decodes and
+        yields the next element. Elements are not retained, so `value` and `value_object` stay empty and only the
+        element currently held by the consumer is kept in memory, e.g. when processing a `Vec<EventRecord>` of a busy
+        block.
+
+        Remaining bytes are checked once the last element is decoded.
+
+        Parameters
+        ----------
+        data
+        check_remaining: If enabled, an exception will be raised when data is remaining after the last element
+        values_only: If enabled, the decoded values are yielded instead of ScaleType objects, see `decode()`
+        selectors: list of dotted paths of the fields to decode of every element, see `decode()`
+
+        Returns
+        -------
+        Iterator of ScaleType objects, or of decoded values if `values_only` or `selectors` are provided
+        """
+        if data is not None:
+            self.data = data
+
+        self.decoded = False
+        self.data_start_offset = self.data.offset
+
+        element_count = self.process_type('Compact<u32>').value
+
+        element_plan = None
+        selector_tree = None
+
+        if self.runtime_config.use_decode_plans:
+            if selectors is not None:
+                element_plan = self.runtime_config.get_projection_plan(self.sub_type, selectors)
+            elif values_only:
+                element_plan = self.runtime_config.get_value_decode_plan(self.sub_type)
+        elif selectors is not None:
+            selector_tree = self.runtime_config.build_selector_tree(selectors)
+
+        for _ in range(element_count):
+            if element_plan is not None:
+                yield element_plan(self.data, self.metadata)
+            else:
+                element = self.process_type(self.sub_type, metadata=self.metadata)
+
+                if selector_tree is not None:
+                    yield self.project_value(element.value, selector_tree)
+                elif values_only:
+                    yield element.value
+                else:
+                    yield element
+
+        self.decoded = True
+        self.data_end_offset = self.data.offset
+
+        self.runtime_config.check_decoded_data(self.__class__.__name__, self.data, check_remaining)
+
+    @classmethod
+    def compile_skip_plan(cls, runtime_config):
+        return cls.compile_elements_skip_plan(runtime_config, cls.sub_type)
+
+    @classmethod
+    def compile_elements_skip_plan(cls, runtime_config, sub_type: str):
+        """
+        Compiles a skip plan for a compact length prefixed sequence of `sub_type` elements
+
+        Parameters
+        ----------
+        runtime_config
+        sub_type
+
+        Returns
+        -------
+        Callable
+        """
+        decode_compact_int = Compact.decode_compact_int
+
+        element_plan = runtime_config.get_skip_plan(sub_type)
+
+        if type(element_plan) is int:
+            def skip_plan(data, metadata):
+                data.skip_bytes(decode_compact_int(data) * element_plan)
+        else:
+            def skip_plan(data, metadata):
+                for _ in range(decode_compact_int(data)):
+                    element_plan(data, metadata)
+
+        return skip_plan
+
+    @classmethod
+    def compile_projection_plan(cls, runtime_config, selector_tree):
+        return cls.compile_elements_projection_plan(runtime_config, cls.sub_type, selector_tree)
+
+    @classmethod
+    def compile_elements_projection_plan(cls, runtime_config, sub_type: str, selector_tree: dict):
+        """
+        Compiles a projection plan for a compact length prefixed sequence of `sub_type` elements, `selector_tree` is
+        applied to each element
+
+        Parameters
+        ----------
+        runtime_config
+        sub_type
+        selector_tree
+
+        Returns
+        -------
+        Callable
+        """
+        decode_compact_int = Compact.decode_compact_int
+
+        if runtime_config.get_decoder_class(sub_type) is U8:
+            raise NotImplementedError('Selectors are not applicable to bytes')
+
+        element_plan = runtime_config.get_projection_plan(sub_type, selector_tree)
+
+        def projection_plan(data, metadata):
+            return [element_plan(data, metadata) for _ in range(decode_compact_int(data))]
+
+        return projection_plan
+
+    @classmethod
+    def compile_encode_plan(cls, runtime_config):
+        return cls.compile_elements_encode_plan(runtime_config, cls.sub_type)
+
+    @classmethod
+    def compile_elements_encode_plan(cls, runtime_config, sub_type: str):
+        """
+        Compiles an encode plan for a compact length prefixed sequence of `sub_type` elements
+
+        Parameters
+        ----------
+        runtime_config
+        sub_type
+
+        Returns
+        -------
+        Callable
+        """
+        encode_compact_int = Compact.encode_compact_int
+
+        if runtime_config.get_decoder_class(sub_type) is U8:
+            return Bytes.compile_encode_plan(runtime_config)
+
+        element_plan = runtime_config.get_encode_plan(sub_type)
+
+        def encode_plan(value, buffer, metadata):
+            if numpy is not None and isinstance(value, numpy.ndarray):
+                value = value.tolist()
+
+            if type(value) is not list:
+                raise ValueError("Provided value is not a list")
+
+            buffer += encode_compact_int(len(value))
+
+            for element in value:
+                element_plan(element, buffer, metadata)
+
+        return encode_plan
+
 
 class BoundedVec(Vec):
     """
@@ -1053,18 +2719,79 @@ class BoundedVec(Vec):
     It is used in cases where a fixed-size buffer is required, such as in the case of the transaction input/output
     limit in the Substrate runtime.
     """
-    def __init__(self, data=None, **kwargs):
+    def __init__(self, data=None, sub_type=None, **kwargs):
 
-        if self.sub_type and ',' in self.sub_type:
+        if not sub_type and self.__class__.sub_type and ',' in self.__class__.sub_type:
             # Rebuild sub_type as last item is the upper bound of elements allowed
-            self.sub_type, self.max_elements = [x.strip() for x in self.sub_type.rsplit(',', 1)]
+            sub_type, self.max_elements = self.split_sub_type()
 
-        super().__init__(data, **kwargs)
+        super().__init__(data, sub_type=sub_type, **kwargs)
+
+    @classmethod
+    def split_sub_type(cls) -> tuple:
+        """
+        Splits the `sub_type` of e.g. `BoundedVec<(u32, u64), 10>` into the element type and upper bound of elements
+
+        Returns
+        -------
+        tuple of element type string and upper bound (None if not specified)
+        """
+        sub_type_parts = split_type_params(cls.sub_type)
+
+        if len(sub_type_parts) > 1:
+            return sub_type_parts[0], sub_type_parts[-1]
+
+        return cls.sub_type, None
 
     @classmethod
     def process_scale_info_definition(cls, scale_info_definition: 'GenericRegistryType', prefix: str):
         cls.sub_type = f"{prefix}::{scale_info_definition.value['params'][0]['type']}"
 
+    @classmethod
+    def compile_decode_plan(cls, runtime_config):
+        sub_type = cls.sub_type
+
+        if sub_type and ',' in sub_type:
+            sub_type = cls.split_sub_type()[0]
+
+        return cls.compile_elements_decode_plan(runtime_config, sub_type)
+
+    @classmethod
+    def compile_iterative_plan(cls, runtime_config):
+        sub_type = cls.sub_type
+
+        if sub_type and ',' in sub_type:
+            sub_type = cls.split_sub_type()[0]
+
+        return cls.compile_elements_iterative_plan(runtime_config, sub_type)
+
+    @classmethod
+    def compile_skip_plan(cls, runtime_config):
+        sub_type = cls.sub_type
+
+        if sub_type and ',' in sub_type:
+            sub_type = cls.split_sub_type()[0]
+
+        return cls.compile_elements_skip_plan(runtime_config, sub_type)
+
+    @classmethod
+    def compile_projection_plan(cls, runtime_config, selector_tree):
+        sub_type = cls.sub_type
+
+        if sub_type and ',' in sub_type:
+            sub_type = cls.split_sub_type()[0]
+
+        return cls.compile_elements_projection_plan(runtime_config, sub_type, selector_tree)
+
+    @classmethod
+    def compile_encode_plan(cls, runtime_config):
+        sub_type = cls.sub_type
+
+        if sub_type and ',' in sub_type:
+            sub_type = cls.split_sub_type()[0]
+
+        return cls.compile_elements_encode_plan(runtime_config, sub_type)
+
 
 class BitVec(ScaleType):
     """
@@ -1098,16 +2825,37 @@ class BitVec(ScaleType):
 
         # encode the length in a compact u32
         compact_obj = CompactU32()
-        data = compact_obj.encode(value.bit_length())
+        data = bytearray(compact_obj.encode(value.bit_length()).data)
 
         byte_length = math.ceil(value.bit_length() / 8)
+        data += value.to_bytes(length=byte_length, byteorder='little')
 
-        return data + value.to_bytes(length=byte_length, byteorder='little')
+        return ScaleBytes(data)
 
     @classmethod
     def generate_type_decomposition(cls, _recursion_level: int = 0, max_recursion: int = TYPE_DECOMP_MAX_RECURSIVE):
         return 'BitVec'
 
+    @classmethod
+    def compile_decode_plan(cls, runtime_config):
+        decode_compact_int = Compact.decode_compact_int
+
+        def decode_plan(data, metadata):
+            length = decode_compact_int(data)
+            value_int = int.from_bytes(data.get_next_bytes(math.ceil(length / 8)), byteorder='little')
+            return '0b' + bin(value_int)[2:].zfill(length)
+
+        return decode_plan
+
+    @classmethod
+    def compile_skip_plan(cls, runtime_config):
+        decode_compact_int = Compact.decode_compact_int
+
+        def skip_plan(data, metadata):
+            data.skip_bytes(math.ceil(decode_compact_int(data) / 8))
+
+        return skip_plan
+
 
 class GenericAddress(ScaleType):
 
@@ -1214,6 +2962,9 @@ class Enum(ScaleType):
     value_list = []
     type_mapping = None
 
+    # Instance dict for a `type_mapping` or `value_list` passed during init
+    __slots__ = ('index', '__dict__')
+
     def __init__(self, data=None, value_list=None, type_mapping=None, **kwargs):
 
         self.index = None
@@ -1276,59 +3027,229 @@ class Enum(ScaleType):
                         self.value_object = (item_key, struct_obj)
                         return ScaleBytes(bytearray([self.index])) + struct_data
 
-                raise ValueError("Value '{}' not present in type_mapping of this enum".format(enum_key))
+                raise ValueError("Value '{}' not present in type_mapping of this enum".format(enum_key))
+
+        else:
+
+            if type(self.value_list) is dict:
+                value_list = self.value_list.items()
+            else:
+                value_list = enumerate(self.value_list)
+
+            for idx, item in value_list:
+                if item == value:
+                    self.index = idx
+                    return ScaleBytes(bytearray([self.index]))
+
+            raise ValueError("Value '{}' not present in value list of this enum".format(value))
+
+    def get_enum_value(self):
+        if self.value:
+
+            if self.type_mapping:
+
+                if self.type_mapping[self.index][1] == 'Null':
+                    return self.value
+
+                return list(self.value.values())[0]
+            else:
+                return self.value_list[self.index]
+
+    @classmethod
+    def generate_type_decomposition(cls, _recursion_level: int = 0, max_recursion: int = TYPE_DECOMP_MAX_RECURSIVE):
+
+        if _recursion_level > max_recursion:
+            return cls.__name__
+
+        if cls.type_mapping:
+
+            # Check if type_mapping can be converted to simple value_list
+            if all([t == 'Null' for n, t in cls.type_mapping]):
+                return tuple([n for n, t in cls.type_mapping if n is not None])
+
+            result = {}
+            for key, data_type in cls.type_mapping:
+                if data_type == 'Null':
+                    data_type = None
+                if data_type is not None:
+                    scale_obj = cls.runtime_config.create_scale_object(data_type)
+                    data_type = scale_obj.generate_type_decomposition(
+                        _recursion_level=_recursion_level + 1, max_recursion=max_recursion
+                    )
+                result[key] = data_type
+            return result
+        else:
+            return tuple(cls.value_list)
+
+    @classmethod
+    def has_type_definition(cls) -> bool:
+        return cls.type_mapping is not None or len(cls.value_list) > 0
+
+    @classmethod
+    def compile_decode_plan(cls, runtime_config):
+
+        if cls.type_mapping:
+            variant_plans = cls.compile_variant_decode_plans(runtime_config)
+
+            def decode_plan(data, metadata):
+                index = int.from_bytes(data.get_next_bytes(1), byteorder='little')
+                try:
+                    variant_name, variant_plan = variant_plans[index]
+                except IndexError:
+                    raise ValueError("Index '{}' not present in Enum type mapping".format(index))
+
+                if variant_plan is None:
+                    return variant_name
+
+                return {variant_name: variant_plan(data, metadata)}
+        else:
+            value_list = cls.value_list
+
+            def decode_plan(data, metadata):
+                index = int.from_bytes(data.get_next_bytes(1), byteorder='little')
+                try:
+                    return value_list[index]
+                except IndexError:
+                    raise ValueError("Index '{}' not present in Enum value list".format(index))
+
+        return decode_plan
+
+    @classmethod
+    def compile_iterative_plan(cls, runtime_config):
+        if not cls.type_mapping:
+            return None
+
+        variant_plans = []
+        for (variant_name, variant_plan), (_, variant_type) in zip(
+                cls.compile_variant_decode_plans(runtime_config), cls.type_mapping
+        ):
+            if variant_plan is None:
+                variant_plans.append((variant_name, None, None))
+            else:
+                variant_plans.append((variant_name, runtime_config.get_iterative_plan(variant_type), variant_plan))
+
+        if all([variant_iterative_plan is None for _, variant_iterative_plan, _ in variant_plans]):
+            return None
+
+        def iterative_plan(data, metadata):
+            index = int.from_bytes(data.get_next_bytes(1), byteorder='little')
+            try:
+                variant_name, variant_iterative_plan, variant_plan = variant_plans[index]
+            except IndexError:
+                raise ValueError("Index '{}' not present in Enum type mapping".format(index))
+
+            if variant_plan is None:
+                return variant_name
+
+            if variant_iterative_plan is None:
+                return {variant_name: variant_plan(data, metadata)}
 
-        else:
+            return {variant_name: (yield variant_iterative_plan)}
 
-            if type(self.value_list) is dict:
-                value_list = self.value_list.items()
+        return iterative_plan
+
+    @classmethod
+    def compile_variant_decode_plans(cls, runtime_config) -> list:
+        """
+        Compiles the decode plans of the variants in `type_mapping`
+
+        Parameters
+        ----------
+        runtime_config
+
+        Returns
+        -------
+        list of (variant name, decode plan) tuples, ordered by index. The plan is None for variants without a value
+        """
+        variant_plans = []
+        for variant_name, variant_type in cls.type_mapping:
+            if variant_type is None or variant_type == 'Null':
+                variant_plans.append((variant_name, None))
             else:
-                value_list = enumerate(self.value_list)
+                variant_plans.append((variant_name, runtime_config.get_decode_plan(variant_type)))
+        return variant_plans
 
-            for idx, item in value_list:
-                if item == value:
-                    self.index = idx
-                    return ScaleBytes(bytearray([self.index]))
+    @classmethod
+    def compile_skip_plan(cls, runtime_config):
 
-            raise ValueError("Value '{}' not present in value list of this enum".format(value))
+        if not cls.type_mapping:
+            return 1
 
-    def get_enum_value(self):
-        if self.value:
+        variant_plans = []
+        for variant_name, variant_type in cls.type_mapping:
+            if variant_type is None or variant_type == 'Null':
+                variant_plans.append(0)
+            else:
+                variant_plans.append(runtime_config.get_skip_plan(variant_type))
 
-            if self.type_mapping:
+        if all([variant_plan == 0 for variant_plan in variant_plans]):
+            return 1
 
-                if self.type_mapping[self.index][1] == 'Null':
-                    return self.value
+        def skip_plan(data, metadata):
+            index = int.from_bytes(data.get_next_bytes(1), byteorder='little')
+            try:
+                variant_plan = variant_plans[index]
+            except IndexError:
+                raise ValueError("Index '{}' not present in Enum type mapping".format(index))
 
-                return list(self.value.values())[0]
+            if type(variant_plan) is int:
+                data.skip_bytes(variant_plan)
             else:
-                return self.value_list[self.index]
+                variant_plan(data, metadata)
+
+        return skip_plan
 
     @classmethod
-    def generate_type_decomposition(cls, _recursion_level: int = 0, max_recursion: int = TYPE_DECOMP_MAX_RECURSIVE):
+    def compile_encode_plan(cls, runtime_config):
+        if cls.type_mapping:
+            variant_plans = {}
 
-        if _recursion_level > max_recursion:
-            return cls.__name__
+            for idx, (variant_name, variant_type) in enumerate(cls.type_mapping):
+                if variant_type is None:
+                    raise NotImplementedError('Variants without a type are encoded via a ScaleType object')
 
-        if cls.type_mapping:
+                if variant_name not in variant_plans:
+                    variant_plans[variant_name] = (idx, runtime_config.get_encode_plan(variant_type))
 
-            # Check if type_mapping can be converted to simple value_list
-            if all([t == 'Null' for n, t in cls.type_mapping]):
-                return tuple([n for n, t in cls.type_mapping if n is not None])
+            def encode_plan(value, buffer, metadata):
+                if type(value) == str:
+                    # Convert simple enum values
+                    value = {value: None}
 
-            result = {}
-            for key, data_type in cls.type_mapping:
-                if data_type == 'Null':
-                    data_type = None
-                if data_type is not None:
-                    scale_obj = cls.runtime_config.create_scale_object(data_type)
-                    data_type = scale_obj.generate_type_decomposition(
-                        _recursion_level=_recursion_level + 1, max_recursion=max_recursion
+                if type(value) != dict:
+                    raise ValueError(
+                        "Value must be a dict or str when type_mapping is set, not '{}'".format(value)
                     )
-                result[key] = data_type
-            return result
+
+                if len(value) != 1:
+                    raise ValueError("Value for enum with type_mapping can only have one value")
+
+                for variant_name, variant_value in value.items():
+                    try:
+                        index, variant_plan = variant_plans[variant_name]
+                    except KeyError:
+                        raise ValueError("Value '{}' not present in type_mapping of this enum".format(variant_name))
+
+                    buffer.append(index)
+                    variant_plan(variant_value, buffer, None)
+
         else:
-            return tuple(cls.value_list)
+            if type(cls.value_list) is dict:
+                value_list = cls.value_list.items()
+            else:
+                value_list = enumerate(cls.value_list)
+
+            value_indices = {}
+            for idx, item in value_list:
+                value_indices.setdefault(item, idx)
+
+            def encode_plan(value, buffer, metadata):
+                try:
+                    buffer.append(value_indices[value])
+                except (KeyError, TypeError):
+                    raise ValueError("Value '{}' not present in value list of this enum".format(value))
+
+        return encode_plan
 
 
 class Data(Enum):
@@ -1353,7 +3274,7 @@ class Data(Enum):
             data = self.get_next_bytes(self.index - 1)
 
             try:
-                value = data.decode()
+                value = str(data, 'utf-8')
             except UnicodeDecodeError:
                 value = '0x{}'.format(data.hex())
             return {"Raw": value}
@@ -1422,6 +3343,24 @@ class Null(ScaleType):
     def process_encode(self, value):
         return ScaleBytes(bytearray())
 
+    @classmethod
+    def compile_decode_plan(cls, runtime_config):
+        def decode_plan(data, metadata):
+            return None
+
+        return decode_plan
+
+    @classmethod
+    def compile_skip_plan(cls, runtime_config):
+        return 0
+
+    @classmethod
+    def compile_encode_plan(cls, runtime_config):
+        def encode_plan(value, buffer, metadata):
+            pass
+
+        return encode_plan
+
 
 class StorageHasher(Enum):
 
@@ -1518,6 +3457,8 @@ class GenericVote(U8):
 
 class GenericCall(ScaleType):
 
+    __slots__ = ('call_index', 'call_function', 'call_args', 'call_module', 'call_hash')
+
     def __init__(self, data, **kwargs):
         self.call_index = None
         self.call_function = None
@@ -1543,7 +3484,10 @@ class GenericCall(ScaleType):
 
             self.call_args = self.call_function['fields']
 
-            call_hash = blake2b(self.get_used_bytes(), digest_size=32).digest()
+            # Hash only the bytes of this call; `data_end_offset` is not known yet while processing
+            call_hash = blake2b(
+                self.data.get_data_range(self.data_start_offset, self.data.offset), digest_size=32
+            ).digest()
 
             call_args = []
 
@@ -1646,7 +3590,8 @@ class GenericCall(ScaleType):
             if not self.call_module:
                 raise ValueError(f"Pallet '{value['call_module']}' not found")
 
-            data = ScaleBytes(self.call_module['index'].get_used_bytes())
+            # Accumulate in a private buffer and wrap it once, see `Vec.process_encode()`
+            data = bytearray(self.call_module['index'].get_used_bytes())
 
             if self.call_module['calls'].value_object:
                 # Retrieve call function
@@ -1661,7 +3606,7 @@ class GenericCall(ScaleType):
 
             self.value_object['call_function'] = self.call_function
 
-            data += ScaleBytes(self.call_function['index'].get_used_bytes())
+            data += self.call_function['index'].get_used_bytes()
 
             self.call_index = "{:02x}{:02x}".format(
                 self.call_module.value['index'], self.call_function.value['index']
@@ -1687,13 +3632,13 @@ class GenericCall(ScaleType):
                             type_string=arg.get_type_string(),
                             metadata=self.metadata
                         )
-                        data += arg_obj.encode(param_value)
+                        data += arg_obj.encode(param_value).data
 
                         self.value_object['call_args'][arg.value['name']] = arg_obj
 
-            self.call_hash = blake2b(data.data, digest_size=32).digest()
+            self.call_hash = blake2b(data, digest_size=32).digest()
 
-            return data
+            return ScaleBytes(data)
 
         else:
 
@@ -1719,7 +3664,7 @@ class GenericCall(ScaleType):
             elif not self.call_module or not self.call_function:
                 raise ValueError('No call module and function specified')
 
-            data = ScaleBytes(bytearray.fromhex(self.call_index))
+            data = bytearray.fromhex(self.call_index)
 
             # Encode call params
             if len(self.call_function.args) > 0:
@@ -1734,16 +3679,239 @@ class GenericCall(ScaleType):
                         arg_obj = self.runtime_config.create_scale_object(
                             type_string=arg.type, metadata=self.metadata
                         )
-                        data += arg_obj.encode(param_value)
+                        data += arg_obj.encode(param_value).data
 
                         self.value_object['call_args'][arg.name] = arg_obj
 
-            return data
+            return ScaleBytes(data)
 
     @classmethod
     def generate_type_decomposition(cls, _recursion_level: int = 0, max_recursion: int = TYPE_DECOMP_MAX_RECURSIVE):
         return 'Call'
 
+    @classmethod
+    def compile_decode_plan(cls, runtime_config):
+        call_plan = cls.compile_call_plan(runtime_config, iterative=False)
+
+        def decode_plan(data, metadata):
+            # Without iterative plans of the call arguments the plan returns without yielding
+            try:
+                next(call_plan(data, metadata))
+            except StopIteration as stop:
+                return stop.value
+
+        return decode_plan
+
+    @classmethod
+    def compile_iterative_plan(cls, runtime_config):
+        return cls.compile_call_plan(runtime_config, iterative=True)
+
+    @classmethod
+    def compile_call_plan(cls, runtime_config, iterative: bool = False) -> Callable:
+        """
+        Compiles a generator function that decodes a call, shared by the decode plan and the iterative plan
+
+        Parameters
+        ----------
+        runtime_config
+        iterative: yield the iterative plans of the call arguments instead of decoding them, see
+            `RuntimeConfigurationObject.get_iterative_plan()`
+
+        Returns
+        -------
+        Callable
+        """
+        object_plan = super().compile_decode_plan(runtime_config)
+
+        def call_plan(data, metadata):
+            if not metadata.portable_registry:
+                return object_plan(data, metadata)
+
+            start_offset = data.offset
+
+            pallet_index = int.from_bytes(data.get_next_bytes(1), byteorder='little')
+            call_module = metadata.get_pallet_by_index(pallet_index)
+            call_type_string = call_module['calls'].value_object.get_type_string()
+
+            call_enum_index = data.get_data_range(data.offset, data.offset + 1)[0]
+
+            call_iterative_plan = runtime_config.get_iterative_plan(call_type_string) if iterative else None
+
+            if call_iterative_plan is None:
+                call_value = runtime_config.get_decode_plan(call_type_string)(data, metadata)
+            else:
+                call_value = yield call_iterative_plan
+
+            call_function = runtime_config.get_decoder_class(call_type_string).scale_info_type['def'][1]\
+                .get_variant_by_index(call_enum_index)
+
+            call_args = []
+
+            if len(call_function['fields']) > 0:
+                call_args_value = list(call_value.values())[0]
+
+                if type(call_args_value) is not dict:
+                    # Unnamed call arguments are decoded via a ScaleType object
+                    data.offset = start_offset
+                    return object_plan(data, metadata)
+
+                for call_arg in call_function['fields']:
+                    call_args.append({
+                        'name': call_arg.value['name'],
+                        'type': cls.convert_type(call_arg.value['typeName']),
+                        'value': call_args_value[call_arg.value['name']]
+                    })
+
+            call_hash = blake2b(data.get_data_range(start_offset, data.offset), digest_size=32).digest()
+
+            return {
+                'call_index': '0x{:02x}{:02x}'.format(pallet_index, call_enum_index),
+                'call_function': call_function.name,
+                'call_module': call_module.name,
+                'call_args': call_args,
+                'call_hash': f'0x{call_hash.hex()}'
+            }
+
+        return call_plan
+
+    @classmethod
+    def compile_skip_plan(cls, runtime_config):
+        decode_plan = runtime_config.get_decode_plan(cls)
+
+        def skip_plan(data, metadata):
+            if not metadata.portable_registry:
+                decode_plan(data, metadata)
+                return
+
+            pallet_index = int.from_bytes(data.get_next_bytes(1), byteorder='little')
+            call_module = metadata.get_pallet_by_index(pallet_index)
+
+            runtime_config.skip(call_module['calls'].value_object.get_type_string(), data, metadata=metadata)
+
+        return skip_plan
+
+    @classmethod
+    def compile_projection_plan(cls, runtime_config, selector_tree):
+        cls.check_selector_fields(
+            selector_tree, ('call_index', 'call_function', 'call_module', 'call_args', 'call_hash')
+        )
+
+        decode_plan = runtime_config.get_decode_plan(cls)
+
+        if 'call_args' in selector_tree:
+            def projection_plan(data, metadata):
+                return cls.project_value(decode_plan(data, metadata), selector_tree)
+
+            return projection_plan
+
+        def projection_plan(data, metadata):
+            if not metadata.portable_registry:
+                return cls.project_value(decode_plan(data, metadata), selector_tree)
+
+            start_offset = data.offset
+
+            pallet_index = int.from_bytes(data.get_next_bytes(1), byteorder='little')
+            call_module = metadata.get_pallet_by_index(pallet_index)
+            call_type_string = call_module['calls'].value_object.get_type_string()
+
+            # Call arguments are not selected, so the call enum is skipped entirely
+            call_enum_index = data.get_data_range(data.offset, data.offset + 1)[0]
+            runtime_config.skip(call_type_string, data, metadata=metadata)
+
+            value = {}
+
+            if 'call_index' in selector_tree:
+                value['call_index'] = '0x{:02x}{:02x}'.format(pallet_index, call_enum_index)
+
+            if 'call_function' in selector_tree:
+                value['call_function'] = runtime_config.get_decoder_class(call_type_string)\
+                    .scale_info_type['def'][1].get_variant_by_index(call_enum_index).name
+
+            if 'call_module' in selector_tree:
+                value['call_module'] = call_module.name
+
+            if 'call_hash' in selector_tree:
+                call_hash = blake2b(data.get_data_range(start_offset, data.offset), digest_size=32).digest()
+                value['call_hash'] = f'0x{call_hash.hex()}'
+
+            return value
+
+        return projection_plan
+
+    @classmethod
+    def compile_encode_plan(cls, runtime_config):
+        object_plan = super().compile_encode_plan(runtime_config)
+
+        # Call index and argument plans per call function, valid for the metadata in `call_plans_metadata`
+        call_plans = {}
+        call_plans_metadata = [None]
+
+        def get_call_plan(metadata, call_module_name, call_function_name):
+            if call_plans_metadata[0] is not metadata:
+                call_plans.clear()
+                call_plans_metadata[0] = metadata
+
+            call_plan = call_plans.get((call_module_name, call_function_name))
+
+            if call_plan is None:
+                call_module = metadata.get_metadata_pallet(call_module_name)
+
+                if not call_module:
+                    raise ValueError(f"Pallet '{call_module_name}' not found")
+
+                call_function = None
+
+                if call_module['calls'].value_object:
+                    call_type_string = call_module['calls'].value_object.get_type_string()
+                    call_function = runtime_config.get_decoder_class(call_type_string).scale_info_type['def'][1]\
+                        .get_variant_by_name(call_function_name)
+
+                if not call_function:
+                    raise ValueError(f"Call function '{call_module_name}.{call_function_name}' not found")
+
+                call_index = bytes(call_module['index'].get_used_bytes()) + \
+                    bytes(call_function['index'].get_used_bytes())
+
+                arg_plans = [
+                    (arg.value['name'], runtime_config.get_encode_plan(arg.get_type_string()))
+                    for arg in call_function['fields']
+                ]
+
+                call_plan = call_plans[(call_module_name, call_function_name)] = (call_index, arg_plans)
+
+            return call_plan
+
+        def encode_plan(value, buffer, metadata):
+            if type(value) is not dict:
+                raise TypeError("value must be of type dict to encode a GenericCall")
+
+            if not metadata.portable_registry:
+                return object_plan(value, buffer, metadata)
+
+            if 'call_index' in value:
+                raise NotImplementedError()
+            elif 'call_module' not in value or 'call_function' not in value:
+                raise ValueError('No call module and function specified')
+
+            call_index, arg_plans = get_call_plan(metadata, value['call_module'], value['call_function'])
+
+            buffer += call_index
+
+            if len(arg_plans) > 0:
+                call_args = value['call_args']
+
+                # convert alternative list format of call_args
+                if type(call_args) is list:
+                    call_args = {ca['name']: ca['value'] for ca in call_args}
+
+                for arg_name, arg_plan in arg_plans:
+                    if arg_name not in call_args:
+                        raise ValueError('Parameter \'{}\' not specified'.format(arg_name))
+
+                    arg_plan(call_args[arg_name], buffer, metadata)
+
+        return encode_plan
+
 
 class GenericContractExecResult(Enum):
     def __init__(self, data=None, contract_result_scale_type=None, **kwargs):
@@ -1916,71 +4084,203 @@ class MultiAccountId(GenericAccountId):
         return multi_account_obj
 
 
-class FixedLengthArray(ScaleType):
-    """
-    Fixed sized array of specified subtype e.g. [u8; 8]
-    """
-    element_count = 0
+class FixedLengthArray(ScaleType):
+    """
+    Fixed sized array of specified subtype e.g. [u8; 8]
+    """
+    element_count = 0
+
+    def process(self):
+
+        if self.element_count:
+            if self.runtime_config.get_decoder_class(self.sub_type) is U8:
+                self.value_object = self.get_next_bytes(self.element_count)
+                return '0x{}'.format(self.value_object.hex())
+            else:
+                if self.runtime_config.numpy_arrays:
+                    element_dtype = self.runtime_config.get_numpy_dtype(self.sub_type)
+
+                    if element_dtype is not None:
+                        array = Vec.decode_numpy_array(self.data, self.element_count, numpy.dtype(element_dtype))
+
+                        if array is not None:
+                            self.value_object = array
+                            return array
+
+                result = []
+                for idx in range(self.element_count):
+                    result.append(self.process_type(self.sub_type).value)
+        else:
+            result = []
+
+        return result
+
+    def process_encode(self, value):
+        if numpy is not None and isinstance(value, numpy.ndarray):
+            value = value.tolist()
+
+        value = value or []
+
+        if self.runtime_config.get_decoder_class(self.sub_type) is U8:
+            # u8 arrays are represented as bytes or hex-bytes (e.g. [u8; 3] as 0x123456)
+            if type(value) is str and value[0:2] == '0x':
+                value = bytes.fromhex(value[2:])
+
+            if type(value) is list:
+                value = bytes(value)
+
+            if type(value) is not bytes:
+                raise ValueError('Value should a hex-string (0x..) or bytes')
+
+            if len(value) != self.element_count:
+                raise ValueError('Value should be {} bytes long'.format(self.element_count))
+
+            return ScaleBytes(value)
+
+        else:
+
+            if not type(value) is list:
+                raise ValueError('Given value is not a list')
+
+            # Accumulate in a private buffer, concatenating ScaleBytes would copy all previous data for every element
+            data = bytearray()
+
+            for element_value in value:
+                element_obj = self.runtime_config.create_scale_object(
+                    type_string=self.sub_type, metadata=self.metadata
+                )
+                data += element_obj.encode(element_value).data
+
+            return ScaleBytes(data)
+
+    @classmethod
+    def generate_type_decomposition(cls, _recursion_level: int = 0, max_recursion: int = TYPE_DECOMP_MAX_RECURSIVE):
+        if cls.sub_type is None:
+            raise ValueError("'sub_type' is not set")
+
+        sub_cls = cls.runtime_config.get_decoder_class(cls.sub_type)
+        sub_cls_decomp = sub_cls.generate_type_decomposition(
+            _recursion_level=_recursion_level + 1, max_recursion=max_recursion
+        )
+        return f'[{sub_cls_decomp}; {cls.element_count}]'
+
+    @classmethod
+    def has_type_definition(cls) -> bool:
+        return cls.sub_type is not None
+
+    @classmethod
+    def compile_decode_plan(cls, runtime_config):
+        element_count = cls.element_count
+
+        if not element_count:
+            def decode_plan(data, metadata):
+                return []
+
+        elif runtime_config.get_decoder_class(cls.sub_type) is U8:
+            def decode_plan(data, metadata):
+                return '0x{}'.format(data.get_next_bytes(element_count).hex())
+
+        else:
+            element_plan = runtime_config.get_decode_plan(cls.sub_type)
+            element_dtype = runtime_config.get_numpy_dtype(cls.sub_type)
+
+            if element_dtype is not None:
+                element_dtype = numpy.dtype(element_dtype)
+                decode_numpy_array = Vec.decode_numpy_array
+                numpy_array_to_value = Vec.numpy_array_to_value
+
+                def decode_plan(data, metadata):
+                    array = decode_numpy_array(data, element_count, element_dtype)
+
+                    if array is None:
+                        return [element_plan(data, None) for _ in range(element_count)]
+
+                    return numpy_array_to_value(array, runtime_config.numpy_arrays)
+
+            else:
+                def decode_plan(data, metadata):
+                    return [element_plan(data, None) for _ in range(element_count)]
+
+        return decode_plan
+
+    @classmethod
+    def compile_iterative_plan(cls, runtime_config):
+        element_count = cls.element_count
+
+        if not element_count or runtime_config.get_decoder_class(cls.sub_type) is U8:
+            return None
+
+        element_plan = runtime_config.get_iterative_plan(cls.sub_type)
+
+        if element_plan is None:
+            return None
+
+        def iterative_plan(data, metadata):
+            value = []
+            for _ in range(element_count):
+                value.append((yield element_plan))
+            return value
+
+        return iterative_plan
+
+    @classmethod
+    def compile_skip_plan(cls, runtime_config):
+        element_count = cls.element_count
+
+        if not element_count:
+            return 0
+
+        element_plan = runtime_config.get_skip_plan(cls.sub_type)
+
+        if type(element_plan) is int:
+            return element_count * element_plan
+
+        def skip_plan(data, metadata):
+            for _ in range(element_count):
+                element_plan(data, None)
+
+        return skip_plan
 
-    def process(self):
+    @classmethod
+    def compile_encode_plan(cls, runtime_config):
+        element_count = cls.element_count
 
-        if self.element_count:
-            if self.runtime_config.get_decoder_class(self.sub_type) is U8:
-                self.value_object = self.get_next_bytes(self.element_count)
-                return '0x{}'.format(self.value_object.hex())
-            else:
-                result = []
-                for idx in range(self.element_count):
-                    result.append(self.process_type(self.sub_type).value)
-        else:
-            result = []
+        if runtime_config.get_decoder_class(cls.sub_type) is U8:
+            def encode_plan(value, buffer, metadata):
+                value = value or []
 
-        return result
+                # u8 arrays are represented as bytes or hex-bytes (e.g. [u8; 3] as 0x123456)
+                if type(value) is str and value[0:2] == '0x':
+                    value = bytes.fromhex(value[2:])
 
-    def process_encode(self, value):
-        data = ScaleBytes(bytearray())
+                if type(value) is list:
+                    value = bytes(value)
 
-        value = value or []
+                if type(value) is not bytes:
+                    raise ValueError('Value should a hex-string (0x..) or bytes')
 
-        if self.runtime_config.get_decoder_class(self.sub_type) is U8:
-            # u8 arrays are represented as bytes or hex-bytes (e.g. [u8; 3] as 0x123456)
-            if type(value) is str and value[0:2] == '0x':
-                value = bytes.fromhex(value[2:])
+                if len(value) != element_count:
+                    raise ValueError('Value should be {} bytes long'.format(element_count))
 
-            if type(value) is list:
-                value = bytes(value)
+                buffer += value
 
-            if type(value) is not bytes:
-                raise ValueError('Value should a hex-string (0x..) or bytes')
+            return encode_plan
 
-            if len(value) != self.element_count:
-                raise ValueError('Value should be {} bytes long'.format(self.element_count))
+        element_plan = runtime_config.get_encode_plan(cls.sub_type)
 
-            return ScaleBytes(value)
+        def encode_plan(value, buffer, metadata):
+            if numpy is not None and isinstance(value, numpy.ndarray):
+                value = value.tolist()
 
-        else:
+            value = value or []
 
             if not type(value) is list:
                 raise ValueError('Given value is not a list')
 
             for element_value in value:
-                element_obj = self.runtime_config.create_scale_object(
-                    type_string=self.sub_type, metadata=self.metadata
-                )
-                data += element_obj.encode(element_value)
-
-            return data
-
-    @classmethod
-    def generate_type_decomposition(cls, _recursion_level: int = 0, max_recursion: int = TYPE_DECOMP_MAX_RECURSIVE):
-        if cls.sub_type is None:
-            raise ValueError("'sub_type' is not set")
+                element_plan(element_value, buffer, metadata)
 
-        sub_cls = cls.runtime_config.get_decoder_class(cls.sub_type)
-        sub_cls_decomp = sub_cls.generate_type_decomposition(
-            _recursion_level=_recursion_level + 1, max_recursion=max_recursion
-        )
-        return f'[{sub_cls_decomp}; {cls.element_count}]'
+        return encode_plan
 
 
 class GenericMultiAddress(Enum):
@@ -1997,6 +4297,8 @@ class GenericMultiAddress(Enum):
         ["Address20", "H160"],
       ]
 
+    __slots__ = ('account_length', 'account_id', 'account_index', 'account_idx')
+
     def __init__(self, data, **kwargs):
         self.account_length = None
         self.account_id = None
@@ -2052,6 +4354,63 @@ class GenericMultiAddress(Enum):
 
         return super().process_encode(value)
 
+    @classmethod
+    def compile_decode_plan(cls, runtime_config):
+        variant_plans = cls.compile_variant_decode_plans(runtime_config)
+
+        def decode_plan(data, metadata):
+            index = int.from_bytes(data.get_next_bytes(1), byteorder='little')
+            try:
+                variant_name, variant_plan = variant_plans[index]
+            except IndexError:
+                raise ValueError("Index '{}' not present in Enum type mapping".format(index))
+
+            if variant_plan is None:
+                value = variant_name
+            else:
+                value = {variant_name: variant_plan(data, metadata)}
+
+            if index in (0, 1):
+                # AccountId and AccountIndex are returned without variant name
+                return list(value.values())[0]
+
+            return value
+
+        return decode_plan
+
+    @classmethod
+    def compile_skip_plan(cls, runtime_config):
+        return super().compile_skip_plan(runtime_config)
+
+    @classmethod
+    def compile_encode_plan(cls, runtime_config):
+        enum_plan = super().compile_encode_plan(runtime_config)
+
+        def encode_plan(value, buffer, metadata):
+            if type(value) is int:
+                # Implied decoded AccountIndex
+                value = {"Index": value}
+
+            elif type(value) is str:
+                if len(value) <= 8 and value[0:2] != '0x':
+                    # Implied raw AccountIndex
+                    value = {"Index": ss58_decode_account_index(value)}
+                elif is_valid_ss58_address(value):
+                    # Implied SS58 encoded AccountId
+                    value = {"Id": f'0x{ss58_decode(value)}'}
+                elif len(value) == 66 and value[0:2] == '0x':
+                    # Implied raw AccountId
+                    value = {"Id": value}
+                elif len(value) == 42:
+                    # Implied raw Address20
+                    value = {"Address20": value}
+                else:
+                    raise NotImplementedError("Address type not yet supported")
+
+            enum_plan(value, buffer, metadata)
+
+        return encode_plan
+
 
 class Map(ScaleType):
 
@@ -2062,7 +4421,7 @@ class Map(ScaleType):
         self.map_value = None
 
         if self.sub_type:
-            sub_type_parts = [x.strip() for x in self.sub_type.split(',')]
+            sub_type_parts = split_type_params(self.sub_type)
             self.map_key = sub_type_parts[0]
             self.map_value = sub_type_parts[1]
 
@@ -2095,20 +4454,95 @@ class Map(ScaleType):
 
         element_count_compact.encode(len(value))
 
-        data = element_count_compact.data
+        # Accumulate in a private buffer, concatenating ScaleBytes would copy all previous data for every item
+        data = bytearray(element_count_compact.data.data)
 
         for item_key, item_value in value:
             key_obj = self.runtime_config.create_scale_object(
                 type_string=self.map_key, metadata=self.metadata
             )
-            data += key_obj.encode(item_key)
+            data += key_obj.encode(item_key).data
 
             value_obj = self.runtime_config.create_scale_object(
                 type_string=self.map_value, metadata=self.metadata
             )
-            data += value_obj.encode(item_value)
+            data += value_obj.encode(item_value).data
 
-        return data
+        return ScaleBytes(data)
+
+    @classmethod
+    def has_type_definition(cls) -> bool:
+        return cls.sub_type is not None or cls.type_mapping is not None
+
+    @classmethod
+    def compile_decode_plan(cls, runtime_config):
+        decode_compact_int = Compact.decode_compact_int
+
+        if cls.sub_type:
+            sub_type_parts = split_type_params(cls.sub_type)
+            key_plan = runtime_config.get_decode_plan(sub_type_parts[0])
+            value_plan = runtime_config.get_decode_plan(sub_type_parts[1])
+
+            def decode_plan(data, metadata):
+                return [
+                    (key_plan(data, metadata), value_plan(data, metadata)) for _ in range(decode_compact_int(data))
+                ]
+
+        elif cls.type_mapping:
+            return runtime_config.get_decode_plan(cls.type_mapping[0])
+
+        else:
+            def decode_plan(data, metadata):
+                raise ValueError('sub_type or type_mapping should be set to process a Map')
+
+        return decode_plan
+
+    @classmethod
+    def compile_skip_plan(cls, runtime_config):
+        decode_compact_int = Compact.decode_compact_int
+
+        if cls.sub_type:
+            sub_type_parts = split_type_params(cls.sub_type)
+            item_plan = Struct.combine_skip_plans([
+                runtime_config.get_skip_plan(sub_type_parts[0]), runtime_config.get_skip_plan(sub_type_parts[1])
+            ])
+
+            if type(item_plan) is int:
+                def skip_plan(data, metadata):
+                    data.skip_bytes(decode_compact_int(data) * item_plan)
+            else:
+                def skip_plan(data, metadata):
+                    for _ in range(decode_compact_int(data)):
+                        item_plan(data, metadata)
+
+            return skip_plan
+
+        return runtime_config.get_skip_plan(cls.type_mapping[0])
+
+    @classmethod
+    def compile_encode_plan(cls, runtime_config):
+        encode_compact_int = Compact.encode_compact_int
+
+        if not cls.sub_type:
+            raise NotImplementedError('Map without sub_type is encoded via a ScaleType object')
+
+        sub_type_parts = split_type_params(cls.sub_type)
+        key_plan = runtime_config.get_encode_plan(sub_type_parts[0])
+        value_plan = runtime_config.get_encode_plan(sub_type_parts[1])
+
+        def encode_plan(value, buffer, metadata):
+            if type(value) is not list:
+                raise ValueError(
+                    "value should be a list of tuples e.g.: [('1', 2), ('23', 24), ('28', 30), ('45', 80)]"
+                )
+
+            buffer += encode_compact_int(len(value))
+
+            for item_key, item_value in value:
+                key_plan(item_key, buffer, metadata)
+                value_plan(item_value, buffer, metadata)
+
+        return encode_plan
 
 
 class HashMap(Map):
@@ -2145,6 +4579,42 @@ class BTreeSet(ScaleType):
         )
         return self.value_object.encode(value)
 
+    @classmethod
+    def has_type_definition(cls) -> bool:
+        return cls.sub_type is not None or cls.type_mapping is not None
+
+    @classmethod
+    def compile_decode_plan(cls, runtime_config):
+        type_mapping = cls.type_mapping
+
+        if not type_mapping and cls.sub_type:
+            type_mapping = [f"Vec<{cls.sub_type}>"]
+
+        vec_plan = runtime_config.get_decode_plan(type_mapping[0])
+
+        def decode_plan(data, metadata):
+            return vec_plan(data, None)
+
+        return decode_plan
+
+    @classmethod
+    def compile_skip_plan(cls, runtime_config):
+        type_mapping = cls.type_mapping
+
+        if not type_mapping and cls.sub_type:
+            type_mapping = [f"Vec<{cls.sub_type}>"]
+
+        return runtime_config.get_skip_plan(type_mapping[0])
+
+    @classmethod
+    def compile_encode_plan(cls, runtime_config):
+        type_mapping = cls.type_mapping
+
+        if not type_mapping and cls.sub_type:
+            type_mapping = [f"Vec<{cls.sub_type}>"]
+
+        return runtime_config.get_encode_plan(type_mapping[0])
+
 
 class GenericMetadataAll(Enum):
     """
@@ -2853,6 +5323,8 @@ class GenericExtrinsic(ScaleType):
     The Extrinsic type is used to send transactions from an account to the Substrate runtime, and it can contain
     one or more calls to the runtime functions.
     """
+    __slots__ = ('signed',)
+
     def __init__(self, *arg, **kwargs):
         self.signed = None
         super().__init__(*arg, **kwargs)
@@ -2896,6 +5368,47 @@ class GenericExtrinsic(ScaleType):
 
         return value
 
+    def process_lazy(self, check_remaining: bool = True):
+
+        if type(self).process is not GenericExtrinsic.process:
+            return self.process()
+
+        start_offset = self.data.offset
+
+        extrinsic_length_obj = self.process_type('Compact<u32>')
+        end_offset = self.data.offset + extrinsic_length_obj.value
+
+        version = self.process_type('u8').value
+
+        self.signed = (version & 128) == 128
+
+        if self.signed and version & 127 != 4:
+            # Unsupported versions raise the same error as eager decoding
+            self.data.offset = start_offset
+            return self.process()
+
+        body_obj = self.runtime_config.create_scale_object(
+            'ExtrinsicV4' if self.signed else 'Inherent', metadata=self.metadata
+        )
+
+        lazy_elements = LazyElements(
+            self, ['Null' if data_type is None else data_type for _, data_type in body_obj.type_mapping],
+            check_remaining, end_offset=end_offset
+        )
+        keys = [key for key, _ in body_obj.type_mapping]
+
+        self.value_object = LazyStruct(
+            lazy_elements, keys, objects=True, decoded={'extrinsic_length': extrinsic_length_obj}
+        )
+
+        # Hash the byte range of the extrinsic, the data can contain more extrinsics
+        extrinsic_hash = blake2b(self.data.get_data_range(start_offset, end_offset), digest_size=32).digest()
+
+        return LazyStruct(lazy_elements, keys, decoded={
+            'extrinsic_hash': f'0x{extrinsic_hash.hex()}',
+            'extrinsic_length': extrinsic_length_obj.value
+        })
+
     def process_encode(self, value):
 
         # Backwards compatibility cases
@@ -2917,10 +5430,10 @@ class GenericExtrinsic(ScaleType):
 
         # Determine version (Fixed to V4 for now)
         if 'address' in value:
-            data = ScaleBytes('0x84')
+            data = bytearray(b'\x84')
             self.signed = True
         else:
-            data = ScaleBytes('0x04')
+            data = bytearray(b'\x04')
             self.signed = False
 
         self.value_object = {}
@@ -2930,12 +5443,12 @@ class GenericExtrinsic(ScaleType):
         else:
             extrinsic = self.runtime_config.create_scale_object('Inherent', metadata=self.metadata)
 
-        data += extrinsic.encode(value)
+        data += extrinsic.encode(value).data
         self.value_object.update(extrinsic.value_object)
 
         # Wrap payload with a length Compact<u32>
         length_obj = self.runtime_config.create_scale_object('Compact<u32>')
-        data = length_obj.encode(data.length) + data
+        data = length_obj.encode(len(data)) + data
 
         self.value_object['extrinsic_length'] = length_obj
 
@@ -2945,6 +5458,118 @@ class GenericExtrinsic(ScaleType):
     def generate_type_decomposition(cls, _recursion_level: int = 0, max_recursion: int = TYPE_DECOMP_MAX_RECURSIVE):
         return 'Extrinsic'
 
+    @classmethod
+    def compile_projection_plan(cls, runtime_config, selector_tree):
+        decode_compact_int = Compact.decode_compact_int
+        decode_plan = runtime_config.get_decode_plan(cls)
+
+        body_selector_tree = {
+            key: field_selectors for key, field_selectors in selector_tree.items()
+            if key not in ('extrinsic_hash', 'extrinsic_length')
+        }
+
+        if len(body_selector_tree) > 0:
+            # Fields of signed extrinsics are not present in inherents, they are checked by the signed plan
+            inherent_fields = [key for key, _ in runtime_config.get_decoder_class('Inherent').type_mapping]
+            inherent_plan = runtime_config.get_projection_plan('Inherent', {
+                key: field_selectors for key, field_selectors in body_selector_tree.items() if key in inherent_fields
+            })
+        else:
+            inherent_plan = None
+
+        # The signed extrinsic layout depends on the signed extensions in the metadata
+        signed_plan_cache = [None, None]
+
+        def projection_plan(data, metadata):
+            start_offset = data.offset
+
+            extrinsic_length = decode_compact_int(data)
+            end_offset = data.offset + extrinsic_length
+
+            body = {}
+
+            if inherent_plan is None:
+                # Only the length prefix is required
+                data.skip_bytes(extrinsic_length)
+            else:
+                version = data.get_next_bytes(1)
+
+                if len(version) == 0 or (version[0] & 128 == 128 and version[0] & 127 != 4):
+                    data.offset = start_offset
+                    return cls.project_value(decode_plan(data, metadata), selector_tree)
+
+                if version[0] & 128 == 128:
+                    if signed_plan_cache[0] is not metadata:
+                        extrinsic_obj = runtime_config.create_scale_object('ExtrinsicV4', metadata=metadata)
+                        signed_plan_cache[:] = [metadata, runtime_config.get_projection_plan(
+                            dict(extrinsic_obj.type_mapping), body_selector_tree
+                        )]
+
+                    body = signed_plan_cache[1](data, metadata)
+                else:
+                    body = inherent_plan(data, metadata)
+
+            value = {}
+
+            if 'extrinsic_hash' in selector_tree:
+                extrinsic_hash = blake2b(data.get_data_range(start_offset, end_offset), digest_size=32).digest()
+                value['extrinsic_hash'] = f'0x{extrinsic_hash.hex()}'
+
+            if 'extrinsic_length' in selector_tree:
+                value['extrinsic_length'] = extrinsic_length
+
+            value.update(body)
+
+            return value
+
+        return projection_plan
+
+    @classmethod
+    def compile_encode_plan(cls, runtime_config):
+        encode_compact_int = Compact.encode_compact_int
+        inherent_plan = runtime_config.get_encode_plan('Inherent')
+
+        # The signed extrinsic layout depends on the signed extensions in the metadata
+        signed_plan_cache = [None, None]
+
+        def encode_plan(value, buffer, metadata):
+            value = dict(value)
+
+            # Backwards compatibility cases
+            if 'address' not in value and 'account_id' in value:
+                value['address'] = value['account_id']
+
+            if 'signature_version' in value:
+                multisig_cls = runtime_config.get_decoder_class('MultiSignature')
+                value['signature'] = {
+                    multisig_cls.type_mapping[value['signature_version']][0]: value['signature']
+                }
+
+            if 'call' not in value:
+                value['call'] = {
+                    'call_function': value.get('call_function'),
+                    'call_module': value.get('call_module'),
+                    'call_args': value.get('call_args'),
+                }
+
+            # Determine version (Fixed to V4 for now)
+            if 'address' in value:
+                if signed_plan_cache[0] is not metadata:
+                    extrinsic_obj = runtime_config.create_scale_object('ExtrinsicV4', metadata=metadata)
+                    signed_plan_cache[:] = [metadata, runtime_config.get_encode_plan(dict(extrinsic_obj.type_mapping))]
+
+                extrinsic_data = bytearray(b'\x84')
+                signed_plan_cache[1](value, extrinsic_data, metadata)
+            else:
+                extrinsic_data = bytearray(b'\x04')
+                inherent_plan(value, extrinsic_data, metadata)
+
+            # Wrap payload with a length Compact<u32>
+            buffer += encode_compact_int(len(extrinsic_data))
+            buffer += extrinsic_data
+
+        return encode_plan
+
 
 class Extrinsic(GenericExtrinsic):
     pass
@@ -2994,6 +5619,8 @@ class GenericEvent(Enum):
     It is implemented as a variant enum that contains different types of events, such as system events, runtime events,
     and custom events, each with its own set of fields that describe the event.
     """
+    __slots__ = ('event_idx', 'event_index', 'attributes', 'event', 'event_module')
+
     def __init__(self, *args, **kwargs):
 
         self.event_idx = None
@@ -3040,6 +5667,8 @@ class GenericEvent(Enum):
 
 class GenericScaleInfoEvent(Enum):
 
+    __slots__ = ('event_index', 'event', 'event_module')
+
     def __init__(self, *args, **kwargs):
 
         self.event_index = None
@@ -3061,6 +5690,134 @@ class GenericScaleInfoEvent(Enum):
             'attributes': self.value_object[1][1].value if self.value_object[1][1] else None,
         }
 
+    @classmethod
+    def compile_decode_plan(cls, runtime_config):
+        # Fallback decoding via a ScaleType object instead of the plan of Enum
+        object_plan = super(Enum, cls).compile_decode_plan(runtime_config)
+        pallet_plans = []
+
+        for pallet_name, event_type in cls.type_mapping:
+            event_class = None
+
+            if event_type is not None and event_type != 'Null':
+                event_class = runtime_config.get_decoder_class(event_type)
+
+            if event_class is None or not issubclass(event_class, Enum) or event_class.process is not Enum.process:
+                # Decoded via a ScaleType object
+                pallet_plans.append((pallet_name, None))
+                continue
+
+            event_plans = []
+            for event_name, attributes_plan in event_class.compile_variant_decode_plans(runtime_config):
+                # Like ScaleType objects with a length, empty Vec attributes are represented as None
+                attributes_have_length = attributes_plan is not None and hasattr(
+                    runtime_config.get_decoder_class(dict(event_class.type_mapping)[event_name]), '__len__'
+                )
+                event_plans.append((event_name, attributes_plan, attributes_have_length))
+
+            pallet_plans.append((pallet_name, event_plans))
+
+        def decode_plan(data, metadata):
+            start_offset = data.offset
+
+            pallet_index = int.from_bytes(data.get_next_bytes(1), byteorder='little')
+            event_index = int.from_bytes(data.get_next_bytes(1), byteorder='little')
+
+            if pallet_index >= len(pallet_plans) or pallet_plans[pallet_index][1] is None or \
+                    event_index >= len(pallet_plans[pallet_index][1]):
+                data.offset = start_offset
+                return object_plan(data, metadata)
+
+            pallet_name, event_plans = pallet_plans[pallet_index]
+            event_name, attributes_plan, attributes_have_length = event_plans[event_index]
+
+            attributes = None
+
+            if attributes_plan is not None:
+                attributes = attributes_plan(data, metadata)
+
+                if attributes_have_length and len(attributes) == 0:
+                    attributes = None
+
+            return {
+                'event_index': bytes([pallet_index, event_index]).hex(),
+                'module_id': pallet_name,
+                'event_id': event_name,
+                'attributes': attributes,
+            }
+
+        return decode_plan
+
+    @classmethod
+    def compile_skip_plan(cls, runtime_config):
+        # Events have the same layout as a two level Enum
+        return super().compile_skip_plan(runtime_config)
+
+    @classmethod
+    def compile_projection_plan(cls, runtime_config, selector_tree):
+        cls.check_selector_fields(selector_tree, ('event_index', 'module_id', 'event_id', 'attributes'))
+
+        decode_plan = runtime_config.get_decode_plan(cls)
+
+        if 'attributes' in selector_tree:
+            def projection_plan(data, metadata):
+                return cls.project_value(decode_plan(data, metadata), selector_tree)
+
+            return projection_plan
+
+        pallet_plans = []
+
+        for pallet_name, event_type in cls.type_mapping:
+            event_class = None
+
+            if event_type is not None and event_type != 'Null':
+                event_class = runtime_config.get_decoder_class(event_type)
+
+            if event_class is None or not issubclass(event_class, Enum) or event_class.process is not Enum.process \
+                    or not event_class.type_mapping:
+                # Decoded via the decode plan
+                pallet_plans.append((pallet_name, None))
+                continue
+
+            pallet_plans.append((pallet_name, [
+                (event_name, 0 if attributes_type in (None, 'Null') else runtime_config.get_skip_plan(attributes_type))
+                for event_name, attributes_type in event_class.type_mapping
+            ]))
+
+        def projection_plan(data, metadata):
+            start_offset = data.offset
+
+            pallet_index = int.from_bytes(data.get_next_bytes(1), byteorder='little')
+            event_index = int.from_bytes(data.get_next_bytes(1), byteorder='little')
+
+            if pallet_index >= len(pallet_plans) or pallet_plans[pallet_index][1] is None or \
+                    event_index >= len(pallet_plans[pallet_index][1]):
+                data.offset = start_offset
+                return cls.project_value(decode_plan(data, metadata), selector_tree)
+
+            pallet_name, event_plans = pallet_plans[pallet_index]
+            event_name, attributes_plan = event_plans[event_index]
+
+            if type(attributes_plan) is int:
+                data.skip_bytes(attributes_plan)
+            else:
+                attributes_plan(data, metadata)
+
+            value = {}
+
+            if 'event_index' in selector_tree:
+                value['event_index'] = bytes([pallet_index, event_index]).hex()
+
+            if 'module_id' in selector_tree:
+                value['module_id'] = pallet_name
+
+            if 'event_id' in selector_tree:
+                value['event_id'] = event_name
+
+            return value
+
+        return projection_plan
+
 
 class GenericEventRecord(Struct):
 
@@ -3099,9 +5856,137 @@ class GenericEventRecord(Struct):
             'topics': value['topics']
         }
 
+    @classmethod
+    def has_plan_record_fields(cls, runtime_config) -> bool:
+        """
+        Returns True if the record has a SCALE-info `event` and an enum `phase` field, as expected by the plans
+
+        Parameters
+        ----------
+        runtime_config: RuntimeConfigurationObject
+
+        Returns
+        -------
+        bool
+        """
+        field_types = dict(cls.type_mapping)
+
+        if 'event' not in field_types or 'phase' not in field_types:
+            return False
+
+        event_class = runtime_config.get_decoder_class(field_types['event'])
+        phase_class = runtime_config.get_decoder_class(field_types['phase'])
+
+        return event_class is not None and issubclass(event_class, GenericScaleInfoEvent) and \
+            phase_class is not None and issubclass(phase_class, Enum)
+
+    @classmethod
+    def compile_decode_plan(cls, runtime_config):
+        struct_plan = super().compile_decode_plan(runtime_config)
+
+        if not cls.has_plan_record_fields(runtime_config):
+            raise NotImplementedError('Event record fields not supported by decode plan')
+
+        def decode_plan(data, metadata):
+            value = struct_plan(data, metadata)
+
+            if type(value['phase']) is dict:
+                phase, phase_value = list(value['phase'].items())[0]
+            else:
+                phase, phase_value = value['phase'], None
+
+            return {
+                'phase': phase,
+                'extrinsic_idx': phase_value if phase == 'ApplyExtrinsic' else None,
+                'event': value['event'],
+                'event_index': int(value['event']['event_index'][0:2], 16),
+                'module_id': value['event']['module_id'],
+                'event_id': value['event']['event_id'],
+                'attributes': value['event']['attributes'],
+                'topics': value['topics']
+            }
+
+        return decode_plan
+
+    @classmethod
+    def compile_skip_plan(cls, runtime_config):
+        return super().compile_skip_plan(runtime_config)
+
+    @classmethod
+    def compile_projection_plan(cls, runtime_config, selector_tree):
+        if not cls.has_plan_record_fields(runtime_config):
+            raise NotImplementedError('Event record fields not supported by projection plan')
+
+        field_types = dict(cls.type_mapping)
+
+        cls.check_selector_fields(
+            selector_tree, list(field_types) + ['extrinsic_idx', 'event_index', 'module_id', 'event_id', 'attributes']
+        )
+
+        # Determine which fields of the record struct are required for the selected keys
+        record_selector_tree = {key: branch for key, branch in selector_tree.items() if key in field_types}
+
+        if 'phase' in selector_tree or 'extrinsic_idx' in selector_tree:
+            record_selector_tree['phase'] = None
+
+        event_selector_tree = {
+            key: selector_tree[key] for key in ('event_index', 'module_id', 'event_id', 'attributes')
+            if key in selector_tree
+        }
+
+        if 'event_index' in event_selector_tree:
+            event_selector_tree['event_index'] = None
+
+        if 'event' in record_selector_tree:
+            record_selector_tree['event'] = runtime_config.merge_selector_trees(
+                record_selector_tree['event'], event_selector_tree
+            )
+        elif len(event_selector_tree) > 0:
+            record_selector_tree['event'] = event_selector_tree
+
+        struct_plan = super().compile_projection_plan(runtime_config, record_selector_tree)
+
+        def projection_plan(data, metadata):
+            value = struct_plan(data, metadata)
+
+            projected_value = {}
+
+            if 'phase' in value:
+                if type(value['phase']) is dict:
+                    phase, phase_value = list(value['phase'].items())[0]
+                else:
+                    phase, phase_value = value['phase'], None
+
+                if 'phase' in selector_tree:
+                    projected_value['phase'] = phase
+
+                if 'extrinsic_idx' in selector_tree:
+                    projected_value['extrinsic_idx'] = phase_value if phase == 'ApplyExtrinsic' else None
+
+            if 'event' in selector_tree:
+                projected_value['event'] = cls.project_value(value['event'], selector_tree['event'])
+
+            if 'event_index' in selector_tree:
+                projected_value['event_index'] = int(value['event']['event_index'][0:2], 16)
+
+            for key in ('module_id', 'event_id', 'attributes'):
+                if key in selector_tree:
+                    projected_value[key] = cls.project_value(value['event'][key], selector_tree[key])
+
+            if 'topics' in selector_tree:
+                projected_value['topics'] = value['topics']
+
+            return projected_value
+
+        return projection_plan
+
 
 class EventRecord(Struct):
 
+    __slots__ = (
+        'phase', 'extrinsic_idx', 'event_index', 'params', 'event', 'event_module', 'topics', 'arguments'
+    )
+
     def __init__(self, *arg, **kwargs):
 
         self.phase = None
@@ -3156,7 +6041,7 @@ class GenericConsensusEngineId(FixedLengthArray):
     element_count = 4
 
     def process(self):
-        return self.get_next_bytes(self.element_count).decode()
+        return str(self.get_next_bytes(self.element_count), 'utf-8')
 
 
 class GenericSealV0(Struct):
@@ -0,0 +1,251 @@
+# Python SCALE Codec Library
+#
+# Copyright 2018-2020 Stichting Polkascan (Polkascan Foundation).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+#  type_parser.py
+
+"""Single-pass parser for type strings like `Vec<(u32, BTreeMap<u32, Vec<u8>>)>`, `(u32, u64)` and `[u8; 32]`.
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+
+TYPE_STRING_DELIMITERS = frozenset('<>()[],;')
+
+
+class TypeExpression(namedtuple('TypeExpression', ['type_string', 'kind', 'name', 'params', 'length'])):
+    """
+    Node of a parsed type string
+
+    type_string: stripped source text of the expression, e.g. 'Vec<(u32, u64)>'
+    kind: 'path' (e.g. 'u32'), 'generic' (e.g. 'Vec<u32>'), 'tuple' (e.g. '(u32, u64)') or 'array' (e.g. '[u8; 4]')
+    name: name of 'path' and 'generic' expressions, e.g. 'Vec'
+    params: tuple of TypeExpression of the generic parameters, tuple elements or the array element
+    length: amount of elements of an 'array' expression
+    """
+    __slots__ = ()
+
+    @property
+    def params_string(self) -> str:
+        """
+        Source text between the outer brackets of a 'generic' or 'tuple' expression, e.g. '(u32, u64)' for
+        'Vec<(u32, u64)>'
+        """
+        if self.kind == 'generic':
+            return self.type_string[self.type_string.index('<') + 1:-1].strip()
+        if self.kind == 'tuple':
+            return self.type_string[1:-1].strip()
+
+
+def skip_whitespace(type_string: str, pos: int) -> int:
+    while pos < len(type_string) and type_string[pos].isspace():
+        pos += 1
+    return pos
+
+
+def parse_expression(type_string: str, pos: int) -> tuple:
+    """
+    Parses the type expression in `type_string` starting at `pos`
+
+    Returns
+    -------
+    tuple of the TypeExpression and the position after the expression
+    """
+    pos = skip_whitespace(type_string, pos)
+    start = pos
+    name = None
+    length = None
+
+    if pos < len(type_string) and type_string[pos] == '(':
+        kind = 'tuple'
+        params, pos = parse_params(type_string, pos + 1, ')')
+
+    elif pos < len(type_string) and type_string[pos] == '[':
+        kind = 'array'
+        element, pos = parse_expression(type_string, pos + 1)
+        pos = skip_whitespace(type_string, pos)
+
+        if type_string[pos:pos + 1] != ';':
+            raise ValueError(f'Expected ";" at position {pos} in type string "{type_string}"')
+
+        length_start = pos = skip_whitespace(type_string, pos + 1)
+        while pos < len(type_string) and type_string[pos].isdigit():
+            pos += 1
+
+        if pos == length_start:
+            raise ValueError(f'Expected array length at position {pos} in type string "{type_string}"')
+
+        length = int(type_string[length_start:pos])
+        pos = skip_whitespace(type_string, pos)
+
+        if type_string[pos:pos + 1] != ']':
+            raise ValueError(f'Expected "]" at position {pos} in type string "{type_string}"')
+
+        params = (element,)
+        pos += 1
+
+    else:
+        if type_string[pos:pos + 1] == '<':
+            # Qualified path, e.g. '<Lookup as StaticLookup>::Source'
+            depth = 0
+            for pos in range(pos, len(type_string)):
+                depth += {'<': 1, '>': -1}.get(type_string[pos], 0)
+                if depth == 0:
+                    break
+
+            if depth != 0:
+                raise ValueError(f'Missing ">" in type string "{type_string}"')
+
+            pos += 1
+
+        while pos < len(type_string) and type_string[pos] not in TYPE_STRING_DELIMITERS:
+            pos += 1
+
+        name = type_string[start:pos].strip()
+
+        if not name:
+            raise ValueError(f'Expected type name at position {start} in type string "{type_string}"')
+
+        pos = skip_whitespace(type_string, pos)
+
+        if type_string[pos:pos + 1] == '<':
+            kind = 'generic'
+            params, pos = parse_params(type_string, pos + 1, '>')
+            if not params:
+                raise ValueError(f'Expected generic parameters for "{name}" in type string "{type_string}"')
+        else:
+            kind = 'path'
+            params = ()
+
+    return TypeExpression(type_string[start:pos].strip(), kind, name, params, length), pos
+
+
+def parse_params(type_string: str, pos: int, closing: str = None) -> tuple:
+    """
+    Parses a comma separated list of type expressions in `type_string` starting at `pos`, up to and including the
+    `closing` character, or up to the end of `type_string` when `closing` is None. A trailing comma is allowed.
+
+    Returns
+    -------
+    tuple of the tuple of TypeExpression and the position after the list
+    """
+    params = []
+
+    while True:
+        pos = skip_whitespace(type_string, pos)
+
+        if pos == len(type_string):
+            if closing:
+                raise ValueError(f'Missing "{closing}" in type string "{type_string}"')
+            return tuple(params), pos
+
+        if type_string[pos] == closing:
+            return tuple(params), pos + 1
+
+        expression, pos = parse_expression(type_string, pos)
+        params.append(expression)
+
+        pos = skip_whitespace(type_string, pos)
+
+        if type_string[pos:pos + 1] == ',':
+            pos += 1
+        elif pos < len(type_string) and type_string[pos] != closing:
+            raise ValueError(f'Unexpected "{type_string[pos]}" at position {pos} in type string "{type_string}"')
+
+
+@lru_cache(maxsize=4096)
+def parse_type_string(type_string: str) -> TypeExpression:
+    """
+    Parses `type_string` into a tree of TypeExpression, e.g. 'Vec<(u32, u64)>' results in a 'generic' expression
+    named 'Vec' with a 'tuple' expression of two 'path' expressions as parameter
+
+    Parameters
+    ----------
+    type_string
+
+    Returns
+    -------
+    TypeExpression
+    """
+    expression, pos = parse_expression(type_string, 0)
+
+    if pos != len(type_string):
+        raise ValueError(f'Unexpected "{type_string[pos]}" at position {pos} in type string "{type_string}"')
+
+    return expression
+
+
+@lru_cache(maxsize=4096)
+def split_type_params(params_string: str) -> tuple:
+    """
+    Splits a comma separated list of type strings on the top level only, e.g. 'u32, BTreeMap<u32, Vec<u8>>' results
+    in ('u32', 'BTreeMap<u32, Vec<u8>>')
+
+    Parameters
+    ----------
+    params_string
+
+    Returns
+    -------
+    tuple of type strings
+    """
+    params, pos = parse_params(params_string, 0)
+    return tuple(param.type_string for param in params)
+
+
+def format_type_expression(expression: TypeExpression) -> str:
+    """
+    Formats a parsed type expression with normalised whitespace, e.g. 'Vec<(u32, u64)>' for the expression of
+    'Vec< (u32,u64) >'
+
+    Parameters
+    ----------
+    expression
+
+    Returns
+    -------
+    str
+    """
+    if expression.kind == 'generic':
+        return f"{expression.name}<{', '.join(format_type_expression(param) for param in expression.params)}>"
+
+    if expression.kind == 'tuple':
+        return f"({', '.join(format_type_expression(param) for param in expression.params)})"
+
+    if expression.kind == 'array':
+        return f"[{format_type_expression(expression.params[0])}; {expression.length}]"
+
+    return expression.type_string
+
+
+@lru_cache(maxsize=4096)
+def canonical_type_string(type_string: str) -> str:
+    """
+    Returns `type_string` with normalised whitespace, so differently formatted type strings of the same type are
+    equal, e.g. 'Vec< (u32,u64) >' results in 'Vec<(u32, u64)>'. Type strings that cannot be parsed are returned
+    stripped.
+
+    Parameters
+    ----------
+    type_string
+
+    Returns
+    -------
+    str
+    """
+    try:
+        return format_type_expression(parse_type_string(type_string))
+    except ValueError:
+        return type_string.strip()
@@ -189,6 +189,7 @@ setup(
     extras_require={  # Optional
         #'dev': ['check-manifest'],
         'test': ['coverage', 'pytest'],
+        'numpy': ['numpy'],
     },
 
     # If there are data files included in your packages that need to be
@@ -13,11 +13,12 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import io
 import os
-import pickle
 import unittest
 
 from scalecodec.base import ScaleBytes, RuntimeConfigurationObject
+from scalecodec.snapshot import dump_registry_snapshot, load_registry_snapshot
 from scalecodec.type_registry import load_type_registry_preset, load_type_registry_file
 
 
@@ -112,20 +113,26 @@ class TestMetadataRegistry(unittest.TestCase):
 
         self.assertGreater(len(metadata_obj.get_signed_extensions().items()), 0)
 
-    # def test_pickle_test(self):
-    #     metadata_obj = self.runtime_config.create_scale_object(
-    #         "MetadataVersioned", data=ScaleBytes(self.metadata_fixture_dict['V14'])
-    #     )
-    #     metadata_obj.decode()
-    #
-    #     # for name, decoder_class in self.runtime_config.type_registry['types'].items():
-    #     #     import __main__
-    #     #
-    #     #     globals()[decoder_class.__name__] = decoder_class
-    #
-    #     # assert(type(metadata_obj) is globals()['MetadataVersioned'])
-    #
-    #     pickle_data = pickle.dumps(metadata_obj)
+    def test_registry_snapshot(self):
+        metadata_obj = self.runtime_config.create_scale_object(
+            "MetadataVersioned", data=ScaleBytes(self.metadata_fixture_dict['V14'])
+        )
+        metadata_obj.decode()
+        self.runtime_config.add_portable_registry(metadata_obj)
+
+        snapshot_file = io.StringIO()
+        dump_registry_snapshot(metadata_obj, 1, 'test', snapshot_file)
+        snapshot_file.seek(0)
+
+        runtime_config = RuntimeConfigurationObject()
+        runtime_config.update_type_registry(load_type_registry_preset("core"))
+
+        load_registry_snapshot(snapshot_file, runtime_config, self.metadata_fixture_dict['V14'], 1, 'test')
+
+        self.assertEqual(
+            self.runtime_config.get_decoder_class('scale_info::2').scale_info_type.value,
+            runtime_config.get_decoder_class('scale_info::2').scale_info_type.value
+        )
 
 
 class TestMetadataTypes(unittest.TestCase):
@@ -17,11 +17,22 @@
 #  test_runtime_configuration.py
 #
 
+import copy
+import os
 import unittest
+from unittest import mock
 
 from scalecodec import Struct
-from scalecodec.base import RuntimeConfiguration, RuntimeConfigurationObject
-from scalecodec.type_registry import load_type_registry_preset
+from scalecodec.base import RuntimeConfiguration, RuntimeConfigurationObject, RuntimeConfigurationPool, ScaleBytes, \
+    ScaleType
+from scalecodec.constants import TYPE_STRING_CACHE_SIZE
+from scalecodec.exceptions import RemainingScaleBytesNotEmptyException, SelectorFieldNotFound
+from scalecodec.type_registry import load_type_registry_preset, load_type_registry_file
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 class TestScaleDecoderClasses(unittest.TestCase):
@@ -90,6 +101,861 @@ class TestRuntimeIdCache(unittest.TestCase):
         # Check updated cache
         self.assertGreater(runtime_config.get_runtime_id_from_upgrades(99999999998), 0)
 
+    def test_runtime_ids_for_blocks(self):
+        runtime_config = RuntimeConfigurationObject()
+        runtime_config.update_type_registry({
+            'types': {}, 'runtime_upgrades': [[10, 1], [20, 2], [30, 3]]
+        })
+
+        expected = [None] * 10 + [1] * 10 + [2] * 10 + [3] + [None] * 4
+        self.assertEqual(expected, runtime_config.get_runtime_ids_for_blocks(range(0, 35)))
+        self.assertEqual(expected, runtime_config.get_runtime_ids_for_blocks(list(range(0, 35))))
+        self.assertEqual(expected, [runtime_config.get_runtime_id_from_upgrades(n) for n in range(0, 35)])
+        self.assertEqual([3, 1, None], runtime_config.get_runtime_ids_for_blocks(iter([30, 19, 5])))
+
+        runtime_config.set_runtime_upgrades_head(40)
+        self.assertEqual([2, 3, 3, None, None], runtime_config.get_runtime_ids_for_blocks(range(29, 50, 5)))
+        self.assertEqual(3, runtime_config.get_runtime_id_from_upgrades(40))
+
+        runtime_config.update_type_registry({'types': {}, 'runtime_upgrades': [[0, 5]]})
+        self.assertEqual([5, None], runtime_config.get_runtime_ids_for_blocks(range(0, 2)))
+        self.assertIsNone(runtime_config.get_runtime_id_from_upgrades(1))
+
+
+class TestConvertTypeString(unittest.TestCase):
+
+    def tearDown(self):
+        RuntimeConfigurationObject.set_type_string_cache_size(TYPE_STRING_CACHE_SIZE)
+
+    def test_convert_type_string(self):
+        for name, expected in [
+            ('T::Balance', 'Balance'),
+            ('t::Balance', 'Balance'),
+            ('Vec<T::AccountId>', 'Vec<AccountId>'),
+            ('<T as Trait>::Balance', 'Balance'),
+            ('<T as Config<I>>::Proposal', 'Proposal'),
+            ('Vec<(T::AccountId, <T as Trait>::Balance)>', 'Vec<(AccountId, Balance)>'),
+            ('Box<<T as Config>::Call>', 'Call'),
+            ('VecDeque<BlockNumber>', 'Vec<BlockNumber>'),
+            ('VecDeque<T>', 'VecDeque'),
+            ('Box<VecDeque<u8>>', 'Bytes'),
+            ('grandpa::AuthorityList', 'AuthorityList'),
+            ('xcm::opaque::Xcm', 'Xcm'),
+            ('Vec<\nu8>', 'Bytes'),
+            ('()', 'Null'),
+            ("& 'static[u8]", 'Bytes'),
+            ('<Lookup as StaticLookup>::Source', 'LookupSource'),
+            ('<BlockNumber as HasCompact>::Type', 'Compact<BlockNumber>'),
+            ('Box<>', 'Box<>'),
+        ]:
+            with self.subTest(name=name):
+                self.assertEqual(expected, RuntimeConfigurationObject.convert_type_string(name))
+
+    def test_type_string_cache(self):
+        RuntimeConfigurationObject.set_type_string_cache_size(2)
+        self.assertEqual(2, RuntimeConfigurationObject.get_type_string_cache_info().maxsize)
+
+        for name in ['T::Balance', 'T::Balance', 'T::Moment', 'T::Index']:
+            RuntimeConfiguration.convert_type_string(name)
+
+        cache_info = RuntimeConfigurationObject.get_type_string_cache_info()
+        self.assertEqual((1, 3, 2), (cache_info.hits, cache_info.misses, cache_info.currsize))
+
+
+class TestDecoderClassCache(unittest.TestCase):
+
+    def setUp(self):
+        self.runtime_config = RuntimeConfigurationObject()
+        self.runtime_config.update_type_registry(load_type_registry_preset("legacy"))
+
+    def test_dynamic_class_reused(self):
+        for type_string in ['Vec<u32>', '(u32, u64)', '[u8; 4]', 'UnknownType123']:
+            with self.subTest(type_string=type_string):
+                decoder_class = self.runtime_config.get_decoder_class(type_string)
+                info = self.runtime_config.get_decoder_class_cache_info()
+
+                self.assertIs(decoder_class, self.runtime_config.get_decoder_class(type_string))
+                self.assertEqual(info['misses'], self.runtime_config.decoder_class_cache_misses)
+                self.assertEqual(info['hits'] + 1, self.runtime_config.decoder_class_cache_hits)
+
+    def test_normalised_type_string_key(self):
+        decoder_class = self.runtime_config.get_decoder_class('Vec<u8>')
+        info = self.runtime_config.get_decoder_class_cache_info()
+
+        for type_string in ['Vec< u8 >', 'Vec<T::u8>', ' Vec<u8>']:
+            with self.subTest(type_string=type_string):
+                self.assertIs(decoder_class, self.runtime_config.get_decoder_class(type_string))
+
+        self.assertEqual(info['size'], self.runtime_config.get_decoder_class_cache_info()['size'])
+
+    def test_update_type_registry_types(self):
+        self.assertIsNone(self.runtime_config.get_decoder_class('CustomTestType'))
+        vec_class = self.runtime_config.get_decoder_class('Vec<CustomTestType>')
+
+        self.runtime_config.update_type_registry_types({'CustomTestType': 'u8', 'Balance': 'u64'})
+
+        self.assertEqual(0, self.runtime_config.get_decoder_class_cache_info()['size'])
+        self.assertIs(
+            self.runtime_config.get_decoder_class('u8'), self.runtime_config.get_decoder_class('CustomTestType')
+        )
+        self.assertIsNot(vec_class, self.runtime_config.get_decoder_class('Vec<CustomTestType>'))
+        self.assertEqual(8, self.runtime_config.create_scale_object('Balance').encode(1).length)
+
+    def test_set_active_spec_version_id(self):
+        self.runtime_config.update_type_registry({
+            'types': {'CustomTestType': 'u8'},
+            'versioning': [{'runtime_range': [2, None], 'types': {'CustomTestType': 'u16'}}]
+        })
+        self.runtime_config.set_active_spec_version_id(1)
+        self.assertEqual('U8', self.runtime_config.get_decoder_class('CustomTestType').__name__)
+
+        self.runtime_config.set_active_spec_version_id(2)
+        self.assertEqual('U16', self.runtime_config.get_decoder_class('CustomTestType').__name__)
+
+    def test_clear_type_registry(self):
+        self.runtime_config.get_decoder_class('Balance')
+        self.runtime_config.clear_type_registry()
+
+        self.assertEqual(0, self.runtime_config.get_decoder_class_cache_info()['size'])
+        self.assertIsNone(self.runtime_config.get_decoder_class('Balance'))
+
+
+
+class TestSharedTypeRegistryLayers(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.kusama_preset = load_type_registry_preset("kusama")
+
+    def test_equals_applied_presets(self):
+        runtime_config = RuntimeConfigurationObject()
+        runtime_config.update_type_registry(load_type_registry_preset("core"))
+        runtime_config.update_type_registry(load_type_registry_preset("legacy"))
+        runtime_config.update_type_registry(self.kusama_preset)
+
+        layered_runtime_config = RuntimeConfigurationObject(shared_presets=('core', 'legacy'))
+        layered_runtime_config.update_type_registry(self.kusama_preset)
+
+        for name, decoder_class in runtime_config.type_registry['types'].items():
+            self.assertEqual(
+                getattr(decoder_class, '__name__', None),
+                getattr(layered_runtime_config.type_registry['types'][name], '__name__', None)
+            )
+
+        self.assertEqual(len(runtime_config.type_registry['types']), len(layered_runtime_config.type_registry['types']))
+        self.assertEqual(
+            runtime_config.type_registry['runtime_api'], layered_runtime_config.type_registry['runtime_api']
+        )
+
+        for type_string, data in [('AccountInfo', '0x' + '01' * 80), ('Exposure', '0x0c0800')]:
+            self.assertEqual(
+                runtime_config.decode_value(type_string, ScaleBytes(data), check_remaining=False),
+                layered_runtime_config.decode_value(type_string, ScaleBytes(data), check_remaining=False)
+            )
+
+    def test_layer_shared_and_immutable(self):
+        layer, _ = RuntimeConfigurationObject.get_shared_type_registry_layer(('core', 'legacy'))
+        self.assertIs(layer, RuntimeConfigurationObject.get_shared_type_registry_layer(['core', 'legacy'])[0])
+
+        with self.assertRaises(TypeError):
+            layer['balance'] = None
+
+        runtime_config1 = RuntimeConfigurationObject(shared_presets=('core', 'legacy'))
+        runtime_config2 = RuntimeConfigurationObject(shared_presets=('core', 'legacy'))
+
+        # The types of a configuration are a plain dict, changes are not applied to the shared layer
+        self.assertIs(dict, type(runtime_config1.type_registry['types']))
+
+        runtime_config1.update_type_registry_types({'Balance': 'u64'})
+        self.assertEqual('U64', runtime_config1.get_decoder_class('Balance').__name__)
+        self.assertEqual('U128', runtime_config2.get_decoder_class('Balance').__name__)
+        self.assertEqual('U128', layer['balance'].__name__)
+
+        self.assertIs(layer, copy.deepcopy(layer))
+
+    def test_shared_class_runtime_config(self):
+        runtime_config1 = RuntimeConfigurationObject(shared_presets=('core', 'legacy'))
+        decoder_class = runtime_config1.get_decoder_class('AccountInfo')
+        shared_class = runtime_config1.type_registry['types']['accountinfo']
+        shared_runtime_config = shared_class.runtime_config
+
+        runtime_config2 = RuntimeConfigurationObject(shared_presets=('core', 'legacy'))
+        decoder_class2 = runtime_config2.get_decoder_class('AccountInfo')
+
+        # Lookups return a subclass of the shared class attached to the configuration of the lookup
+        self.assertIs(shared_class, runtime_config2.type_registry['types']['accountinfo'])
+        self.assertTrue(issubclass(decoder_class, shared_class))
+        self.assertTrue(issubclass(decoder_class2, shared_class))
+        self.assertIs(runtime_config1, decoder_class.runtime_config)
+        self.assertIs(runtime_config2, decoder_class2.runtime_config)
+        self.assertIs(decoder_class2, runtime_config2.get_decoder_class('AccountInfo'))
+
+        # The shared class itself stays attached to the configuration of the presets
+        self.assertIsNotNone(shared_runtime_config)
+        self.assertIs(shared_runtime_config, shared_class.runtime_config)
+
+    def test_shared_class_resolves_through_runtime_config(self):
+        runtime_config = RuntimeConfigurationObject(shared_presets=('core', 'legacy'))
+        runtime_config.update_type_registry_types({'Balance': 'u64'})
+
+        decoder_class = runtime_config.get_decoder_class('AccountVoteSplit')
+        data = '0x' + '01' * 16
+
+        self.assertEqual(16, decoder_class.skip(ScaleBytes(data)))
+        self.assertEqual({'aye': 'u64', 'nay': 'u64'}, decoder_class.generate_type_decomposition())
+        self.assertEqual(
+            {'aye': 72340172838076673, 'nay': 72340172838076673}, decoder_class(ScaleBytes(data)).decode()
+        )
+
+        self.assertEqual(
+            {'aye': 'u128', 'nay': 'u128'},
+            RuntimeConfigurationObject(shared_presets=('core', 'legacy')).get_decoder_class(
+                'AccountVoteSplit'
+            ).generate_type_decomposition()
+        )
+
+    def test_builtin_layer_module_level_classes(self):
+        layer = RuntimeConfigurationObject.get_builtin_type_registry_layer()
+
+        RuntimeConfigurationObject(shared_presets=('core',)).get_decoder_class('Vec<AccountInfo>')
+        type('BuiltinLayerTestType', (ScaleType,), {})
+
+        self.assertIs(layer, RuntimeConfigurationObject.get_builtin_type_registry_layer())
+        self.assertNotIn('builtinlayertesttype', layer)
+        self.assertIn('u32', layer)
+
+    def test_clear_type_registry(self):
+        runtime_config = RuntimeConfigurationObject(shared_presets=('core', 'legacy'))
+        self.assertIsNotNone(runtime_config.get_decoder_class('Balance'))
+
+        runtime_config.clear_type_registry()
+        self.assertIsNone(runtime_config.get_decoder_class('Balance'))
+
+        # Decoder classes created for type registry definitions remain resolvable, like the builtin types
+        self.assertIsNotNone(runtime_config.get_decoder_class('AccountVoteSplit'))
+
+
+class TestVersionedTypes(unittest.TestCase):
+
+    def setUp(self):
+        self.runtime_config = RuntimeConfigurationObject()
+        self.runtime_config.update_type_registry(load_type_registry_preset("legacy"))
+        self.runtime_config.update_type_registry({
+            'types': {'CustomType': 'u32', 'OtherType': 'u8'},
+            'versioning': [
+                {'runtime_range': [1, 9], 'types': {'CustomType': 'u8'}},
+                {'runtime_range': [5, 9], 'types': {'OtherType': 'u16', 'NewType': 'u64'}},
+                {'runtime_range': [10, None], 'types': {'CustomType': 'u16'}}
+            ]
+        })
+
+    def test_switch_spec_version(self):
+        for spec_version_id, custom_type, other_type, new_type in [
+            (1, 'U8', 'U8', None), (5, 'U8', 'U16', 'U64'), (10, 'U16', 'U8', None), (0, 'U32', 'U8', None),
+            (7, 'U8', 'U16', 'U64'), (1, 'U8', 'U8', None)
+        ]:
+            with self.subTest(spec_version_id=spec_version_id):
+                self.runtime_config.set_active_spec_version_id(spec_version_id)
+
+                self.assertEqual(custom_type, self.runtime_config.get_decoder_class('CustomType').__name__)
+                self.assertEqual(other_type, self.runtime_config.get_decoder_class('OtherType').__name__)
+                self.assertEqual(new_type, getattr(self.runtime_config.get_decoder_class('NewType'), '__name__', None))
+
+    def test_compiled_plans_restored(self):
+        self.runtime_config.set_active_spec_version_id(5)
+        decode_plan = self.runtime_config.get_decode_plan('(CustomType, OtherType)')
+
+        self.runtime_config.set_active_spec_version_id(10)
+        self.assertIsNot(decode_plan, self.runtime_config.get_decode_plan('(CustomType, OtherType)'))
+        self.assertEqual((1, 2), self.runtime_config.decode_value('(CustomType, OtherType)', ScaleBytes('0x010002')))
+
+        self.runtime_config.set_active_spec_version_id(6)
+        self.assertIs(decode_plan, self.runtime_config.get_decode_plan('(CustomType, OtherType)'))
+        self.assertEqual((1, 2), self.runtime_config.decode_value('(CustomType, OtherType)', ScaleBytes('0x010200')))
+
+    def test_update_types_between_switches(self):
+        self.runtime_config.set_active_spec_version_id(5)
+        self.runtime_config.update_type_registry_types({'OtherType': 'u32'})
+        self.assertEqual('U32', self.runtime_config.get_decoder_class('OtherType').__name__)
+
+        self.runtime_config.set_active_spec_version_id(10)
+        self.assertEqual('U32', self.runtime_config.get_decoder_class('OtherType').__name__)
+
+        self.runtime_config.set_active_spec_version_id(5)
+        self.assertEqual('U16', self.runtime_config.get_decoder_class('OtherType').__name__)
+
+
+class TestRuntimeConfigurationPool(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        module_path = os.path.dirname(__file__)
+        cls.metadata_hex = load_type_registry_file(os.path.join(module_path, 'fixtures', 'metadata_hex.json'))['V14']
+
+    def load_metadata(self, spec_version):
+        return self.metadata_hex
+
+    def test_lru_eviction(self):
+        pool = RuntimeConfigurationPool(self.load_metadata, max_size=2, ss58_format=42)
+
+        runtime_config = pool.get(1)
+        self.assertEqual(42, runtime_config.ss58_format)
+        self.assertIs(runtime_config, pool.get(1))
+
+        pool.get(2)
+        pool.get(1)
+        pool.get(3)
+
+        self.assertIn(1, pool)
+        self.assertNotIn(2, pool)
+        self.assertEqual(2, len(pool))
+        self.assertEqual(
+            {'hits': 2, 'misses': 3, 'evictions': 1, 'size': 2, 'max_size': 2, 'max_weight': None},
+            {key: value for key, value in pool.get_pool_info().items() if key != 'weight'}
+        )
+
+        obj = runtime_config.create_scale_object('MultiAddress', ScaleBytes('0x00' + '01' * 32))
+        self.assertEqual('5C62Ck4UrFPiBtoCmeSrgF7x9yv9mn38446dhCpsi2mLHiFT', obj.decode())
+        self.assertEqual(14, pool.get_metadata(1).value_object[1].index)
+
+    def test_weight_budget(self):
+        pool = RuntimeConfigurationPool(self.load_metadata, max_size=4, max_weight=1)
+
+        pool.get(1)
+        self.assertGreater(pool.get_pool_info()['weight'], 1)
+
+        pool.get(2, metadata=ScaleBytes(self.metadata_hex))
+
+        self.assertEqual([2], list(pool.entries))
+        self.assertEqual(1, pool.get_pool_info()['evictions'])
+        self.assertEqual(
+            pool.get_runtime_config_weight(pool.entries[2].runtime_config), pool.get_pool_info()['weight']
+        )
+
+    def test_sizer(self):
+        pool = RuntimeConfigurationPool(self.load_metadata, max_size=4, max_weight=25, sizer=lambda *args: 10)
+
+        for spec_version in range(1, 4):
+            pool.get(spec_version)
+
+        self.assertEqual([2, 3], list(pool.entries))
+        self.assertEqual(20, pool.get_pool_info()['weight'])
+
+    def test_evicted_configuration_usable(self):
+        pool = RuntimeConfigurationPool(self.load_metadata, max_size=1)
+        runtime_config = pool.get(1)
+        metadata = pool.get_metadata(1)
+
+        pool.get(2)
+        self.assertNotIn(1, pool)
+
+        # Utility.batch([System.remark, Balances.transfer])
+        data = "0x0100080001081234060000be5ddb1579b72e84524fc29e78609e3caf42e85aa118ebfe0b0ad404b5bdd25f0c"
+
+        call = runtime_config.create_scale_object('Call', ScaleBytes(data), metadata=metadata)
+        self.assertEqual(
+            pool.get(2).create_scale_object('Call', ScaleBytes(data), metadata=pool.get_metadata(2)).decode(),
+            call.decode()
+        )
+        self.assertEqual('batch', call.value['call_function'])
+
+        pool.clear()
+        self.assertEqual(0, len(pool))
+
+    def test_missing_metadata(self):
+        with self.assertRaises(ValueError):
+            RuntimeConfigurationPool().get(1)
+
+
+class TestDecodeMany(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.runtime_config = RuntimeConfigurationObject()
+        cls.runtime_config.update_type_registry(load_type_registry_preset("legacy"))
+
+    def test_decode_many_formats(self):
+        values = self.runtime_config.decode_many(
+            'Balance', ['0x01000000000000000000000000000000', bytes(16), ScaleBytes(bytearray([2] + [0] * 15))]
+        )
+        self.assertEqual([1, 0, 2], values)
+
+    def test_decode_many_struct(self):
+        values = self.runtime_config.decode_many('AccountData', ['0x' + '00' * 63 + '07', '0x' + '01' + '00' * 63])
+        self.assertEqual(values[0]['fee_frozen'], 7 << 120)
+        self.assertEqual(values[1]['free'], 1)
+
+    def test_decode_many_check_remaining(self):
+        payloads = ['0x0100', '0x020000']
+
+        with self.assertRaises(RemainingScaleBytesNotEmptyException):
+            self.runtime_config.decode_many('u16', payloads)
+
+        self.assertEqual([1, 2], self.runtime_config.decode_many('u16', payloads, check_remaining=False))
+
+    def test_decode_many_unknown_type(self):
+        with self.assertRaises(NotImplementedError):
+            self.runtime_config.decode_many('UnknownType123', ['0x00'])
+
+
+class TestDecodePlans(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.runtime_config = RuntimeConfigurationObject(ss58_format=42)
+        cls.runtime_config.update_type_registry(load_type_registry_preset("legacy"))
+
+    def test_decode_value_equals_decode(self):
+        test_cases = [
+            ('Balance', '0x01000000000000000000000000000000'),
+            ('Compact<Balance>', '0x130080cd103d71bc22'),
+            ('Vec<u32>', '0x0c010000000200000003000000'),
+            ('Bytes', '0x0c616263'),
+            ('Vec<u8>', '0x0cff0102'),
+            ('Option<u32>', '0x0101000000'),
+            ('Option<u32>', '0x00'),
+            ('(u8, bool, H160)', '0x0201' + '11' * 20),
+            ('[u16; 2]', '0x01000200'),
+            ('[u8; 2]', '0x0102'),
+            ('BTreeMap<u8, bool>', '0x0801010200'),
+            ('AccountId', '0x' + 'd4' * 32),
+            ('RewardDestination', '0x00'),
+            ('IdentityInfo', '0x00055465737400000000000000'),
+            ('Exposure', '0x0f0000c16ff286230f0080c6a47e8d0304' + 'd4' * 32 + '0b00407a10f35a'),
+            ('BitVec', '0x1405'),
+            ('Weight', '0x0a00000000000000'),
+        ]
+
+        for type_string, data in test_cases:
+            with self.subTest(type_string=type_string):
+                obj = self.runtime_config.create_scale_object(type_string, ScaleBytes(data))
+                self.assertEqual(obj.decode(), self.runtime_config.decode_value(type_string, ScaleBytes(data)))
+
+    def test_decode_fixed_width_fields(self):
+        test_cases = [
+            ('(u32, u64)', '0x01000000ffffffffffffffff'),
+            ('(i8, i16, i32, i64)', '0xfffeff' + 'fdffffff' + 'fcffffffffffffff'),
+            ('(u32, u128, Bytes, H256, i128)', '0x03000000' + 'ff' * 16 + '0c616263' + '11' * 32 + 'fe' + 'ff' * 15),
+            ('(f32, f64)', '0x0000c03f' + '000000000000f83f'),
+            ('AccountInfo', '0x05000000010000000100000000000000' + '01' * 64),
+            ('(u256, H160)', '0x' + '02' * 32 + '03' * 20),
+        ]
+
+        for type_string, data in test_cases:
+            with self.subTest(type_string=type_string):
+                obj = self.runtime_config.create_scale_object(type_string, ScaleBytes(data))
+                self.assertEqual(obj.decode(), self.runtime_config.decode_value(type_string, ScaleBytes(data)))
+
+        self.assertEqual(('I', None), self.runtime_config.get_unpack_format('u32'))
+        self.assertIsNone(self.runtime_config.get_unpack_format('Compact<u32>'))
+
+        with self.assertRaises(RemainingScaleBytesNotEmptyException):
+            self.runtime_config.decode_value('(u32, u64)', ScaleBytes('0x0100000002'))
+
+    def test_decode_value_check_remaining(self):
+        with self.assertRaises(RemainingScaleBytesNotEmptyException):
+            self.runtime_config.decode_value('u16', ScaleBytes('0x010000'))
+
+        with self.assertRaises(RemainingScaleBytesNotEmptyException):
+            self.runtime_config.decode_value('u32', ScaleBytes('0x0100'), check_remaining=False)
+
+        self.assertEqual(1, self.runtime_config.decode_value('u16', ScaleBytes('0x010000'), check_remaining=False))
+
+    def test_decode_plan_cache(self):
+        runtime_config = RuntimeConfigurationObject()
+        runtime_config.update_type_registry(load_type_registry_preset("legacy"))
+
+        decode_plan = runtime_config.get_decode_plan('AccountData')
+        self.assertIs(decode_plan, runtime_config.get_decode_plan('AccountData'))
+
+        runtime_config.update_type_registry_types({'AccountData': 'u8'})
+        self.assertIsNot(decode_plan, runtime_config.get_decode_plan('AccountData'))
+        self.assertEqual(7, runtime_config.decode_value('AccountData', ScaleBytes('0x07')))
+
+    def test_recursive_type(self):
+        runtime_config = RuntimeConfigurationObject()
+        runtime_config.update_type_registry(load_type_registry_preset("legacy"))
+        runtime_config.update_type_registry_types({
+            'Tree': {'type': 'struct', 'type_mapping': [['value', 'u8'], ['children', 'Vec<Tree>']]}
+        })
+
+        data = '0x010802000300'
+        value = runtime_config.decode_value('Tree', ScaleBytes(data))
+
+        self.assertEqual(value, runtime_config.create_scale_object('Tree', ScaleBytes(data)).decode())
+        self.assertEqual([2, 3], [child['value'] for child in value['children']])
+
+    def test_iterative_decoding(self):
+        runtime_config = RuntimeConfigurationObject(iterative_decoding=True)
+        runtime_config.update_type_registry(load_type_registry_preset("legacy"))
+        runtime_config.update_type_registry_types({
+            'Tree': {'type': 'struct', 'type_mapping': [['value', 'u8'], ['children', 'Vec<Tree>']]}
+        })
+
+        self.assertIsNotNone(runtime_config.get_iterative_plan('Tree'))
+        self.assertIsNotNone(runtime_config.get_iterative_plan('(u8, Option<Tree>)'))
+        self.assertIsNone(runtime_config.get_iterative_plan('Vec<AccountData>'))
+
+        data = '0x010802000300'
+        self.assertEqual(
+            runtime_config.create_scale_object('Tree', ScaleBytes(data)).decode(),
+            runtime_config.decode_value('Tree', ScaleBytes(data))
+        )
+        self.assertEqual(
+            runtime_config.create_scale_object('Tree', ScaleBytes(data)).decode(),
+            runtime_config.create_scale_object('Tree', ScaleBytes(data)).decode(values_only=True)
+        )
+
+        # A tree nested deeper than the recursion limit
+        nesting_depth = 2000
+        value = runtime_config.decode_value('Tree', ScaleBytes('0x' + '0104' * nesting_depth + '0200'))
+
+        for _ in range(nesting_depth):
+            value = value['children'][0]
+
+        self.assertEqual({'value': 2, 'children': []}, value)
+
+    def test_custom_process_fallback(self):
+        # Era implements a custom process(), so it is decoded via a ScaleType object
+        self.assertEqual((32768, 20000), self.runtime_config.decode_value('Era', ScaleBytes('0x4e9c')))
+
+    def test_decode_values_only(self):
+        obj = self.runtime_config.create_scale_object('Vec<AccountData>', ScaleBytes('0x04' + '01' * 64))
+        value = obj.decode(values_only=True)
+
+        self.assertEqual(value, self.runtime_config.create_scale_object(
+            'Vec<AccountData>', ScaleBytes('0x04' + '01' * 64)
+        ).decode())
+        self.assertIs(obj.value_object, value)
+
+    def test_decode_values_only_instance_type_mapping(self):
+        obj = self.runtime_config.create_scale_object(
+            'Struct', ScaleBytes('0x0201'), type_mapping=[('a', 'u8'), ('b', 'bool')]
+        )
+        self.assertEqual({'a': 2, 'b': True}, obj.decode(values_only=True))
+
+    def test_generic_class_without_type_definition(self):
+        self.assertFalse(self.runtime_config.get_decoder_class('Struct').has_type_definition())
+        self.assertEqual(
+            (self.runtime_config.get_decoder_class('Struct'), False),
+            self.runtime_config.resolve_plan_decoder_class('Struct', 'compile_decode_plan')
+        )
+
+    def test_compile_plan_error_raised(self):
+        runtime_config = RuntimeConfigurationObject()
+        runtime_config.update_type_registry(load_type_registry_preset("legacy"))
+
+        with mock.patch.object(Struct, 'compile_decode_plan', side_effect=TypeError('bug in plan')):
+            with self.assertRaises(TypeError):
+                runtime_config.get_decode_plan('AccountData')
+
+    def test_decode_plans_disabled(self):
+        runtime_config = RuntimeConfigurationObject(use_decode_plans=False)
+        runtime_config.update_type_registry(load_type_registry_preset("legacy"))
+
+        self.assertEqual([1, 2], runtime_config.decode_many('u16', ['0x0100', '0x0200']))
+        self.assertEqual(3, runtime_config.decode_value('u16', ScaleBytes('0x0300')))
+        self.assertEqual({}, runtime_config.decode_plans)
+
+
+class TestSkipPlans(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.runtime_config = RuntimeConfigurationObject(ss58_format=42)
+        cls.runtime_config.update_type_registry(load_type_registry_preset("legacy"))
+
+    def test_skip_equals_decode_length(self):
+        test_cases = [
+            ('Balance', '0x01000000000000000000000000000000'),
+            ('Compact<Balance>', '0x130080cd103d71bc22'),
+            ('Compact<u32>', '0x02093d00'),
+            ('Vec<u32>', '0x0c010000000200000003000000'),
+            ('Bytes', '0x0c616263'),
+            ('Vec<u8>', '0x0cff0102'),
+            ('Option<u32>', '0x0101000000'),
+            ('Option<u32>', '0x00'),
+            ('(u8, bool, H160)', '0x0201' + '11' * 20),
+            ('[u16; 2]', '0x01000200'),
+            ('BTreeMap<u8, bool>', '0x0801010200'),
+            ('AccountId', '0x' + 'd4' * 32),
+            ('RewardDestination', '0x00'),
+            ('IdentityInfo', '0x00055465737400000000000000'),
+            ('Exposure', '0x0f0000c16ff286230f0080c6a47e8d0304' + 'd4' * 32 + '0b00407a10f35a'),
+            ('BitVec', '0x1405'),
+            ('Era', '0x4e9c'),
+        ]
+
+        for type_string, data in test_cases:
+            with self.subTest(type_string=type_string):
+                scale_bytes = ScaleBytes(data)
+                self.assertEqual(len(scale_bytes.data), self.runtime_config.skip(type_string, scale_bytes))
+                self.assertEqual(scale_bytes.length, scale_bytes.offset)
+
+    def test_skip_fixed_length_plan(self):
+        self.assertEqual(64, self.runtime_config.get_skip_plan('AccountData'))
+        self.assertEqual(8, self.runtime_config.get_skip_plan('[u16; 4]'))
+        self.assertTrue(callable(self.runtime_config.get_skip_plan('Vec<AccountData>')))
+
+    def test_skip_consecutive(self):
+        scale_bytes = ScaleBytes('0x0c616263' + '0100' + '08' + 'ff' * 4)
+
+        self.assertEqual(4, self.runtime_config.skip('Bytes', scale_bytes))
+        self.assertEqual(2, self.runtime_config.skip('u16', scale_bytes))
+        self.assertEqual([0xffff, 0xffff], self.runtime_config.decode_value('Vec<u16>', scale_bytes))
+
+    def test_skip_no_more_bytes(self):
+        with self.assertRaises(RemainingScaleBytesNotEmptyException):
+            self.runtime_config.skip('Vec<u32>', ScaleBytes('0x0c0100000002000000'))
+
+    def test_scale_type_skip(self):
+        decoder_class = self.runtime_config.get_decoder_class('Exposure')
+        data = ScaleBytes('0x0f0000c16ff286230f0080c6a47e8d0304' + 'd4' * 32 + '0b00407a10f35a')
+
+        self.assertEqual(len(data.data), decoder_class.skip(data))
+
+
+
+class TestProjectionPlans(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.runtime_config = RuntimeConfigurationObject(ss58_format=42)
+        cls.runtime_config.update_type_registry(load_type_registry_preset("legacy"))
+
+    def test_build_selector_tree(self):
+        self.assertEqual(
+            {'phase': None, 'event': {'module_id': None, 'event_id': None}},
+            self.runtime_config.build_selector_tree(['phase', 'event.module_id', 'event.event_id'])
+        )
+        self.assertEqual({'event': None}, self.runtime_config.build_selector_tree(['event.module_id', 'event']))
+        self.assertEqual({'event': None}, self.runtime_config.build_selector_tree(['event', 'event.module_id']))
+
+    def test_projection_equals_decode(self):
+        exposure_data = '0x0f0000c16ff286230f0080c6a47e8d0308' + ('d4' * 32 + '0b00407a10f35a') * 2
+        test_cases = [
+            ('Exposure', exposure_data, ['own']),
+            ('Exposure', exposure_data, ['others.value']),
+            ('Exposure', exposure_data, ['total', 'others']),
+            ('Vec<AccountData>', '0x08' + '01' * 64 + '02' * 64, ['free', 'fee_frozen']),
+            ('Option<AccountData>', '0x01' + '01' * 64, ['reserved']),
+            ('Option<AccountData>', '0x00', ['reserved']),
+            ('IdentityInfo', '0x00055465737400000000000000', ['display', 'twitter']),
+            ('RewardDestination', '0x00', ['Staked']),
+        ]
+
+        for type_string, data, selectors in test_cases:
+            with self.subTest(type_string=type_string, selectors=selectors):
+                value = self.runtime_config.decode_value(type_string, ScaleBytes(data))
+                self.assertEqual(
+                    ScaleType.project_value(value, self.runtime_config.build_selector_tree(selectors)),
+                    self.runtime_config.decode_value(type_string, ScaleBytes(data), selectors=selectors)
+                )
+
+    def test_decode_selectors(self):
+        obj = self.runtime_config.create_scale_object('Vec<AccountData>', ScaleBytes('0x04' + '01' * 64))
+
+        self.assertEqual([{'free': 0x01010101010101010101010101010101}], obj.decode(selectors=['free']))
+        self.assertEqual(obj.data_end_offset, 65)
+
+    def test_unknown_selector_field(self):
+        for type_string, selectors in (
+                ('AccountData', ['unknown']),
+                ('Vec<AccountData>', ['free', 'unknown']),
+                ('Option<Exposure>', ['others.unknown']),
+        ):
+            with self.subTest(type_string=type_string, selectors=selectors):
+                with self.assertRaises(ValueError):
+                    self.runtime_config.decode_value(type_string, ScaleBytes('0x00'), selectors=selectors)
+
+    def test_selectors_non_composite_fields(self):
+        runtime_config = RuntimeConfigurationObject()
+        runtime_config.update_type_registry_types({
+            'SelectorTestStruct': {'type': 'struct', 'type_mapping': [['a', 'u8'], ['b', '(u8, u16)']]}
+        })
+
+        for use_decode_plans in (True, False):
+            runtime_config.use_decode_plans = use_decode_plans
+
+            with self.subTest(use_decode_plans=use_decode_plans):
+                obj = runtime_config.create_scale_object('SelectorTestStruct', ScaleBytes('0x01020300'))
+                self.assertEqual({'b': (2, 3)}, obj.decode(selectors=['b']))
+
+                for selectors in (['b.0'], ['b.5'], ['b.x'], ['a.q']):
+                    with self.assertRaises(SelectorFieldNotFound):
+                        runtime_config.create_scale_object(
+                            'SelectorTestStruct', ScaleBytes('0x01020300')
+                        ).decode(selectors=selectors)
+
+    def test_decode_many_selectors(self):
+        self.assertEqual(
+            [{'free': 1}, {'free': 2}],
+            self.runtime_config.decode_many(
+                'AccountData', ['0x01' + '00' * 63, '0x02' + '00' * 63], selectors=['free']
+            )
+        )
+
+
+
+class TestEncodePlans(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.runtime_config = RuntimeConfigurationObject(ss58_format=42)
+        cls.runtime_config.update_type_registry(load_type_registry_preset("legacy"))
+
+    def test_encode_value_equals_encode(self):
+        test_cases = [
+            ('Balance', 10 ** 15),
+            ('Compact<Balance>', 10 ** 20),
+            ('Compact<u32>', 70000),
+            ('Vec<u32>', [1, 2, 3]),
+            ('Bytes', 'abc'),
+            ('Vec<u8>', '0x0102'),
+            ('Option<u32>', None),
+            ('Option<u32>', 5),
+            ('(u8, bool, H160)', (2, True, '0x' + '11' * 20)),
+            ('[u16; 2]', [1, 2]),
+            ('[u8; 2]', '0x0102'),
+            ('BTreeMap<u8, bool>', [(1, True), (2, False)]),
+            ('AccountId', '5GrwvaEF5zXb26Fz9rcQpDWS57CtERHpNehXCPcNoHGKutQY'),
+            ('MultiAddress', '5GrwvaEF5zXb26Fz9rcQpDWS57CtERHpNehXCPcNoHGKutQY'),
+            ('MultiAddress', 5),
+            ('RewardDestination', 'Staked'),
+            ('RewardDestination', {'Account': '0x' + 'd4' * 32}),
+            ('i64', -5),
+            ('BoundedVec<u32, 5>', [1, 2]),
+            ('Exposure', {'total': 10 ** 16, 'own': 10 ** 15, 'others': [{'who': '0x' + 'd4' * 32, 'value': 10 ** 14}]}),
+        ]
+
+        for type_string, value in test_cases:
+            with self.subTest(type_string=type_string, value=value):
+                self.assertEqual(
+                    self.runtime_config.create_scale_object(type_string).encode(value),
+                    self.runtime_config.encode_value(type_string, value)
+                )
+
+    def test_encode_value_errors(self):
+        test_cases = [
+            ('u8', 256),
+            ('Vec<u32>', 5),
+            ('RewardDestination', 'Unknown'),
+            ('(u8, u8)', [1]),
+            ('bool', 1),
+            ('AccountData', {'free': 1}),
+        ]
+
+        for type_string, value in test_cases:
+            with self.subTest(type_string=type_string, value=value):
+                with self.assertRaises(ValueError):
+                    self.runtime_config.encode_value(type_string, value)
+
+    def test_encode_scale_type_value(self):
+        balance = self.runtime_config.create_scale_object('Balance')
+        balance.encode(7)
+
+        self.assertEqual(
+            self.runtime_config.create_scale_object('Vec<Balance>').encode([balance, 8]),
+            self.runtime_config.encode_value('Vec<Balance>', [balance, 8])
+        )
+
+    def test_encode_plan_cache(self):
+        runtime_config = RuntimeConfigurationObject()
+        runtime_config.update_type_registry(load_type_registry_preset("legacy"))
+
+        encode_plan = runtime_config.get_encode_plan('AccountData')
+        self.assertIs(encode_plan, runtime_config.get_encode_plan('AccountData'))
+
+        runtime_config.update_type_registry_types({'AccountData': 'u8'})
+        self.assertEqual('0x07', runtime_config.encode_value('AccountData', 7).to_hex())
+
+
+class TestNumpyArrays(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.runtime_config = RuntimeConfigurationObject()
+        cls.runtime_config.update_type_registry(load_type_registry_preset("legacy"))
+        cls.runtime_config.update_type_registry_types({
+            'RewardPoint': {'type': 'struct', 'type_mapping': [['era', 'u32'], ['points', 'i64'], ['ratio', 'f64']]}
+        })
+
+        cls.test_cases = [
+            ('Vec<u32>', [0, 1, 2 ** 32 - 1]),
+            ('Vec<u64>', [2 ** 64 - 1, 5]),
+            ('Vec<i16>', [-2, 3]),
+            ('[u16; 3]', [1, 2, 3]),
+            ('Vec<RewardPoint>', [{'era': 1, 'points': -2, 'ratio': 1.5}, {'era': 2, 'points': 3, 'ratio': 0.25}]),
+            ('Vec<u128>', [2 ** 100]),
+            ('Vec<u32>', []),
+        ]
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_numpy_dtype(self):
+        self.assertEqual('<u4', self.runtime_config.get_numpy_dtype('u32'))
+        self.assertEqual(
+            [('era', '<u4'), ('points', '<i8'), ('ratio', '<f8')], self.runtime_config.get_numpy_dtype('RewardPoint')
+        )
+        self.assertIsNone(self.runtime_config.get_numpy_dtype('u128'))
+        self.assertIsNone(self.runtime_config.get_numpy_dtype('bool'))
+        self.assertIsNone(self.runtime_config.get_numpy_dtype('AccountInfo'))
+
+    def test_decode_lists(self):
+        for type_string, value in self.test_cases:
+            with self.subTest(type_string=type_string):
+                data = self.runtime_config.create_scale_object(type_string).encode(value)
+                self.assertEqual(value, self.runtime_config.decode_value(type_string, ScaleBytes(data.data)))
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_decode_ndarrays(self):
+        runtime_config = RuntimeConfigurationObject(numpy_arrays=True)
+        runtime_config.update_type_registry(load_type_registry_preset("legacy"))
+
+        data = runtime_config.create_scale_object('Vec<u64>').encode([2 ** 64 - 1, 5])
+
+        value = runtime_config.decode_value('Vec<u64>', ScaleBytes(data.data))
+        self.assertIsInstance(value, numpy.ndarray)
+        self.assertEqual(numpy.dtype('<u8'), value.dtype)
+        self.assertEqual([2 ** 64 - 1, 5], value.tolist())
+
+        obj = runtime_config.create_scale_object('Vec<u64>', ScaleBytes(data.data))
+        self.assertIsInstance(obj.decode(), numpy.ndarray)
+
+        # ndarrays can be encoded again
+        self.assertEqual(data, runtime_config.encode_value('Vec<u64>', value))
+        self.assertEqual(data, runtime_config.create_scale_object('Vec<u64>').encode(obj.value))
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_decode_wide_ints_lists(self):
+        runtime_config = RuntimeConfigurationObject(numpy_arrays=True)
+        runtime_config.update_type_registry(load_type_registry_preset("legacy"))
+
+        # Integers wider than 64 bits have no NumPy dtype and are decoded to a list of ints
+        for element_type in ('u128', 'i128', 'u256'):
+            self.assertIsNone(runtime_config.get_numpy_dtype(element_type))
+
+        for type_string, value in [('Vec<u128>', [2 ** 100, 1]), ('Vec<i128>', [-2 ** 100, 1]),
+                                   ('Vec<u256>', [2 ** 200]), ('[u128; 2]', [2 ** 100, 1])]:
+            with self.subTest(type_string=type_string):
+                data = runtime_config.create_scale_object(type_string).encode(value)
+
+                self.assertEqual(value, runtime_config.decode_value(type_string, ScaleBytes(data.data)))
+                self.assertEqual(
+                    value, runtime_config.create_scale_object(type_string, ScaleBytes(data.data)).decode()
+                )
+
+    def test_decode_without_numpy(self):
+        runtime_config = RuntimeConfigurationObject(numpy_arrays=True)
+        runtime_config.update_type_registry(load_type_registry_preset("legacy"))
+
+        with mock.patch('scalecodec.base.numpy', None):
+            self.assertIsNone(runtime_config.get_numpy_dtype('u32'))
+            self.assertEqual([1, 2], runtime_config.decode_value('Vec<u32>', ScaleBytes('0x080100000002000000')))
+
+    def test_decode_not_enough_bytes(self):
+        with self.assertRaises(RemainingScaleBytesNotEmptyException):
+            self.runtime_config.decode_value('Vec<u32>', ScaleBytes('0x0c0100000002'))
+
 
 if __name__ == '__main__':
     unittest.main()
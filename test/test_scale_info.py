@@ -23,7 +23,7 @@ import unittest
 
 from scalecodec.types import GenericAccountId, Null
 
-from scalecodec.base import RuntimeConfigurationObject, ScaleDecoder, ScaleBytes
+from scalecodec.base import RuntimeConfigurationObject, ScaleDecoder, ScaleBytes, ScaleType, LazyScaleInfoType
 
 from scalecodec.type_registry import load_type_registry_file, load_type_registry_preset
 
@@ -273,6 +273,263 @@ class ScaleInfoTestCase(unittest.TestCase):
         self.assertEqual(ScaleBytes('0x00d43593c715fdd31c61141abd04a99fd6822c8558854ccde39a5684e7a56da27d'), data)
         self.assertEqual('d43593c715fdd31c61141abd04a99fd6822c8558854ccde39a5684e7a56da27d', obj.account_id)
 
+    def test_decode_plans(self):
+        test_cases = [
+            ('scale_info::2', '0x02'),
+            ('scale_info::63', '0x130080cd103d71bc22'),
+            ('scale_info::14', '0x01020304'),
+            ('sp_runtime::generic::digest::DigestItem', '0x06010203041054657374'),
+            ('scale_info::21', '0x02'),
+            ('scale_info::111', '0xe110000000000000d204000000000000'),
+            ('scale_info::203', '0x04'),
+            ('scale_info::377', '0x0c00000022000000000000000000000000000000'),
+            ('scale_info::73', '0x0400000003000000'),
+            ('scale_info::74', '0x00'),
+            ('scale_info::35', '0x0101'),
+            ('scale_info::318', '0x0401020304050607080a00000000000000000000000000000000'),
+            ('scale_info::90', '0x084345'),
+            ('pallet_identity::types::data', '0x065465737431'),
+            ('scale_info::516', '0x4e9c'),
+            (
+                'sp_runtime::multiaddress::MultiAddress',
+                '0x00d43593c715fdd31c61141abd04a99fd6822c8558854ccde39a5684e7a56da27d'
+            ),
+        ]
+
+        for type_string, data in test_cases:
+            with self.subTest(type_string=type_string):
+                obj = self.runtime_config.create_scale_object(type_string, ScaleBytes(data))
+                self.assertEqual(obj.decode(), self.runtime_config.decode_value(type_string, ScaleBytes(data)))
+
+    def test_decode_plan_event_records(self):
+        # [System.ExtrinsicSuccess, Balances.Transfer, System.CodeUpdated]
+        data = '0x0c00010000000000e803000000000000000000010602' + 'd4' * 32 + '8e' * 32 + '0010a5d4e8' + \
+               '00' * 11 + '04' + '11' * 32 + '02000200'
+
+        obj = self.runtime_config.create_scale_object(
+            'Vec<frame_system::EventRecord>', ScaleBytes(data), metadata=self.metadata_obj
+        )
+        value = self.runtime_config.decode_value(
+            'Vec<frame_system::EventRecord>', ScaleBytes(data), metadata=self.metadata_obj
+        )
+
+        self.assertEqual(obj.decode(), value)
+        self.assertEqual(1, value[0]['extrinsic_idx'])
+        self.assertEqual('Transfer', value[1]['event_id'])
+        self.assertIsNone(value[2]['attributes'])
+
+    def test_decode_values_only(self):
+        data = '0x0c00010000000000e803000000000000000000010602' + 'd4' * 32 + '8e' * 32 + '0010a5d4e8' + \
+               '00' * 11 + '04' + '11' * 32 + '02000200'
+
+        obj = self.runtime_config.create_scale_object(
+            'Vec<frame_system::EventRecord>', ScaleBytes(data), metadata=self.metadata_obj
+        )
+        values_only_obj = self.runtime_config.create_scale_object(
+            'Vec<frame_system::EventRecord>', ScaleBytes(data), metadata=self.metadata_obj
+        )
+
+        self.assertEqual(obj.decode(), values_only_obj.decode(values_only=True))
+        self.assertIs(values_only_obj.value, values_only_obj.value_object)
+        self.assertEqual(len(data) // 2 - 1, values_only_obj.data_end_offset)
+
+    def test_decode_plan_calls(self):
+        # Utility.batch([System.remark, Balances.transfer])
+        data = "0x0100080001081234060000be5ddb1579b72e84524fc29e78609e3caf42e85aa118ebfe0b0ad404b5bdd25f0c"
+
+        obj = self.runtime_config.create_scale_object('Call', ScaleBytes(data), metadata=self.metadata_obj)
+        value = self.runtime_config.decode_value('Call', ScaleBytes(data), metadata=self.metadata_obj)
+
+        self.assertEqual(obj.decode(), value)
+        self.assertEqual(
+            '0x484aa6d852c96a543053f402f397a285d768c12afde025ce37244f6238714b4c',
+            value['call_args'][0]['value'][0]['call_hash']
+        )
+
+    def test_nested_call_hash(self):
+        # Utility.batch([System.remark, Balances.transfer])
+        data = "0x0100080001081234060000be5ddb1579b72e84524fc29e78609e3caf42e85aa118ebfe0b0ad404b5bdd25f0c"
+
+        obj = self.runtime_config.create_scale_object('Call', ScaleBytes(data), metadata=self.metadata_obj)
+        obj.decode()
+
+        remark_obj = self.runtime_config.create_scale_object(
+            'Call', ScaleBytes("0x0001081234"), metadata=self.metadata_obj
+        )
+        remark_obj.decode()
+
+        # Hash of the nested call's own bytes, not of all bytes remaining in the batch
+        self.assertEqual(remark_obj.value['call_hash'], obj.value['call_args'][0]['value'][0]['call_hash'])
+
+
+    def test_iterative_decoding_calls(self):
+        runtime_config = RuntimeConfigurationObject(ss58_format=42, iterative_decoding=True)
+        runtime_config.update_type_registry(load_type_registry_preset("core"))
+        runtime_config.add_portable_registry(self.metadata_obj)
+
+        # Utility.batch([System.remark, Balances.transfer])
+        data = "0x0100080001081234060000be5ddb1579b72e84524fc29e78609e3caf42e85aa118ebfe0b0ad404b5bdd25f0c"
+
+        self.assertIsNotNone(runtime_config.get_iterative_plan('Call'))
+        self.assertIsNone(runtime_config.get_iterative_plan('AccountInfo'))
+        self.assertEqual(
+            self.runtime_config.create_scale_object('Call', ScaleBytes(data), metadata=self.metadata_obj).decode(),
+            runtime_config.decode_value('Call', ScaleBytes(data), metadata=self.metadata_obj)
+        )
+
+        # Utility.batch([Utility.batch([... System.remark])]) nested deeper than the recursion limit
+        nesting_depth = 1500
+        data = '0x' + '010004' * nesting_depth + '0001081234'
+
+        value = runtime_config.decode_value('Call', ScaleBytes(data), metadata=self.metadata_obj)
+
+        for _ in range(nesting_depth):
+            self.assertEqual('batch', value['call_function'])
+            value = value['call_args'][0]['value'][0]
+
+        self.assertEqual('remark', value['call_function'])
+
+    def test_skip(self):
+        # [System.ExtrinsicSuccess, Balances.Transfer, System.CodeUpdated]
+        events_data = '0x0c00010000000000e803000000000000000000010602' + 'd4' * 32 + '8e' * 32 + '0010a5d4e8' + \
+            '00' * 11 + '04' + '11' * 32 + '02000200'
+        # Utility.batch([System.remark, Balances.transfer])
+        call_data = "0x0100080001081234060000be5ddb1579b72e84524fc29e78609e3caf42e85aa118ebfe0b0ad404b5bdd25f0c"
+
+        for type_string, data in (('Vec<frame_system::EventRecord>', events_data), ('Call', call_data)):
+            with self.subTest(type_string=type_string):
+                scale_bytes = ScaleBytes(data)
+                self.assertEqual(
+                    len(scale_bytes.data),
+                    self.runtime_config.skip(type_string, scale_bytes, metadata=self.metadata_obj)
+                )
+
+    def test_decode_selectors(self):
+        # [System.ExtrinsicSuccess, Balances.Transfer, System.CodeUpdated]
+        events_data = '0x0c00010000000000e803000000000000000000010602' + 'd4' * 32 + '8e' * 32 + '0010a5d4e8' + \
+            '00' * 11 + '04' + '11' * 32 + '02000200'
+        # Signed Balances.transfer
+        extrinsic_data = '0x29028400' + 'd43593c715fdd31c61141abd04a99fd6822c8558854ccde39a5684e7a56da27d' + '01' + \
+            '01' * 64 + '000400060000d43593c715fdd31c61141abd04a99fd6822c8558854ccde39a5684e7a56da27d0c'
+
+        test_cases = [
+            ('Vec<frame_system::EventRecord>', events_data, ['phase', 'event.module_id', 'event.event_id']),
+            ('Vec<frame_system::EventRecord>', events_data, ['extrinsic_idx', 'event_index', 'topics']),
+            ('Vec<frame_system::EventRecord>', events_data, ['module_id', 'attributes']),
+            ('Extrinsic', extrinsic_data, ['extrinsic_hash', 'extrinsic_length']),
+            ('Extrinsic', extrinsic_data, ['address', 'nonce', 'call.call_module', 'call.call_hash']),
+            ('Extrinsic', extrinsic_data, ['call.call_args']),
+            ('Extrinsic', '0x1004030014', ['call.call_function']),
+        ]
+
+        for type_string, data, selectors in test_cases:
+            with self.subTest(type_string=type_string, selectors=selectors):
+                value = self.runtime_config.decode_value(type_string, ScaleBytes(data), metadata=self.metadata_obj)
+                self.assertEqual(
+                    ScaleType.project_value(value, self.runtime_config.build_selector_tree(selectors)),
+                    self.runtime_config.decode_value(
+                        type_string, ScaleBytes(data), metadata=self.metadata_obj, selectors=selectors
+                    )
+                )
+
+        value = self.runtime_config.decode_value(
+            'Vec<frame_system::EventRecord>', ScaleBytes(events_data), metadata=self.metadata_obj,
+            selectors=['phase', 'event.module_id', 'event.event_id']
+        )
+        self.assertEqual({'phase': 'Finalization', 'event': {'module_id': 'Balances', 'event_id': 'Transfer'}}, value[1])
+
+    def test_lazy_extrinsic(self):
+        # Signed Balances.transfer followed by a second extrinsic in the same data
+        extrinsic_data = '29028400' + 'd43593c715fdd31c61141abd04a99fd6822c8558854ccde39a5684e7a56da27d' + '01' + \
+            '01' * 64 + '000400060000d43593c715fdd31c61141abd04a99fd6822c8558854ccde39a5684e7a56da27d0c'
+        scale_bytes = ScaleBytes('0x' + extrinsic_data + '1004030014')
+
+        extrinsic = self.runtime_config.create_scale_object('Extrinsic', scale_bytes, metadata=self.metadata_obj)
+        value = extrinsic.decode(lazy=True, check_remaining=False)
+
+        # The data is positioned after the extrinsic, so the next one can be decoded
+        self.assertEqual(len(extrinsic_data) // 2, scale_bytes.offset)
+
+        self.assertEqual('5GrwvaEF5zXb26Fz9rcQpDWS57CtERHpNehXCPcNoHGKutQY', value['address'])
+        self.assertEqual(('Balances', 'transfer'), (
+            extrinsic['call'].value['call_module'], extrinsic['call'].value['call_function']
+        ))
+        self.assertEqual([5], list(value.lazy_elements.objects.keys()))
+
+        eager_extrinsic = self.runtime_config.create_scale_object(
+            'Extrinsic', ScaleBytes('0x' + extrinsic_data), metadata=self.metadata_obj
+        )
+        self.assertEqual(eager_extrinsic.decode(), dict(value))
+        self.assertEqual(list(eager_extrinsic.value.keys()), list(value.keys()))
+
+        inherent = self.runtime_config.create_scale_object('Extrinsic', scale_bytes, metadata=self.metadata_obj)
+        inherent.decode(lazy=True)
+
+        self.assertFalse(inherent.signed)
+        self.assertEqual(
+            self.runtime_config.create_scale_object(
+                'Extrinsic', ScaleBytes('0x1004030014'), metadata=self.metadata_obj
+            ).decode(),
+            dict(inherent.value)
+        )
+
+    def test_unknown_selector_field(self):
+        # Signed Balances.transfer
+        extrinsic_data = '0x29028400' + 'd43593c715fdd31c61141abd04a99fd6822c8558854ccde39a5684e7a56da27d' + '01' + \
+            '01' * 64 + '000400060000d43593c715fdd31c61141abd04a99fd6822c8558854ccde39a5684e7a56da27d0c'
+
+        for type_string, data, selectors in (
+                ('Vec<frame_system::EventRecord>', '0x00', ['unknown']),
+                ('Vec<frame_system::EventRecord>', '0x00', ['event.unknown']),
+                ('Call', '0x0001081234', ['call_module', 'unknown']),
+                ('Extrinsic', extrinsic_data, ['unknown']),
+        ):
+            with self.subTest(type_string=type_string, selectors=selectors):
+                with self.assertRaises(ValueError):
+                    self.runtime_config.decode_value(
+                        type_string, ScaleBytes(data), metadata=self.metadata_obj, selectors=selectors
+                    )
+
+    def test_encode_plan_calls(self):
+        transfer = {
+            'call_module': 'Balances', 'call_function': 'transfer',
+            'call_args': {'dest': '5GrwvaEF5zXb26Fz9rcQpDWS57CtERHpNehXCPcNoHGKutQY', 'value': 3}
+        }
+        batch = {
+            'call_module': 'Utility', 'call_function': 'batch',
+            'call_args': {'calls': [
+                transfer, {'call_module': 'System', 'call_function': 'remark', 'call_args': {'remark': '0x1234'}}
+            ]}
+        }
+        call_obj = self.runtime_config.create_scale_object('Call', metadata=self.metadata_obj)
+        call_obj.encode(transfer)
+
+        signed_extrinsic = {
+            'address': '5GrwvaEF5zXb26Fz9rcQpDWS57CtERHpNehXCPcNoHGKutQY', 'signature': {'Sr25519': '0x' + '01' * 64},
+            'era': {'period': 64, 'current': 1000}, 'nonce': 1, 'tip': 0
+        }
+
+        test_cases = [
+            ('Call', transfer),
+            ('Call', batch),
+            ('Extrinsic', dict(signed_extrinsic, call=batch)),
+            ('Extrinsic', dict(signed_extrinsic, call=call_obj)),
+            ('Extrinsic', {'call_module': 'Timestamp', 'call_function': 'set', 'call_args': {'now': 5}}),
+        ]
+
+        for type_string, value in test_cases:
+            with self.subTest(type_string=type_string):
+                self.assertEqual(
+                    self.runtime_config.create_scale_object(type_string, metadata=self.metadata_obj).encode(value),
+                    self.runtime_config.encode_value(type_string, value, metadata=self.metadata_obj)
+                )
+
+        with self.assertRaises(ValueError):
+            self.runtime_config.encode_value(
+                'Call', {'call_module': 'Balances', 'call_function': 'unknown', 'call_args': {}},
+                metadata=self.metadata_obj
+            )
+
     def test_unknown_scale_info_type(self):
 
         unknown_type = self.runtime_config.create_scale_object('RegistryType')
@@ -301,6 +558,45 @@ class ScaleInfoTestCase(unittest.TestCase):
             '0x060000be5ddb1579b72e84524fc29e78609e3caf42e85aa118ebfe0b0ad404b5bdd25f0c'
         )
 
+    def test_lazy_portable_registry(self):
+        runtime_config = RuntimeConfigurationObject(ss58_format=42, lazy_portable_registry=True)
+        runtime_config.update_type_registry(load_type_registry_preset("core"))
+        runtime_config.add_portable_registry(self.metadata_obj)
+
+        # Placeholders are kept apart from the type registry
+        lazy_type = runtime_config.lazy_scale_info_types['scale_info::111']
+        self.assertIsInstance(lazy_type, LazyScaleInfoType)
+        self.assertIsNone(lazy_type.decoder_class)
+        self.assertNotIn('scale_info::111', runtime_config.type_registry['types'])
+        self.assertFalse(
+            any(type(entry) is LazyScaleInfoType for entry in runtime_config.type_registry['types'].values())
+        )
+
+        # Built on first lookup and added to the type registry, path alias refers to the same class
+        account_cls = runtime_config.get_decoder_class('scale_info::0')
+        self.assertIs(account_cls, runtime_config.get_decoder_class('sp_core::crypto::AccountId32'))
+        self.assertIsInstance(account_cls(), GenericAccountId)
+        self.assertIs(account_cls, runtime_config.type_registry['types']['scale_info::0'])
+        self.assertIs(account_cls, runtime_config.type_registry['types']['sp_core::crypto::accountid32'])
+
+        for type_string in ['scale_info::0', 'scale_info::98', 'Call', 'Option<u32>', 'sp_runtime::DispatchError']:
+            with self.subTest(type_string=type_string):
+                eager_cls = self.runtime_config.get_decoder_class(type_string)
+                lazy_cls = runtime_config.get_decoder_class(type_string)
+
+                self.assertEqual(eager_cls.__name__, lazy_cls.__name__)
+                self.assertEqual(eager_cls.type_mapping, lazy_cls.type_mapping)
+                self.assertEqual(eager_cls.sub_type, lazy_cls.sub_type)
+
+        # Utility.batch([System.remark, Balances.transfer])
+        data = "0x0100080001081234060000be5ddb1579b72e84524fc29e78609e3caf42e85aa118ebfe0b0ad404b5bdd25f0c"
+
+        self.assertEqual(
+            self.runtime_config.create_scale_object('Call', ScaleBytes(data), metadata=self.metadata_obj).decode(),
+            runtime_config.create_scale_object('Call', ScaleBytes(data), metadata=self.metadata_obj).decode()
+        )
+        self.assertIsNone(lazy_type.decoder_class)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -15,13 +15,14 @@
 # limitations under the License.
 
 import datetime
+import io
 import os
 import unittest
 
 from scalecodec.types import GenericContractExecResult
 
 from scalecodec.base import ScaleDecoder, ScaleBytes, RemainingScaleBytesNotEmptyException, \
-    InvalidScaleTypeValueException, RuntimeConfiguration, RuntimeConfigurationObject
+    InvalidScaleTypeValueException, RuntimeConfiguration, RuntimeConfigurationObject, ScaleBytesStream
 from scalecodec.types import GenericMultiAddress
 from scalecodec.type_registry import load_type_registry_preset, load_type_registry_file
 from scalecodec.utils.ss58 import ss58_encode, ss58_decode, ss58_decode_account_index, ss58_encode_account_index
@@ -90,6 +91,50 @@ class TestScaleTypes(unittest.TestCase):
         self.assertEqual(obj[0], 3)
         self.assertEqual(obj[1], 0)
 
+    def test_instance_attributes(self):
+        obj = RuntimeConfiguration().create_scale_object('Vec<Compact<u32>>', ScaleBytes("0x040c"))
+        obj.decode()
+
+        self.assertEqual({}, obj.meta_info)
+        obj.meta_info['source'] = 'test'
+        self.assertEqual({'source': 'test'}, obj.meta_info)
+
+        # Attributes without a slot are stored in the instance dict
+        obj.custom_attribute = 1
+        self.assertEqual(1, obj.custom_attribute)
+        self.assertEqual(3, obj.elements[0].value)
+
+    def test_primitive_instance_slots(self):
+        runtime_config = RuntimeConfiguration()
+        obj = runtime_config.create_scale_object('Vec<u32>', ScaleBytes("0x0401000000"))
+        obj.decode()
+
+        # Primitives store all instance attributes in slots
+        self.assertFalse(hasattr(obj.elements[0], '__dict__'))
+        self.assertIs(runtime_config, obj.elements[0].runtime_config)
+        self.assertIs(runtime_config, obj.elements[0].__class__.runtime_config)
+        self.assertIsNone(ScaleDecoder.runtime_config)
+
+    def test_instance_sub_type(self):
+        obj = RuntimeConfiguration().create_scale_object('Vec', ScaleBytes("0x040100"), sub_type='u16')
+        self.assertTrue(obj.has_instance_type_definition())
+        self.assertEqual([1], obj.decode(values_only=True))
+
+        self.assertFalse(RuntimeConfiguration().create_scale_object('Vec<u16>').has_instance_type_definition())
+
+    def test_instance_sub_type_slotted_type(self):
+        for type_string in ['Compact<u32>', 'H256', 'Era']:
+            with self.subTest(type_string=type_string):
+                obj = RuntimeConfiguration().create_scale_object(type_string, ScaleBytes('0x00'), sub_type='u32')
+                self.assertFalse(hasattr(obj, '__dict__'))
+                self.assertEqual('u32', obj.sub_type)
+
+        # The sub type of the class is not changed by the instance
+        self.assertIsNone(RuntimeConfiguration().get_decoder_class('H256').sub_type)
+
+        obj = RuntimeConfiguration().create_scale_object('Compact', ScaleBytes('0x02093d00'), sub_type='u32')
+        self.assertEqual(1000000, obj.decode())
+
     def test_compact_u32(self):
         obj = RuntimeConfiguration().create_scale_object('Compact<u32>', ScaleBytes("0x02093d00"))
         obj.decode()
@@ -171,6 +216,33 @@ class TestScaleTypes(unittest.TestCase):
             '0x65d2273adeb04478658e183dc5edf41f1d86e42255442af62e72dbf1e6c0b977'
         ])
 
+    def test_vec_iter_decode(self):
+        obj = RuntimeConfiguration().create_scale_object('Vec<u16>', ScaleBytes("0x0c010002000300"))
+
+        elements = obj.iter_decode()
+        element = next(elements)
+        self.assertEqual(1, element.value)
+        self.assertFalse(obj.decoded)
+
+        self.assertEqual([2, 3], [element.value for element in elements])
+        self.assertTrue(obj.decoded)
+        self.assertEqual([], obj.elements)
+
+        data = '0x08' + '01' * 64 + '02' * 64
+        obj = RuntimeConfiguration().create_scale_object('Vec<AccountData>', ScaleBytes(data))
+        self.assertEqual(
+            RuntimeConfiguration().create_scale_object('Vec<AccountData>', ScaleBytes(data)).decode(),
+            list(obj.iter_decode(values_only=True))
+        )
+        self.assertEqual(
+            [{'free': 2 ** 128 // 255}, {'free': 2 * (2 ** 128 // 255)}],
+            list(obj.iter_decode(ScaleBytes(data), selectors=['free']))
+        )
+
+        obj = RuntimeConfiguration().create_scale_object('BoundedVec<u16, 4>', ScaleBytes("0x0401000200"))
+        with self.assertRaises(RemainingScaleBytesNotEmptyException):
+            list(obj.iter_decode(values_only=True))
+
     def test_bounded_vec_encode(self):
         obj = RuntimeConfiguration().create_scale_object('BoundedVec<Hash, maxproposals>')
         value = obj.encode(['0xe1781813275653a970b4260298b3858b36d38e072256dad674f7c786a0cae236'])
@@ -866,3 +938,85 @@ class TestScaleTypes(unittest.TestCase):
         raw_bytes_obj.encode(data)
         self.assertEqual(ScaleBytes(data), raw_bytes_obj.data)
 
+
+
+class TestLazyDecode(unittest.TestCase):
+
+    account_info_data = '0x050000000100000002000000000000000080c6a47e8d030000000000000000000000000000000000000000' \
+                        '00000000000010a5d4e800000000000000000000000010a5d4e80000000000000000000000'
+
+    @classmethod
+    def setUpClass(cls):
+        cls.runtime_config = RuntimeConfigurationObject()
+        cls.runtime_config.update_type_registry(load_type_registry_preset("legacy"))
+
+    def test_lazy_struct(self):
+        obj = self.runtime_config.create_scale_object('AccountInfo', ScaleBytes(self.account_info_data))
+        obj.decode(lazy=True)
+
+        self.assertEqual(10 ** 15, obj['data']['free'].value)
+        self.assertEqual(2, obj.value['providers'])
+
+        # No ScaleType objects are created for fields that are not accessed
+        self.assertEqual([4], list(obj.value.lazy_elements.objects.keys()))
+
+        eager_obj = self.runtime_config.create_scale_object('AccountInfo', ScaleBytes(self.account_info_data))
+        self.assertEqual(eager_obj.decode(), obj.value)
+        self.assertEqual(list(eager_obj.value.keys()), list(obj.value.keys()))
+
+    def test_lazy_vec(self):
+        obj = self.runtime_config.create_scale_object('Vec<u32>', ScaleBytes('0x0c010000000200000003000000'))
+        obj.decode(lazy=True)
+
+        self.assertEqual(3, len(obj))
+        self.assertEqual(3, obj.value[-1])
+        self.assertEqual([2, 3], obj.value[1:])
+        self.assertEqual(1, obj[0].value)
+        self.assertEqual([1, 2, 3], obj.value)
+
+        with self.assertRaises(IndexError):
+            obj.value[3]
+
+    def test_lazy_tuple(self):
+        obj = self.runtime_config.create_scale_object('(u8, Compact<u32>, bool)', ScaleBytes('0x020401'))
+        obj.decode(lazy=True)
+
+        self.assertTrue(obj.value[2])
+        self.assertEqual((2, 1, True), obj.value)
+
+    def test_lazy_check_remaining(self):
+        obj = self.runtime_config.create_scale_object('(u8, u8)', ScaleBytes('0x010203'))
+        obj.decode(lazy=True)
+
+        self.assertEqual(1, obj.value[0])
+
+        with self.assertRaises(RemainingScaleBytesNotEmptyException):
+            obj.value[1]
+
+        obj = self.runtime_config.create_scale_object('(u8, u8)', ScaleBytes('0x010203'))
+        obj.decode(lazy=True, check_remaining=False)
+        self.assertEqual((1, 2), obj.value)
+
+        with self.assertRaises(RemainingScaleBytesNotEmptyException):
+            self.runtime_config.create_scale_object('Vec<u16>', ScaleBytes('0x0001')).decode(lazy=True)
+
+    def test_lazy_data_not_copied(self):
+        scale_bytes = ScaleBytes('0x0c010000000200000003000000')
+        obj = self.runtime_config.create_scale_object('Vec<u32>', scale_bytes)
+        obj.decode(lazy=True)
+
+        # Elements are decoded from the data itself, its offset is restored after each access
+        self.assertIs(scale_bytes, obj.value.lazy_elements.data)
+        self.assertEqual(3, obj.value[2])
+        self.assertEqual(13, scale_bytes.offset)
+
+        scale_bytes = ScaleBytesStream(io.BytesIO(bytes.fromhex('0c010000000200000003000000')))
+        obj = self.runtime_config.create_scale_object('Vec<u32>', scale_bytes)
+        obj.decode(lazy=True)
+
+        self.assertEqual([1, 2, 3], obj.value)
+        self.assertEqual(13, scale_bytes.offset)
+
+    def test_lazy_unsupported_type(self):
+        obj = self.runtime_config.create_scale_object('Compact<u32>', ScaleBytes('0x04'))
+        self.assertEqual(1, obj.decode(lazy=True))
@@ -17,10 +17,18 @@
 #  test_scalebytes.py
 #
 
+import io
+import mmap
+import os
+import socket
+import tempfile
 import unittest
+from unittest import mock
 
-from scalecodec.base import ScaleDecoder, ScaleBytes, RuntimeConfiguration
+from scalecodec.base import ScaleDecoder, ScaleBytes, RuntimeConfiguration, RuntimeConfigurationObject, \
+    ScaleBytesStream
 from scalecodec.exceptions import RemainingScaleBytesNotEmptyException
+from scalecodec.type_registry import load_type_registry_preset
 
 
 class TestScaleBytes(unittest.TestCase):
@@ -56,6 +64,87 @@ class TestScaleBytes(unittest.TestCase):
 
         self.assertEqual(scale_total.data, bytearray.fromhex("01020304"))
 
+    def test_iadd_scalebytes_not_in_place(self):
+        scale = ScaleBytes("0x01")
+        scale_total = scale
+
+        scale_total += ScaleBytes("0x02")
+        scale_total += "0x03"
+        scale_total += b"\x04"
+
+        self.assertEqual(scale.data, bytearray.fromhex("01"))
+        self.assertEqual(scale_total.data, bytearray.fromhex("01020304"))
+        self.assertEqual(scale_total.length, 4)
+
+    def test_encoded_data_not_aliased(self):
+        runtime_config = RuntimeConfiguration()
+        for type_string, value, encoded in (
+                ('Vec<u8>', [1, 2], '0x080102'),
+                ('Vec<u16>', [1, 2], '0x0801000200'),
+                ('(u8, u16)', (1, 2), '0x010200'),
+                ('BitVec', '0b101', '0x0c05'),
+                ('BTreeMap<u8, u8>', [(1, 2)], '0x040102'),
+                ('[u16; 2]', [1, 2], '0x01000200')
+        ):
+            with self.subTest(type_string=type_string):
+                obj = runtime_config.create_scale_object(type_string)
+                data = obj.encode(value)
+                data += b'\xff'
+
+                self.assertEqual(obj.data.to_hex(), encoded)
+                self.assertEqual(data.to_hex(), encoded + 'ff')
+
+    def test_iadd_scalebytes_zero_copy(self):
+        scale = ScaleBytes(b"\x01", zero_copy=True)
+        scale_total = scale
+        scale_total += "0x02"
+
+        self.assertIsNot(scale_total, scale)
+        self.assertEqual(scale.data, b"\x01")
+        self.assertEqual(scale_total.data, bytearray.fromhex("0102"))
+
+    def test_add_scalebytes_memoryview(self):
+        scale = ScaleBytes(memoryview(b"\x01\x02"), zero_copy=True)
+        scale_total = scale + ScaleBytes(memoryview(b"\x03"), zero_copy=True)
+        scale += "0x03"
+
+        self.assertEqual(scale_total.data, bytearray.fromhex("010203"))
+        self.assertEqual(scale.data, bytearray.fromhex("010203"))
+
+    def test_encode_large_vec(self):
+        obj = RuntimeConfiguration().create_scale_object('Vec<u16>')
+        data = obj.encode(list(range(1000)))
+        self.assertEqual(data.length, 2002)
+        self.assertEqual(data.data[0:2], bytearray.fromhex("a10f"))
+        self.assertEqual(data.data[-2:], bytearray.fromhex("e703"))
+
+    def test_encode_large_vec_linear(self):
+        runtime_config = RuntimeConfigurationObject()
+        runtime_config.update_type_registry(load_type_registry_preset("legacy"))
+        runtime_config.update_type_registry_types({
+            'VecWithFlag': {'type': 'struct', 'type_mapping': [['items', 'Vec<u32>'], ['flag', 'bool']]}
+        })
+
+        def max_concatenated_length(type_string, value):
+            with mock.patch.object(ScaleBytes, '__add__', autospec=True, side_effect=ScaleBytes.__add__) as add:
+                runtime_config.create_scale_object(type_string).encode(value)
+            return max([len(call.args[0].data) for call in add.call_args_list], default=0)
+
+        # Encoded elements and fields are accumulated in a single buffer; appending them to a ScaleBytes result would
+        # copy all previously encoded data every time
+        for type_string, value in (
+                ('Vec<(u32, u64)>', lambda count: [(1, 2)] * count),
+                ('Vec<AccountData>', lambda count: [
+                    {'free': 1, 'reserved': 2, 'misc_frozen': 3, 'fee_frozen': 4}
+                ] * count),
+                ('(Vec<u32>, u8)', lambda count: ([1] * count, 2)),
+                ('VecWithFlag', lambda count: {'items': [1] * count, 'flag': True})
+        ):
+            with self.subTest(type_string=type_string):
+                self.assertEqual(
+                    max_concatenated_length(type_string, value(10)), max_concatenated_length(type_string, value(1000))
+                )
+
     def test_scale_bytes_compare(self):
         self.assertEqual(ScaleBytes('0x1234'), ScaleBytes('0x1234'))
         self.assertNotEqual(ScaleBytes('0x1234'), ScaleBytes('0x555555'))
@@ -74,8 +163,177 @@ class TestScaleBytes(unittest.TestCase):
         obj.decode()
         self.assertEqual(str(obj), "Test")
 
+    def test_zero_copy_next_bytes(self):
+        scale = ScaleBytes("0x01020304", zero_copy=True)
+        data = scale.get_next_bytes(2)
+        self.assertIsInstance(data, memoryview)
+        self.assertEqual(data, b'\x01\x02')
+        self.assertEqual(scale.get_remaining_bytes(), b'\x03\x04')
+        self.assertEqual(scale.get_remaining_length(), 0)
+
+    def test_zero_copy_bytes_not_copied(self):
+        source = b'\x0c\x01\x02\x03'
+        scale = ScaleBytes(source, zero_copy=True)
+        self.assertIs(scale.data, source)
+
+    def test_zero_copy_decode(self):
+        runtime_config = RuntimeConfiguration()
+        for type_string, data in (
+                ('u32', '0x64000000'),
+                ('Compact<u128>', '0x130000000000000001'),
+                ('H256', '0x' + '01' * 32),
+                ('Bytes', '0x1054657374'),
+                ('Vec<u8>', '0x0cffeedd'),
+                ('[u8; 4]', '0x01020304'),
+                ('(u32, bool, Vec<u16>)', '0x0100000001080100ffff')
+        ):
+            obj = runtime_config.create_scale_object(type_string, ScaleBytes(data))
+            obj_zero_copy = runtime_config.create_scale_object(type_string, ScaleBytes(data, zero_copy=True))
+            self.assertEqual(obj.decode(), obj_zero_copy.decode())
+
+    def test_memoryview_data_format(self):
+        scale = ScaleBytes(memoryview(b'\x01\x02'))
+        self.assertIsInstance(scale.data, bytearray)
+        self.assertEqual(scale.get_next_bytes(2), b'\x01\x02')
+
+    def test_from_mmap(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'data.scale')
+            # Place record after the first allocation granularity boundary at an unaligned offset
+            record_offset = mmap.ALLOCATIONGRANULARITY + 3
+
+            with open(path, 'wb') as fp:
+                fp.write(b'\xff' * record_offset + bytes.fromhex('0c0100020003001234'))
+
+            scale = ScaleBytes.from_mmap(path, offset=record_offset, length=7)
+            self.assertEqual(scale.length, 7)
+
+            obj = RuntimeConfiguration().create_scale_object('Vec<u16>', data=scale)
+            self.assertEqual(obj.decode(), [1, 2, 3])
+
+            scale = ScaleBytes.from_mmap(path, offset=record_offset + 7)
+            self.assertEqual(scale.get_remaining_bytes(), b'\x12\x34')
+
+            scale_total = scale + b'\x56'
+            scale += ScaleBytes('0x56')
+            self.assertEqual(scale_total.data, bytearray.fromhex('123456'))
+            self.assertEqual(scale.data, bytearray.fromhex('123456'))
+
+            self.assertEqual(ScaleBytes.from_mmap(path, offset=record_offset + 9).length, 0)
+            self.assertRaises(ValueError, ScaleBytes.from_mmap, path, record_offset, 10)
+
     def test_type_convert(self):
         self.assertEqual(ScaleDecoder.convert_type("<Balance as HasCompact>::Type"), "Compact<Balance>")
         self.assertEqual(ScaleDecoder.convert_type("<BlockNumber as HasCompact>::Type"), "Compact<BlockNumber>")
         self.assertEqual(ScaleDecoder.convert_type("<Moment as HasCompact>::Type"), "Compact<Moment>")
 
+
+class NonSeekableStream:
+
+    def __init__(self, data: bytes):
+        self.stream = io.BytesIO(data)
+
+    def read(self, size):
+        # Return at most 3 bytes at a time to simulate a socket
+        return self.stream.read(min(size, 3))
+
+
+class TestScaleBytesStream(unittest.TestCase):
+
+    def test_stream_next_bytes(self):
+        scale = ScaleBytesStream(io.BytesIO(b'\x01\x02\x03\x04\x05'), buffer_size=2)
+        self.assertEqual(scale.length, 5)
+        self.assertEqual(scale.get_next_bytes(3), b'\x01\x02\x03')
+        self.assertEqual(scale.offset, 3)
+        self.assertEqual(scale.get_remaining_length(), 2)
+        self.assertEqual(scale.get_remaining_bytes(), b'\x04\x05')
+        self.assertEqual(scale.get_remaining_length(), 0)
+
+    def test_stream_decode(self):
+        data = bytes.fromhex('0c010000000200000003000000080400000005000000')
+        scale = ScaleBytesStream(io.BytesIO(data), buffer_size=4)
+
+        obj = RuntimeConfiguration().create_scale_object('Vec<u32>', data=scale)
+        self.assertEqual(obj.decode(check_remaining=False), [1, 2, 3])
+
+        obj = RuntimeConfiguration().create_scale_object('Vec<u32>', data=scale)
+        self.assertEqual(obj.decode(), [4, 5])
+
+    def test_stream_used_bytes(self):
+        scale = ScaleBytesStream(io.BytesIO(bytes.fromhex('0c010203')), buffer_size=1)
+        obj = RuntimeConfiguration().create_scale_object('Vec<u8>', data=scale)
+        obj.decode()
+        self.assertEqual(obj.get_used_bytes(), bytes.fromhex('0c010203'))
+
+    def test_stream_discard_consumed_bytes(self):
+        scale = ScaleBytesStream(io.BytesIO(bytes(range(10))), buffer_size=1)
+        scale.get_next_bytes(4)
+        scale.discard_consumed_bytes()
+
+        self.assertEqual(len(scale.data), 0)
+        self.assertEqual(scale.get_next_bytes(2), b'\x04\x05')
+        self.assertRaises(ValueError, scale.get_data_range, 0, 4)
+
+        # Seekable streams can be reset after discarding
+        scale.reset()
+        self.assertEqual(scale.get_next_bytes(2), b'\x00\x01')
+
+    def test_stream_starting_at_position(self):
+        stream = io.BytesIO(b'\xff\xff\x2a\x00')
+        stream.seek(2)
+        scale = ScaleBytesStream(stream)
+        obj = RuntimeConfiguration().create_scale_object('u16', data=scale)
+        self.assertEqual(obj.decode(), 42)
+
+    def test_non_seekable_stream(self):
+        data = bytes.fromhex('2a0000002b000000')
+        scale = ScaleBytesStream(NonSeekableStream(data))
+
+        obj = RuntimeConfiguration().create_scale_object('u32', data=scale)
+        self.assertEqual(obj.decode(check_remaining=False), 42)
+        self.assertGreater(scale.get_remaining_length(), 0)
+
+        obj = RuntimeConfiguration().create_scale_object('u32', data=scale)
+        self.assertEqual(obj.decode(), 43)
+        self.assertEqual(scale.length, 8)
+
+        scale.discard_consumed_bytes()
+        self.assertRaises(ValueError, scale.reset)
+
+    def test_socket_stream_not_closed(self):
+        reader, writer = socket.socketpair()
+        try:
+            # Decoding must not read past the decoded value, the writer is still open
+            reader.settimeout(5)
+            writer.sendall(b'\x2a\x00\x00\x00')
+
+            scale = ScaleBytesStream(reader)
+            obj = RuntimeConfiguration().create_scale_object('u32', data=scale)
+            self.assertEqual(obj.decode(), 42)
+            self.assertEqual(scale.length, 4)
+        finally:
+            reader.close()
+            writer.close()
+
+    def test_stream_check_remaining(self):
+        data = bytes.fromhex('2a0000002b000000')
+
+        obj = RuntimeConfiguration().create_scale_object('u32', data=ScaleBytesStream(io.BytesIO(data)))
+        self.assertEqual(obj.decode(), 42)
+
+        scale = ScaleBytesStream(NonSeekableStream(data), check_remaining=True)
+        obj = RuntimeConfiguration().create_scale_object('u32', data=scale)
+        with self.assertRaises(RemainingScaleBytesNotEmptyException):
+            obj.decode()
+
+        obj = RuntimeConfiguration().create_scale_object('u32', data=scale)
+        self.assertEqual(obj.decode(), 43)
+
+    def test_stream_no_more_bytes_available(self):
+        scale = ScaleBytesStream(NonSeekableStream(b'\x01\x02'))
+        obj = RuntimeConfiguration().create_scale_object('u32', data=scale)
+        with self.assertRaises(RemainingScaleBytesNotEmptyException):
+            obj.decode(check_remaining=False)
+
+    def test_unsupported_stream(self):
+        self.assertRaises(ValueError, ScaleBytesStream, b'\x01')
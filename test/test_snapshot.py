@@ -0,0 +1,166 @@
+# Python SCALE Codec Library
+#
+# Copyright 2018-2020 Stichting Polkascan (Polkascan Foundation).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+#  test_snapshot.py
+#
+
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from scalecodec.base import RuntimeConfigurationObject, RuntimeConfigurationPool, ScaleBytes
+from scalecodec.snapshot import MetadataSnapshotCache, SNAPSHOT_FORMAT_VERSION, get_metadata_hash, \
+    load_registry_snapshot
+from scalecodec.type_registry import load_type_registry_file
+
+
+class TestMetadataSnapshotCache(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        module_path = os.path.dirname(__file__)
+        cls.metadata_fixture_dict = load_type_registry_file(
+            os.path.join(module_path, 'fixtures', 'metadata_hex.json')
+        )
+
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.cache = MetadataSnapshotCache(self.cache_dir.name)
+
+    def tearDown(self):
+        self.cache_dir.cleanup()
+
+    def create_runtime_config(self):
+        return RuntimeConfigurationObject(ss58_format=42, shared_presets=('core',))
+
+    def test_snapshot_roundtrip(self):
+        metadata_hex = self.metadata_fixture_dict['V14']
+
+        runtime_config = self.create_runtime_config()
+        metadata_obj = self.cache.add_portable_registry(runtime_config, metadata_hex, 1)
+
+        self.assertIsNotNone(metadata_obj)
+        self.assertEqual({'hits': 0, 'misses': 1}, self.cache.get_cache_info())
+        self.assertTrue(os.path.exists(self.cache.get_snapshot_path(1, get_metadata_hash(metadata_hex))))
+
+        snapshot_runtime_config = self.create_runtime_config()
+        snapshot_cache = MetadataSnapshotCache(self.cache_dir.name)
+
+        self.assertIsNone(snapshot_cache.add_portable_registry(snapshot_runtime_config, ScaleBytes(metadata_hex), 1))
+        self.assertEqual({'hits': 1, 'misses': 0}, snapshot_cache.get_cache_info())
+
+        # Types are only decoded from the metadata on first lookup
+        self.assertNotIn('scale_info::111', snapshot_runtime_config.type_registry['types'])
+
+        for type_string in ['scale_info::0', 'Call', 'Address', 'ExtrinsicSignature', 'sp_runtime::DispatchError']:
+            with self.subTest(type_string=type_string):
+                decoder_class = runtime_config.get_decoder_class(type_string)
+                snapshot_decoder_class = snapshot_runtime_config.get_decoder_class(type_string)
+
+                self.assertEqual(decoder_class.__name__, snapshot_decoder_class.__name__)
+                self.assertEqual(decoder_class.type_mapping, snapshot_decoder_class.type_mapping)
+                self.assertEqual(
+                    getattr(decoder_class.scale_info_type, 'value', None),
+                    getattr(snapshot_decoder_class.scale_info_type, 'value', None)
+                )
+
+        # Utility.batch([System.remark, Balances.transfer])
+        data = "0x0100080001081234060000be5ddb1579b72e84524fc29e78609e3caf42e85aa118ebfe0b0ad404b5bdd25f0c"
+
+        self.assertEqual(
+            runtime_config.create_scale_object('Call', ScaleBytes(data), metadata=metadata_obj).decode(),
+            snapshot_runtime_config.create_scale_object('Call', ScaleBytes(data), metadata=metadata_obj).decode()
+        )
+
+    def test_snapshot_keyed_by_spec_version(self):
+        metadata_hex = self.metadata_fixture_dict['V14']
+
+        self.cache.add_portable_registry(self.create_runtime_config(), metadata_hex, 1)
+        self.cache.add_portable_registry(self.create_runtime_config(), metadata_hex, 2)
+
+        self.assertEqual({'hits': 0, 'misses': 2}, self.cache.get_cache_info())
+
+        with open(self.cache.get_snapshot_path(2, get_metadata_hash(metadata_hex))) as snapshot_file:
+            snapshot = json.load(snapshot_file)
+
+        self.assertEqual(2, snapshot['spec_version'])
+        self.assertEqual(get_metadata_hash(metadata_hex), snapshot['metadata_hash'])
+
+    def test_legacy_metadata(self):
+        metadata_hex = self.metadata_fixture_dict['V13']
+
+        metadata_obj = self.cache.add_portable_registry(self.create_runtime_config(), metadata_hex, 1)
+        legacy_metadata_obj = self.cache.add_portable_registry(self.create_runtime_config(), metadata_hex, 1)
+
+        # Metadata without portable registry is not stored
+        self.assertEqual({'hits': 0, 'misses': 2}, self.cache.get_cache_info())
+        self.assertFalse(os.path.exists(self.cache.get_snapshot_path(1, get_metadata_hash(metadata_hex))))
+        self.assertEqual(metadata_obj.value, legacy_metadata_obj.value)
+
+    def test_invalid_snapshot_replaced(self):
+        metadata_hex = self.metadata_fixture_dict['V14']
+
+        for invalid_snapshot in ['invalid', '[]', '{"format_version": 1}', json.dumps({
+            'format_version': SNAPSHOT_FORMAT_VERSION, 'spec_version': 1, 'metadata_hash': None,
+            'extrinsic_type': 0, 'types': [[0, None, -1]]
+        })]:
+            with self.subTest(invalid_snapshot=invalid_snapshot):
+                with open(self.cache.get_snapshot_path(1, get_metadata_hash(metadata_hex)), 'w') as snapshot_file:
+                    snapshot_file.write(invalid_snapshot)
+
+                with self.assertWarns(UserWarning):
+                    metadata_obj = self.cache.add_portable_registry(self.create_runtime_config(), metadata_hex, 1)
+
+                self.assertIsNotNone(metadata_obj)
+
+                self.assertIsNone(self.cache.add_portable_registry(self.create_runtime_config(), metadata_hex, 1))
+
+    def test_invalid_entry(self):
+        snapshot_file = io.StringIO(json.dumps({
+            'format_version': SNAPSHOT_FORMAT_VERSION, 'spec_version': 1, 'metadata_hash': 'test',
+            'extrinsic_type': 0, 'types': [[0, None, 0], [1, None, 10 ** 9]]
+        }))
+        runtime_config = self.create_runtime_config()
+
+        with self.assertRaises(ValueError):
+            load_registry_snapshot(snapshot_file, runtime_config, self.metadata_fixture_dict['V14'])
+
+        # The type registry is not changed by an invalid snapshot
+        self.assertEqual({}, runtime_config.lazy_scale_info_types)
+
+    def test_runtime_configuration_pool(self):
+        metadata_hex = self.metadata_fixture_dict['V14']
+
+        RuntimeConfigurationPool(snapshot_cache=self.cache).get(1, metadata_hex)
+
+        pool = RuntimeConfigurationPool(snapshot_cache=self.cache, ss58_format=42)
+        runtime_config = pool.get(1, metadata_hex)
+
+        self.assertEqual({'hits': 1, 'misses': 1}, self.cache.get_cache_info())
+        self.assertEqual(
+            '5C62Ck4UrFPiBtoCmeSrgF7x9yv9mn38446dhCpsi2mLHiFT',
+            runtime_config.create_scale_object('MultiAddress', ScaleBytes('0x00' + '01' * 32)).decode()
+        )
+
+        # The metadata is decoded on first access
+        self.assertIsNone(pool.entries[1].decoded_metadata)
+        self.assertEqual(14, pool.get_metadata(1).value_object[1].index)
+
+
+if __name__ == '__main__':
+    unittest.main()
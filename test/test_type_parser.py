@@ -0,0 +1,96 @@
+# Python SCALE Codec Library
+#
+# Copyright 2018-2020 Stichting Polkascan (Polkascan Foundation).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+#  test_type_parser.py
+#
+
+import unittest
+
+from scalecodec.base import RuntimeConfigurationObject, ScaleBytes
+from scalecodec.type_registry import load_type_registry_preset
+from scalecodec.utils.type_parser import parse_type_string, split_type_params
+
+
+class TestTypeParser(unittest.TestCase):
+
+    def test_parse_nested_types(self):
+        expression = parse_type_string('(Vec<(u32, u64)>, BTreeMap<u32, Vec<u8>>)')
+
+        self.assertEqual('tuple', expression.kind)
+        self.assertEqual(['Vec<(u32, u64)>', 'BTreeMap<u32, Vec<u8>>'], [p.type_string for p in expression.params])
+
+        vec_expression = expression.params[0]
+        self.assertEqual('generic', vec_expression.kind)
+        self.assertEqual('Vec', vec_expression.name)
+        self.assertEqual('(u32, u64)', vec_expression.params_string)
+        self.assertEqual(['u32', 'u64'], [p.name for p in vec_expression.params[0].params])
+
+    def test_parse_array(self):
+        expression = parse_type_string('[(u8, u16); 3]')
+
+        self.assertEqual('array', expression.kind)
+        self.assertEqual(3, expression.length)
+        self.assertEqual('(u8, u16)', expression.params[0].type_string)
+
+    def test_parse_qualified_path(self):
+        expression = parse_type_string('Vec<<Lookup as StaticLookup>::Source>')
+
+        self.assertEqual('<Lookup as StaticLookup>::Source', expression.params[0].name)
+
+    def test_parse_cached(self):
+        self.assertIs(parse_type_string('Vec<(u32, u64)>'), parse_type_string('Vec<(u32, u64)>'))
+
+    def test_parse_invalid(self):
+        for type_string in ['', 'Vec<', 'Vec<>', 'u32>', '(u32, u64', '[u8; ]', '[u8, 4]', 'Vec<u8> u16']:
+            with self.subTest(type_string=type_string):
+                with self.assertRaises(ValueError):
+                    parse_type_string(type_string)
+
+    def test_split_type_params(self):
+        self.assertEqual(('u32', 'BTreeMap<u32, Vec<u8>>'), split_type_params('u32, BTreeMap<u32, Vec<u8>>'))
+        self.assertEqual(('(u32, u64)', '10'), split_type_params('(u32, u64), 10'))
+        self.assertEqual(('u8',), split_type_params('u8'))
+
+
+class TestNestedTypeDecoding(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.runtime_config = RuntimeConfigurationObject()
+        cls.runtime_config.update_type_registry(load_type_registry_preset("legacy"))
+
+    def test_nested_tuple(self):
+        decoder_class = self.runtime_config.get_decoder_class('(Vec<(u32, u64)>, BTreeMap<u32, Vec<u16>>)')
+        self.assertEqual(('Vec<(u32, u64)>', 'BTreeMap<u32, Vec<u16>>'), decoder_class.type_mapping)
+
+        value = ([(1, 2)], [(3, [4, 5])])
+        data = self.runtime_config.create_scale_object(decoder_class.__name__).encode(value)
+
+        obj = self.runtime_config.create_scale_object(decoder_class.__name__, data)
+        self.assertEqual(([(1, 2)], [(3, [4, 5])]), obj.decode())
+
+    def test_map_nested_value(self):
+        obj = self.runtime_config.create_scale_object('BTreeMap<u8, (u16, u8)>', ScaleBytes('0x0401020003'))
+        self.assertEqual([(1, (2, 3))], obj.decode())
+
+    def test_bounded_vec_tuple_without_bound(self):
+        obj = self.runtime_config.create_scale_object('BoundedVec<(u8, u16)>', ScaleBytes('0x04010200'))
+        self.assertEqual([(1, 2)], obj.decode())
+
+    def test_array_of_tuples(self):
+        decoder_class = self.runtime_config.get_decoder_class('[(u8, u16); 2]')
+        self.assertEqual(2, decoder_class.element_count)
+        self.assertEqual('(u8, u16)', decoder_class.sub_type)